@@ -31,12 +31,35 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF
 # THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import contextlib
+import math
 import re
+import time
+
+import numpy as np
+
+_number_re = re.compile(r"[-+]?[.]?[\d]+(?:,\d\d\d)*[\.]?\d*(?:[eE][-+]?\d+)?")
+_plain_numbers_re = re.compile(r"[\s\d.eE+\-\[\]]*")
+
+# Number of writes by (device id, attribute name), counted across all objects
+# so values one object cached are dropped when another object writes them
+_attr_writes: dict = {}
 
 
 def get_numbers(s):
-    v = re.findall(r"[-+]?[.]?[\d]+(?:,\d\d\d)*[\.]?\d*(?:[eE][-+]?\d+)?", s)
-    v = [float(i) for i in v]
+    # Most attributes hold a single plain number, which float() parses
+    # directly. Lists and values with units go straight to the pattern.
+    # Underscores, inf and nan are accepted by float() but not by the
+    # pattern, so those take the regular path too
+    if "_" not in s and "[" not in s and " " not in s.strip():
+        try:
+            v = float(s)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(v):
+                return int(v) if v.is_integer() else v
+    v = [float(i) for i in _number_re.findall(s)]
     if len(v) == 1:
         v = v[0]
         if int(v) == v:
@@ -44,7 +67,522 @@ def get_numbers(s):
     return v
 
 
+def get_numbers_array(s, dtype=np.float64):
+    """get_numbers_array: Parse every number in a string, such as a list
+    or range attribute "[a b c]", into one NumPy array
+
+    parameters:
+        s: type=string
+            Attribute value
+        dtype: type=numpy.dtype
+            Data type of the returned array
+
+    returns: type=numpy.ndarray
+        1-D array of the numbers found, empty if there are none
+    """
+    # Numbers separated only by whitespace and brackets are split directly,
+    # anything else goes through the pattern like get_numbers
+    if _plain_numbers_re.fullmatch(s):
+        try:
+            v = [float(i) for i in s.replace("[", " ").replace("]", " ").split()]
+        except ValueError:
+            v = None
+        if v is not None:
+            return np.array(v, dtype=np.float64).astype(dtype, copy=False)
+    v = [float(i) for i in _number_re.findall(s)]
+    return np.array(v, dtype=np.float64).astype(dtype, copy=False)
+
+
 class attribute:
+    _attr_cache_enabled = False
+    _attr_cache_ttl = 1.0
+    _attr_cache_ttls: dict = {}
+    _attr_cache_static = ("scale", "label")
+    _attr_cache_volatile = ("raw", "input", "processed", "direct_reg_access")
+    __attr_cache = None
+    __attr_cache_stats = None
+    _batch_order = [
+        "ensm_mode",
+        "sampling_frequency",
+        "rf_bandwidth",
+        "frequency",
+        "gain_control_mode",
+        "hardwaregain",
+    ]
+    __batch = None
+    __batch_group = None
+    __batch_values = None
+    __batch_known = None
+    __batch_stats = None
+    _snapshot_exclude = ("direct_reg_access",)
+    _restore_exclude = ("rssi", "label", "name", "rx_path_rates", "tx_path_rates")
+    __channel_index = None
+
+    def __device_index(self, dev):
+        """Channels of dev and a (name, output) to channel map, built on the
+        first call for each device
+        """
+        if self.__channel_index is None:
+            self.__channel_index = {}
+        entry = self.__channel_index.get(id(dev))
+        if entry is None or entry[0] is not dev:
+            channels = dev.channels
+            index = {}
+            for chan in channels:
+                index.setdefault((chan.id, chan.output), chan)
+                if chan.name:
+                    index.setdefault((chan.name, chan.output), chan)
+            entry = (dev, channels, index)
+            self.__channel_index[id(dev)] = entry
+        return entry
+
+    def _find_channel(self, dev, name, output=False):
+        """Channel of dev by name or id, like dev.find_channel, but from an
+        index built once per device. Channel objects and their attrs maps
+        are reused between calls
+
+        args:
+            dev: type=iio.Device
+                Device to search
+            name: type=string
+                Channel name or id
+            output: type=bool
+                Search for an output channel
+
+        returns: type=iio.Channel
+            Channel found or None
+        """
+        index = self.__device_index(dev)[2]
+        chan = index.get((name, output))
+        if chan is None:
+            chan = dev.find_channel(name, output)
+            if chan is not None:
+                index[(name, output)] = chan
+        return chan
+
+    def _device_channels(self, dev) -> list:
+        """Channels of dev, listed once per device"""
+        return self.__device_index(dev)[1]
+
+    @property
+    def attr_cache(self) -> bool:
+        """attr_cache: Cache attribute reads. Cached values expire after
+        attr_cache_ttl seconds, except static attributes (names ending in
+        _available, scale and label) which are kept until written. Samples
+        and register reads (raw, input, processed, direct_reg_access) are
+        never cached. Writes from this or another object of the module, such
+        as the channel objects of precision ADCs, drop the cached values of
+        the written attribute only, so values that change as a side effect of
+        other writes are refreshed on expiry. Changing this clears the cache
+        """
+        return self._attr_cache_enabled
+
+    @attr_cache.setter
+    def attr_cache(self, value: bool):
+        self.attr_cache_clear()
+        self._attr_cache_enabled = bool(value)
+
+    @property
+    def attr_cache_ttl(self) -> float:
+        """attr_cache_ttl: Seconds cached values of attributes not listed in
+        attr_cache_ttls are kept. 0 disables caching of these attributes.
+        Changing this clears the cache
+        """
+        return self._attr_cache_ttl
+
+    @attr_cache_ttl.setter
+    def attr_cache_ttl(self, value: float):
+        if value < 0:
+            raise ValueError("attr_cache_ttl must be non-negative")
+        self._attr_cache_ttl = value
+        self.attr_cache_clear()
+
+    @property
+    def attr_cache_ttls(self) -> dict:
+        """attr_cache_ttls: Seconds cached values are kept for specific
+        attribute names. None keeps values until written, 0 disables caching.
+        Changing this clears the cache
+        """
+        return dict(self._attr_cache_ttls)
+
+    @attr_cache_ttls.setter
+    def attr_cache_ttls(self, value: dict):
+        self._attr_cache_ttls = dict(value)
+        self.attr_cache_clear()
+
+    @property
+    def attr_cache_stats(self) -> dict:
+        """attr_cache_stats: Number of cache hits, misses and invalidations
+        since the cache was last cleared, and number of cached entries
+        """
+        stats = dict(self.__attr_cache_stats or {})
+        for name in ["hits", "misses", "invalidations"]:
+            stats.setdefault(name, 0)
+        stats["entries"] = len(self.__attr_cache or {})
+        return stats
+
+    def attr_cache_clear(self):
+        """Drop all cached attribute values and reset the statistics"""
+        self.__attr_cache = {}
+        self.__attr_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def __attr_cache_ttl_for(self, attr_name):
+        if attr_name in self._attr_cache_ttls:
+            return self._attr_cache_ttls[attr_name]
+        if attr_name in self._attr_cache_volatile:
+            return 0
+        if attr_name.endswith("_available") or attr_name in self._attr_cache_static:
+            return None
+        return self._attr_cache_ttl
+
+    def __attr_cache_read(self, key, read, *args):
+        """Value of the attribute identified by key, from the cache when
+        present and not expired, otherwise from read(*args)
+        """
+        if self.__attr_cache is None:
+            self.attr_cache_clear()
+        now = time.monotonic()
+        entry = self.__attr_cache.get(key)
+        if self.__attr_cache_valid(key, entry, now):
+            self.__attr_cache_stats["hits"] += 1
+            return entry[0]
+        self.__attr_cache_stats["misses"] += 1
+        writes = _attr_writes.get((key[0], key[-1]), 0)
+        value = read(*args)
+        ttl = self.__attr_cache_ttl_for(key[-1])
+        if ttl is None or ttl > 0:
+            expiry = None if ttl is None else now + ttl
+            self.__attr_cache[key] = (value, expiry, writes)
+        return value
+
+    @staticmethod
+    def __attr_cache_valid(key, entry, now):
+        """True when a cache entry has not expired and the attribute was not
+        written since it was read, by this or any other object
+        """
+        return (
+            entry is not None
+            and (entry[1] is None or now < entry[1])
+            and entry[2] == _attr_writes.get((key[0], key[-1]), 0)
+        )
+
+    def _attr_write_count(self, dev, attr_name) -> int:
+        """Number of writes of attr_name on any channel of dev or on dev
+        itself, by any object. A changed count means values read before may
+        be stale
+        """
+        return _attr_writes.get((dev.id, attr_name), 0)
+
+    def __attr_cache_invalidate(self, key):
+        if self.__attr_cache and self.__attr_cache.pop(key, None) is not None:
+            self.__attr_cache_stats["invalidations"] += 1
+
+    def __setattr__(self, name, value):
+        if name[0] == "_" or self.__batch is None or self.__batch_group is not None:
+            super().__setattr__(name, value)
+            return
+        # Writes made by one property setter inside a batch form a group,
+        # applied in the order the setter made them
+        group = self.__batch_group = [name, []]
+        try:
+            super().__setattr__(name, value)
+        finally:
+            self.__batch_group = None
+        if group[1]:
+            self.__batch_replace(name, group)
+
+    def __batch_replace(self, name, group):
+        """Drop queued groups of name other than group, superseded by it"""
+        kept = [g for g in self.__batch if g[0] != name or g is group]
+        if len(kept) == len(self.__batch):
+            return
+        for queued in self.__batch:
+            if queued[0] == name and queued is not group:
+                self.__batch_merged += len(queued[1])
+        self.__batch[:] = kept
+        self.__batch_values.clear()
+        for _, writes in kept:
+            self.__batch_values.update((w[0], w[2]) for w in writes)
+
+    def __batch_flush(self):
+        """Apply the queued groups, those with writes of attributes listed in
+        _batch_order first, in that order. Writes within a group keep their
+        order
+        """
+        order = self._batch_order
+        rank = {name: i for i, name in enumerate(order)}
+        groups = [
+            (name, writes)
+            for name, writes in sorted(
+                self.__batch,
+                key=lambda g: min(rank.get(w[0][-1], len(order)) for w in g[1]),
+            )
+        ]
+        del self.__batch[:]
+        self.__batch_values.clear()
+        if self.__batch_group is not None:
+            self.__batch_group[1] = []
+        known, batch = self.__batch_known, self.__batch
+        self.__batch = None
+        try:
+            for _, writes in groups:
+                for key, attrs, value in writes:
+                    if self.__same_value(self.__attr_known(key, known), value):
+                        self.__batch_unchanged += 1
+                        continue
+                    # Later writes may change it as a side effect
+                    known.pop(key, None)
+                    try:
+                        self.__attr_write(key, attrs, value)
+                    except Exception as ex:
+                        if self.__batch_strict:
+                            raise ex
+                        self.__batch_failed.append((key, str(ex)))
+                        continue
+                    self.__batch_written += 1
+        finally:
+            self.__batch = batch
+
+    @contextlib.contextmanager
+    def batch(self, strict=True):
+        """Collect attribute writes and apply them together when the block
+        exits. Reads inside the block return values written in it. The writes
+        made by one property setter are kept together and in their order, and
+        setting the same property again replaces them. Writes of the value
+        the attribute is known to have, from a read in the block or from the
+        attribute cache, are dropped. Setters are applied with those writing
+        attributes listed in _batch_order first, in that order, so for example
+        the sample rate is set before the bandwidth. A setter that reads the
+        hardware after its first write, like the FIR handling of the AD936x
+        sample_rate, applies the writes queued so far at that point. If the
+        block raises an exception the writes still queued are dropped. Nested
+        blocks join the outer one
+
+        args:
+            strict: type=bool
+                Raise on the first failed write. Otherwise the remaining
+                writes are applied and failures are listed in batch_stats
+
+        Example:
+            with sdr.batch():
+                sdr.rx_rf_bandwidth = 4000000
+                sdr.sample_rate = 4000000
+                sdr.rx_lo = 2400000000
+        """
+        if self.__batch is not None:
+            yield self
+            return
+        self.__batch = []
+        self.__batch_values = {}
+        self.__batch_known = {}
+        self.__batch_strict = strict
+        self.__batch_requested = self.__batch_merged = 0
+        self.__batch_unchanged = self.__batch_written = 0
+        self.__batch_failed = []
+        try:
+            yield self
+            self.__batch_flush()
+        finally:
+            self.__batch = self.__batch_values = self.__batch_known = None
+            self.__batch_stats = {
+                "requested": self.__batch_requested,
+                "merged": self.__batch_merged,
+                "unchanged": self.__batch_unchanged,
+                "written": self.__batch_written,
+                "failed": self.__batch_failed,
+            }
+
+    @property
+    def batch_stats(self) -> dict:
+        """batch_stats: Number of writes requested, merged with a later write
+        of the same attribute, dropped as unchanged and written by the last
+        completed batch, and the writes that failed when not strict
+        """
+        return dict(self.__batch_stats or {})
+
+    def __snapshot_devices(self) -> dict:
+        devs = {}
+        for name in ["_ctrl", "_rxadc", "_txdac"]:
+            dev = getattr(self, name, None)
+            if hasattr(dev, "attrs") and hasattr(dev, "channels"):
+                devs.setdefault(dev.name or dev.id, dev)
+        return devs
+
+    def snapshot(self, strict=False) -> dict:
+        """Read every readable device, channel and debug attribute of the
+        control, receive and transmit devices. direct_reg_access and the
+        attributes in _snapshot_exclude are left out
+
+        args:
+            strict: type=bool
+                Raise when an attribute cannot be read instead of leaving it
+                out
+
+        returns: type=dict
+            Attribute strings by device name, as
+            {device: {"attrs": {}, "debug_attrs": {}, "channels":
+            {"<channel>:input" or "<channel>:output": {}}}}. The result can
+            be serialized with json
+        """
+
+        def read(attrs):
+            values = {}
+            for name, attr in attrs.items():
+                if name in self._snapshot_exclude:
+                    continue
+                try:
+                    values[name] = attr.value
+                except Exception:
+                    if strict:
+                        raise
+            return values
+
+        snap = {}
+        for name, dev in self.__snapshot_devices().items():
+            channels = {}
+            for chan in self._device_channels(dev):
+                key = chan.id + (":output" if chan.output else ":input")
+                channels[key] = read(chan.attrs)
+            snap[name] = {
+                "attrs": read(dev.attrs),
+                "debug_attrs": read(dev.debug_attrs),
+                "channels": channels,
+            }
+        return snap
+
+    def restore(self, snapshot: dict, strict=False, attrs=None, debug=False) -> dict:
+        """Write back attributes from a snapshot that differ from the current
+        state. Current values are read with snapshot() and only differing
+        attributes are written, in one batch and so in _batch_order.
+        Attributes that cannot or should not be written are skipped: those
+        in _attr_cache_volatile and _restore_exclude and those ending with
+        _available
+
+        args:
+            snapshot: type=dict
+                Snapshot as returned by snapshot()
+            strict: type=bool
+                Raise on unknown devices and on the first failed read or
+                write. Otherwise these are skipped, and failed writes are
+                listed in batch_stats
+            attrs: type=list
+                Names of the attributes to restore. When set, only these are
+                written and the exclusions above do not apply
+            debug: type=bool
+                Also restore debug attributes
+
+        returns: type=dict
+            batch_stats of the writes
+        """
+
+        def restorable(name):
+            if attrs is not None:
+                return name in attrs
+            return not (
+                name in self._attr_cache_volatile
+                or name in self._restore_exclude
+                or name.endswith("_available")
+            )
+
+        def changed(saved, now):
+            for name, value in saved.items():
+                if restorable(name) and not self.__same_value(now.get(name), value):
+                    yield name, value
+
+        devs = self.__snapshot_devices()
+        current = self.snapshot(strict)
+        with self.batch(strict):
+            for name, saved in snapshot.items():
+                if name not in devs:
+                    if strict:
+                        raise Exception("No device found with name: " + name)
+                    continue
+                dev, now = devs[name], current[name]
+                for attr, value in changed(saved.get("attrs", {}), now["attrs"]):
+                    self._set_iio_dev_attr_str(attr, value, dev)
+                if debug:
+                    for attr, value in changed(
+                        saved.get("debug_attrs", {}), now["debug_attrs"]
+                    ):
+                        self._set_iio_debug_attr_str(attr, value, dev)
+                for key, values in saved.get("channels", {}).items():
+                    if key not in now["channels"]:
+                        if strict:
+                            raise Exception("No channel found with name: " + key)
+                        continue
+                    chan, direction = key.rsplit(":", 1)
+                    for attr, value in changed(values, now["channels"][key]):
+                        self._set_iio_attr(
+                            chan, attr, direction == "output", value, dev
+                        )
+        return self.batch_stats
+
+    def __attr_known(self, key, known):
+        """Last known value of an attribute without reading the hardware"""
+        if key in known:
+            return known[key]
+        entry = (self.__attr_cache or {}).get(key)
+        if self.__attr_cache_valid(key, entry, time.monotonic()):
+            return entry[0]
+        return None
+
+    @staticmethod
+    def __same_value(known, value):
+        """True when a known attribute string and a value to write are the
+        same, treating e.g. "1000" and "1000.0" as equal
+        """
+        if known is None:
+            return False
+        known, value = known.strip(), value.strip()
+        if known == value:
+            return True
+        known_n, value_n = get_numbers(known), get_numbers(value)
+        return (
+            known_n != []
+            and known_n == value_n
+            and _number_re.sub("", known) == _number_re.sub("", value)
+        )
+
+    def __attr_read(self, key, read, *args):
+        """Read an attribute through the open batch and the cache"""
+        if self.__batch is not None:
+            if key in self.__batch_values:
+                return self.__batch_values[key]
+            group = self.__batch_group
+            if group is not None and group[1]:
+                # The setter may depend on the writes it queued
+                self.__batch_flush()
+        if self._attr_cache_enabled:
+            value = self.__attr_cache_read(key, read, *args)
+        else:
+            value = read(*args)
+        if self.__batch is not None:
+            self.__batch_known[key] = value
+        return value
+
+    def __attr_write(self, key, attrs, value):
+        """Write attrs[name] where name is the last element of key, or queue
+        the write while a batch is open
+        """
+        value = str(value)
+        if self.__batch is not None:
+            self.__batch_requested += 1
+            self.__batch_values[key] = value
+            group = self.__batch_group
+            if group is None:
+                group = [key, []]
+                self.__batch_replace(key, group)
+            if not group[1]:
+                self.__batch.append(group)
+            group[1].append((key, attrs, value))
+            return
+        try:
+            attrs[key[-1]].value = value
+        finally:
+            self.__attr_cache_invalidate(key)
+            count = (key[0], key[-1])
+            _attr_writes[count] = _attr_writes.get(count, 0) + 1
+
     def _get_iio_attr_str_multi_dev(self, channel_names, attr_name, output, ctrls):
         """ Get the same channel attribute across multiple devices
             which are assumed to be strings
@@ -90,14 +628,12 @@ class attribute:
 
     def _set_iio_attr(self, channel_name, attr_name, output, value, _ctrl=None):
         """ Set channel attribute """
-        if _ctrl:
-            channel = _ctrl.find_channel(channel_name, output)
-        else:
-            channel = self._ctrl.find_channel(channel_name, output)
-        try:
-            channel.attrs[attr_name].value = str(value)
-        except Exception as ex:
-            raise ex
+        _ctrl = _ctrl or self._ctrl
+        channel = self.__channel(_ctrl, channel_name, output)
+        # Keyed by channel id so names and ids of a channel share entries
+        self.__attr_write(
+            (_ctrl.id, channel.id, output, attr_name), channel.attrs, value
+        )
 
     def _set_iio_attr_float(self, channel_name, attr_name, output, value, _ctrl=None):
         """ Set channel attribute with float """
@@ -142,13 +678,20 @@ class attribute:
 
     def _get_iio_attr_str(self, channel_name, attr_name, output, _ctrl=None):
         """ Get channel attribute as string """
-        if _ctrl:
-            channel = _ctrl.find_channel(channel_name, output)
-        else:
-            channel = self._ctrl.find_channel(channel_name, output)
+        _ctrl = _ctrl or self._ctrl
+        channel = self.__channel(_ctrl, channel_name, output)
+        if self._attr_cache_enabled or self.__batch is not None:
+            return self.__attr_read(
+                (_ctrl.id, channel.id, output, attr_name),
+                lambda: channel.attrs[attr_name].value,
+            )
+        return channel.attrs[attr_name].value
+
+    def __channel(self, _ctrl, channel_name, output):
+        channel = self._find_channel(_ctrl, channel_name, output)
         if not channel:
             raise Exception("No channel found with name: " + channel_name)
-        return channel.attrs[attr_name].value
+        return channel
 
     def _get_iio_attr(self, channel_name, attr_name, output, _ctrl=None):
         """ Get channel attribute as number """
@@ -156,6 +699,12 @@ class attribute:
             self._get_iio_attr_str(channel_name, attr_name, output, _ctrl)
         )
 
+    def _get_iio_attr_array(self, channel_name, attr_name, output, _ctrl=None):
+        """ Get channel attribute as NumPy array of numbers """
+        return get_numbers_array(
+            self._get_iio_attr_str(channel_name, attr_name, output, _ctrl)
+        )
+
     def _get_iio_attr_vec(self, channel_names, attr_name, output, _ctrl=None):
         """ Get channel attributes as list of numbers """
         vals = []
@@ -174,49 +723,47 @@ class attribute:
 
     def _set_iio_dev_attr_str(self, attr_name, value, _ctrl=None):
         """ Set device attribute with string """
-        try:
-            if _ctrl:
-                _ctrl.attrs[attr_name].value = str(value)
-            else:
-                self._ctrl.attrs[attr_name].value = str(value)
-        except Exception as ex:
-            raise ex
+        _ctrl = _ctrl or self._ctrl
+        self.__attr_write((_ctrl.id, None, None, attr_name), _ctrl.attrs, value)
 
     def _get_iio_dev_attr_str(self, attr_name, _ctrl=None):
         """ Get device attribute as string """
-        if _ctrl:
-            return _ctrl.attrs[attr_name].value
-        else:
-            return self._ctrl.attrs[attr_name].value
+        _ctrl = _ctrl or self._ctrl
+        if self._attr_cache_enabled or self.__batch is not None:
+            return self.__attr_read(
+                (_ctrl.id, None, None, attr_name), lambda: _ctrl.attrs[attr_name].value,
+            )
+        return _ctrl.attrs[attr_name].value
 
     def _set_iio_dev_attr(self, attr_name, value, _ctrl=None):
         """ Set device attribute """
         _dev = _ctrl or self._ctrl
-        try:
-            _dev.attrs[attr_name].value = str(value)
-        except Exception as ex:
-            raise ex
+        self.__attr_write((_dev.id, None, None, attr_name), _dev.attrs, value)
 
     def _get_iio_dev_attr(self, attr_name, _ctrl=None):
         """ Set device attribute as number """
         return get_numbers(self._get_iio_dev_attr_str(attr_name, _ctrl))
 
+    def _get_iio_dev_attr_array(self, attr_name, _ctrl=None):
+        """ Get device attribute as NumPy array of numbers """
+        return get_numbers_array(self._get_iio_dev_attr_str(attr_name, _ctrl))
+
     def _set_iio_debug_attr_str(self, attr_name, value, _ctrl=None):
         """ Set debug attribute with string """
-        try:
-            if _ctrl:
-                _ctrl.debug_attrs[attr_name].value = str(value)
-            else:
-                self._ctrl.debug_attrs[attr_name].value = str(value)
-        except Exception as ex:
-            raise ex
+        _ctrl = _ctrl or self._ctrl
+        self.__attr_write(
+            (_ctrl.id, None, "debug", attr_name), _ctrl.debug_attrs, value
+        )
 
     def _get_iio_debug_attr_str(self, attr_name, _ctrl=None):
         """ Get debug attribute as string """
-        if _ctrl:
-            return _ctrl.debug_attrs[attr_name].value
-        else:
-            return self._ctrl.debug_attrs[attr_name].value
+        _ctrl = _ctrl or self._ctrl
+        if self._attr_cache_enabled or self.__batch is not None:
+            return self.__attr_read(
+                (_ctrl.id, None, "debug", attr_name),
+                lambda: _ctrl.debug_attrs[attr_name].value,
+            )
+        return _ctrl.debug_attrs[attr_name].value
 
     def _get_iio_debug_attr(self, attr_name, _ctrl=None):
         """ Set debug attribute as number """
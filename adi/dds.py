@@ -45,11 +45,11 @@ class dds(attribute):
 
     def __update_dds(self, attr, value):
         split_cores_indx = 0
-        for indx in range(len(self._txdac.channels)):
-            chan = self._txdac.find_channel("altvoltage" + str(indx), True)
+        for indx in range(len(self._device_channels(self._txdac))):
+            chan = self._find_channel(self._txdac, "altvoltage" + str(indx), True)
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
-                    "altvoltage" + str(split_cores_indx), True
+                chan = self._find_channel(
+                    self._txdac_chip_b, "altvoltage" + str(split_cores_indx), True
                 )
                 split_cores_indx = split_cores_indx + 1
             if not chan:
@@ -65,11 +65,11 @@ class dds(attribute):
     def _read_dds(self, attr):
         values = []
         split_cores_indx = 0
-        for indx in range(len(self._txdac.channels)):
-            chan = self._txdac.find_channel("altvoltage" + str(indx), True)
+        for indx in range(len(self._device_channels(self._txdac))):
+            chan = self._find_channel(self._txdac, "altvoltage" + str(indx), True)
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
-                    "altvoltage" + str(split_cores_indx), True
+                chan = self._find_channel(
+                    self._txdac_chip_b, "altvoltage" + str(split_cores_indx), True
                 )
                 split_cores_indx = split_cores_indx + 1
             if not chan:
@@ -159,11 +159,12 @@ class dds(attribute):
             else:
                 A = "I"
                 B = "Q"
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + A + "_F1", True
+            chan = self._find_channel(
+                self._txdac, "TX" + str(channel + 1) + "_" + A + "_F1", True
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
+                    self._txdac_chip_b,
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
@@ -174,11 +175,12 @@ class dds(attribute):
             chan.attrs["frequency"].value = str(frequency)
             chan.attrs["phase"].value = str(90000)
             chan.attrs["scale"].value = str(scale)
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + B + "_F1", True
+            chan = self._find_channel(
+                self._txdac, "TX" + str(channel + 1) + "_" + B + "_F1", True
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
+                    self._txdac_chip_b,
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
@@ -192,7 +194,7 @@ class dds(attribute):
         else:
             if frequency < 0:
                 Exception("Frequency must be positive")
-            chan = self._txdac.find_channel(str(channel + 1) + "A", True)
+            chan = self._find_channel(self._txdac, str(channel + 1) + "A", True)
             chan.attrs["frequency"].value = str(frequency)
             chan.attrs["phase"].value = str(0)
             chan.attrs["scale"].value = str(scale)
@@ -241,11 +243,12 @@ class dds(attribute):
             else:
                 A = "I"
                 B = "Q"
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + A + "_F1", True
+            chan = self._find_channel(
+                self._txdac, "TX" + str(channel + 1) + "_" + A + "_F1", True
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
+                    self._txdac_chip_b,
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
@@ -256,11 +259,12 @@ class dds(attribute):
             chan.attrs["frequency"].value = str(frequency1)
             chan.attrs["phase"].value = str(90000)
             chan.attrs["scale"].value = str(scale1)
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + B + "_F1", True
+            chan = self._find_channel(
+                self._txdac, "TX" + str(channel + 1) + "_" + B + "_F1", True
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
+                    self._txdac_chip_b,
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
@@ -279,11 +283,12 @@ class dds(attribute):
             else:
                 A = "I"
                 B = "Q"
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + A + "_F2", True
+            chan = self._find_channel(
+                self._txdac, "TX" + str(channel + 1) + "_" + A + "_F2", True
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
+                    self._txdac_chip_b,
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
@@ -294,11 +299,12 @@ class dds(attribute):
             chan.attrs["frequency"].value = str(frequency2)
             chan.attrs["phase"].value = str(90000)
             chan.attrs["scale"].value = str(scale2)
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + B + "_F2", True
+            chan = self._find_channel(
+                self._txdac, "TX" + str(channel + 1) + "_" + B + "_F2", True
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
+                    self._txdac_chip_b,
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
@@ -314,11 +320,11 @@ class dds(attribute):
                 Exception("Frequency must be positive")
             if frequency2 < 0:
                 Exception("Frequency must be positive")
-            chan = self._txdac.find_channel(str(channel + 1) + "A", True)
+            chan = self._find_channel(self._txdac, str(channel + 1) + "A", True)
             chan.attrs["frequency"].value = str(frequency1)
             chan.attrs["phase"].value = str(0)
             chan.attrs["scale"].value = str(scale1)
-            chan = self._txdac.find_channel(str(channel + 1) + "B", True)
+            chan = self._find_channel(self._txdac, str(channel + 1) + "B", True)
             chan.attrs["frequency"].value = str(frequency2)
             chan.attrs["phase"].value = str(0)
             chan.attrs["scale"].value = str(scale2)
@@ -0,0 +1,194 @@
+# Copyright (C) 2026 Analog Devices, Inc.
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#     - Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#     - Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in
+#       the documentation and/or other materials provided with the
+#       distribution.
+#     - Neither the name of Analog Devices, Inc. nor the names of its
+#       contributors may be used to endorse or promote products derived
+#       from this software without specific prior written permission.
+#     - The use of this software may or may not infringe the patent rights
+#       of one or more patent holders.  This license does not release you
+#       from the requirement that you obtain separate licenses from these
+#       patent holders to use this software.
+#     - Use of the software either in source or binary form, must be run
+#       on or directly connected to an Analog Devices Inc. component.
+#
+# THIS SOFTWARE IS PROVIDED BY ANALOG DEVICES "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, NON-INFRINGEMENT, MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED.
+#
+# IN NO EVENT SHALL ANALOG DEVICES BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, INTELLECTUAL PROPERTY
+# RIGHTS, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF
+# THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import collections
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from adi.stream import capture_worker
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python 3.7
+    shared_memory = None
+
+# Rings attached by this process, by shared memory name
+_attached = {}
+
+
+def _process_block(name, shape, dtype, slot, func, args):
+    """Run func on one block of a shared ring inside a pool process"""
+    if name not in _attached:
+        # Rings of stopped workers are not used again. Their array views are
+        # released first, as close() fails while the buffer is exported
+        while _attached:
+            shm = _attached.popitem()[1][0]
+            shm.close()
+        shm = shared_memory.SharedMemory(name=name)
+        _attached[name] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+    return func(_attached[name][1][slot], *args)
+
+
+class process_worker(capture_worker):
+    """Capture RX buffers into shared memory and process them on a pool of
+    processes
+
+    Blocks are captured as by capture_worker, but the ring is placed in a
+    multiprocessing.shared_memory segment. Each completed block is handed to
+    func in a pool process as a numpy view of the shared block, so samples
+    are never pickled. Only the return values of func are sent back, and
+    results() yields them in capture order. A block returns to the ring once
+    its result has been yielded. Requires Python 3.8 or newer.
+
+    parameters:
+        dev: type=adi.rx_tx.rx
+            Device to capture from. rx_enabled_channels and rx_buffer_size
+            must be set before starting and not changed while running
+        func: type=callable
+            Function called as func(block, *args) in a pool process. It must
+            be picklable, e.g. defined at module level, and must not keep
+            references to block after returning
+        args: type=tuple
+            Extra arguments passed to func
+        n_blocks: type=int
+            Number of blocks in the ring
+        processes: type=int
+            Number of pool processes. Defaults to the number of CPUs
+        max_in_flight: type=int
+            Most blocks processed at the same time. Defaults to twice the
+            number of processes, bounded by n_blocks
+        kwargs:
+            Other parameters of capture_worker
+    """
+
+    def __init__(
+        self,
+        dev,
+        func,
+        args=(),
+        n_blocks=16,
+        processes=None,
+        max_in_flight=None,
+        **kwargs,
+    ):
+        if shared_memory is None:
+            raise Exception("process_worker requires Python 3.8 or newer")
+        super().__init__(dev, n_blocks=n_blocks, **kwargs)
+        self._func = func
+        self._args = tuple(args)
+        self._processes = processes or os.cpu_count() or 1
+        if max_in_flight is None:
+            max_in_flight = 2 * self._processes
+        self._max_in_flight = max(1, min(max_in_flight, n_blocks))
+        self._shm = None
+        self._pool = None
+
+    def __iter__(self):
+        return self.results()
+
+    def _new_ring(self, shape: tuple, dtype) -> np.ndarray:
+        nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        return np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+
+    def start(self):
+        """Allocate the shared ring, start the pool and the capture thread"""
+        if self._running:
+            return
+        self._release_ring()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._processes)
+        super().start()
+
+    def stop(self):
+        """Stop capturing, shut down the pool and free the shared ring.
+        Blocks not yet processed are discarded
+        """
+        super().stop()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._release_ring()
+
+    def _release_ring(self):
+        # The ring array must be gone before the segment can be closed
+        self._ring = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def get(self, timeout=None):
+        raise Exception("Blocks of process_worker are consumed through results()")
+
+    def results(self):
+        """Process captured blocks and yield the results of func in capture
+        order. Stops when capturing has stopped, e.g. after max_refills, and
+        all captured blocks are processed
+
+        yields:
+            Return value of func for each block
+        """
+        if not self._running and self._ring is None:
+            self.start()
+        futures = collections.deque()
+        taken = self._tail
+        shape, dtype = self._ring.shape, self._ring.dtype
+        while True:
+            self._ready.clear()
+            while taken < self._head and len(futures) < self._max_in_flight:
+                future = self._pool.submit(
+                    _process_block,
+                    self._shm.name,
+                    shape,
+                    dtype,
+                    taken % self._n_blocks,
+                    self._func,
+                    self._args,
+                )
+                future.add_done_callback(lambda f: self._ready.set())
+                futures.append(future)
+                taken += 1
+            if futures and futures[0].done():
+                result = futures.popleft().result()
+                # Free the slot before handing out the result
+                self._tail += 1
+                yield result
+                continue
+            if not futures and taken == self._head:
+                if self._error:
+                    raise self._error
+                if not self._running:
+                    return
+            self._ready.wait()
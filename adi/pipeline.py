@@ -0,0 +1,282 @@
+# Copyright (C) 2026 Analog Devices, Inc.
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#     - Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#     - Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in
+#       the documentation and/or other materials provided with the
+#       distribution.
+#     - Neither the name of Analog Devices, Inc. nor the names of its
+#       contributors may be used to endorse or promote products derived
+#       from this software without specific prior written permission.
+#     - The use of this software may or may not infringe the patent rights
+#       of one or more patent holders.  This license does not release you
+#       from the requirement that you obtain separate licenses from these
+#       patent holders to use this software.
+#     - Use of the software either in source or binary form, must be run
+#       on or directly connected to an Analog Devices Inc. component.
+#
+# THIS SOFTWARE IS PROVIDED BY ANALOG DEVICES "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, NON-INFRINGEMENT, MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED.
+#
+# IN NO EVENT SHALL ANALOG DEVICES BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, INTELLECTUAL PROPERTY
+# RIGHTS, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF
+# THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from abc import ABCMeta, abstractmethod
+from typing import List, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from adi.spectrum import get_window
+
+
+class stage(metaclass=ABCMeta):
+    """Base class of pipeline stages
+
+    A stage processes the last axis of an array holding one row of samples per
+    channel and keeps whatever state it needs between consecutive buffers.
+    State is created on the first call and cleared with reset().
+    """
+
+    def reset(self):
+        """Clear the state kept between buffers"""
+
+    @abstractmethod
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Process one buffer, continuing from the state left by the previous
+        one
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        return self.process(x)
+
+
+class dc_remove(stage):
+    """Remove the DC offset of each channel
+
+    The offset is tracked as an exponential average of the mean of each
+    buffer, so a single subtraction is done per buffer.
+
+    parameters:
+        alpha: type=float
+            Weight of the previous estimate, between 0 and 1. 0 removes the
+            mean of each buffer
+    """
+
+    def __init__(self, alpha=0.9):
+        if not 0 <= alpha < 1:
+            raise ValueError("alpha must be in [0, 1)")
+        self.alpha = alpha
+        self.reset()
+
+    def reset(self):
+        self._mean = None
+
+    def process(self, x):
+        mean = x.mean(axis=-1, keepdims=True)
+        if self._mean is None:
+            self._mean = mean
+        else:
+            self._mean = self.alpha * self._mean + (1 - self.alpha) * mean
+        return x - self._mean
+
+
+class nco(stage):
+    """Mix samples with a complex exponential to shift them in frequency
+
+    The phase continues across buffers. The rotator for each buffer length is
+    computed once and reused.
+
+    parameters:
+        frequency: type=float
+            Frequency shift in Hz. Negative values shift down
+        sample_rate: type=float
+            Sample rate of the input in samples per second
+        dtype: type=numpy.dtype
+            Complex data type of the output
+    """
+
+    def __init__(self, frequency, sample_rate, dtype=np.complex128):
+        self.frequency = frequency
+        self.sample_rate = sample_rate
+        self.dtype = np.dtype(dtype)
+        self.reset()
+
+    def reset(self):
+        self._phase = 0.0
+        self._rotator = None
+
+    def process(self, x):
+        n = x.shape[-1]
+        step = 2 * np.pi * self.frequency / self.sample_rate
+        if self._rotator is None or len(self._rotator) != n:
+            self._rotator = np.exp(1j * step * np.arange(n)).astype(self.dtype)
+        y = x * (self._rotator * np.exp(1j * self._phase)).astype(self.dtype)
+        self._phase = (self._phase + step * n) % (2 * np.pi)
+        return y
+
+
+class fir(stage):
+    """FIR filter with optional decimation
+
+    Samples from the end of each buffer are kept as history for the next one,
+    so the output is the same as filtering one long continuous signal. When
+    decimating, only every decimation-th output is computed, which is the
+    polyphase form of the filter.
+
+    parameters:
+        taps: type=numpy.array
+            Filter coefficients
+        decimation: type=int
+            Decimation factor applied after filtering
+    """
+
+    def __init__(self, taps, decimation=1):
+        taps = np.asarray(taps)
+        if taps.ndim != 1 or len(taps) == 0:
+            raise ValueError("taps must be a non-empty 1-D array")
+        if decimation < 1:
+            raise ValueError("decimation must be at least 1")
+        self.taps = taps
+        self.decimation = int(decimation)
+        self._reversed = np.ascontiguousarray(taps[::-1])
+        self.reset()
+
+    def reset(self):
+        self._history = None
+
+    def process(self, x):
+        n_taps = len(self.taps)
+        if self._history is None:
+            self._history = np.zeros(x.shape[:-1] + (n_taps - 1,), dtype=x.dtype)
+        ext = np.concatenate((self._history, x), axis=-1)
+        n_out = max((ext.shape[-1] - n_taps) // self.decimation + 1, 0)
+        # Every row of windows holds the inputs of one output sample
+        windows = as_strided(
+            ext,
+            shape=ext.shape[:-1] + (n_out, n_taps),
+            strides=ext.strides[:-1]
+            + (ext.strides[-1] * self.decimation, ext.strides[-1]),
+            writeable=False,
+        )
+        y = windows @ self._reversed
+        self._history = ext[..., n_out * self.decimation :].copy()
+        return y
+
+
+class decimator(fir):
+    """Low pass filter and decimate by an integer factor
+
+    A windowed sinc low pass filter with a cutoff at the new Nyquist rate is
+    designed when no taps are given.
+
+    parameters:
+        factor: type=int
+            Decimation factor
+        taps: type=numpy.array
+            Filter coefficients. Designed from factor when None
+        taps_per_phase: type=int
+            Filter length per polyphase branch of the designed filter
+    """
+
+    def __init__(self, factor, taps=None, taps_per_phase=16):
+        if taps is None:
+            n = factor * taps_per_phase
+            t = np.arange(n) - (n - 1) / 2
+            taps = np.sinc(t / factor) / factor * np.hamming(n)
+        super().__init__(taps, factor)
+
+
+class window_fft(stage):
+    """Split samples into frames, window and FFT them
+
+    Samples that do not fill a whole frame are kept for the next buffer. The
+    window is computed once and normalized to unity gain, so a full scale tone
+    has a magnitude of its amplitude.
+
+    parameters:
+        size: type=int
+            Number of samples per FFT frame
+        window: type=string
+            Window function: hann, hamming, blackman, bartlett or rect
+        shift: type=bool
+            Move the zero frequency bin to the center of each frame
+
+    Output has an extra axis of frames before the bins axis.
+    """
+
+    def __init__(self, size, window="hann", shift=True):
+        self.size = size
+        self.shift = shift
+        w = get_window(window, size)
+        self.window = w / w.sum()
+        self.reset()
+
+    def reset(self):
+        self._leftover = None
+
+    def process(self, x):
+        if self._leftover is not None:
+            x = np.concatenate((self._leftover, x), axis=-1)
+        n_frames = x.shape[-1] // self.size
+        used = n_frames * self.size
+        self._leftover = x[..., used:].copy()
+        frames = x[..., :used].reshape(x.shape[:-1] + (n_frames, self.size))
+        y = np.fft.fft(frames * self.window, axis=-1)
+        return np.fft.fftshift(y, axes=-1) if self.shift else y
+
+
+class pipeline:
+    """Chain of stages applied to each received buffer
+
+    Input can be a single array or a list of arrays, one per channel, as
+    returned by rx(). Lists are stacked so every stage runs once over all
+    channels, and the output is split back into a list.
+
+    parameters:
+        stages: type=adi.pipeline.stage
+            Stages in the order they are applied
+    """
+
+    def __init__(self, *stages: stage):
+        self.stages = list(stages)
+
+    def append(self, s: stage):
+        """Add a stage at the end of the pipeline"""
+        self.stages.append(s)
+
+    def reset(self):
+        """Clear the state of all stages, e.g. after a gap in the data"""
+        for s in self.stages:
+            s.reset()
+
+    def process(
+        self, data: Union[np.ndarray, List[np.ndarray]]
+    ) -> Union[np.ndarray, List[np.ndarray]]:
+        """Run data through all stages
+
+        args:
+            data: type=numpy.array or list of numpy.array
+                Samples of one buffer
+
+        returns: type=numpy.array or list of numpy.array
+            Processed data, as a list when a list was given
+        """
+        is_list = isinstance(data, list)
+        x = np.stack(data) if is_list else data
+        for s in self.stages:
+            x = s.process(x)
+        return list(x) if is_list else x
+
+    def __call__(self, data):
+        return self.process(data)
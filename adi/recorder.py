@@ -0,0 +1,285 @@
+# Copyright (C) 2026 Analog Devices, Inc.
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#     - Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#     - Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in
+#       the documentation and/or other materials provided with the
+#       distribution.
+#     - Neither the name of Analog Devices, Inc. nor the names of its
+#       contributors may be used to endorse or promote products derived
+#       from this software without specific prior written permission.
+#     - The use of this software may or may not infringe the patent rights
+#       of one or more patent holders.  This license does not release you
+#       from the requirement that you obtain separate licenses from these
+#       patent holders to use this software.
+#     - Use of the software either in source or binary form, must be run
+#       on or directly connected to an Analog Devices Inc. component.
+#
+# THIS SOFTWARE IS PROVIDED BY ANALOG DEVICES "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, NON-INFRINGEMENT, MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED.
+#
+# IN NO EVENT SHALL ANALOG DEVICES BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, INTELLECTUAL PROPERTY
+# RIGHTS, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF
+# THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import datetime
+import json
+import os
+import threading
+
+import numpy as np
+from adi.stream import capture_worker
+
+
+class recorder:
+    """Record RX buffers to disk with bounded memory
+
+    Buffers are captured by a capture_worker in raw mode and written by a
+    separate writer thread, so memory use is limited to the ring of the
+    worker no matter how long the recording runs. Data is stored exactly as
+    found in the hardware buffer: samples of all enabled channels
+    interleaved, with I before Q for complex data devices. A SigMF metadata
+    file describing the recording is written next to the data when it stops.
+
+    parameters:
+        dev: type=adi.rx_tx.rx
+            Device to record from. rx_enabled_channels and rx_buffer_size
+            must be set before starting and not changed while recording
+        path: type=string
+            Path of the data file. The metadata is written to the same path
+            with the extension replaced by .sigmf-meta
+        n_blocks: type=int
+            Number of buffers the capture ring can hold while the writer
+            catches up
+        max_buffers: type=int
+            Stop after this many buffers are written. None records until
+            stopped
+        mode: type=string
+            How data is written. Options are:
+            raw: Buffers are appended to the file with write calls
+            memmap: The file is preallocated for max_buffers and mapped with
+            numpy.memmap, buffers are copied into the mapping
+        metadata: type=bool
+            Write the SigMF metadata file
+        check_overflow: type=bool
+            Count DMA overflows while recording. Only enable this for devices
+            whose RX data is moved by an AXI DMAC
+    """
+
+    _attrs_sample_rate = ["sample_rate", "rx_sample_rate", "rx0_sample_rate"]
+    _attrs_frequency = ["rx_lo", "rx0_lo"]
+    _attrs_gain = ["rx_hardwaregain_chan0", "rx_hardwaregain"]
+
+    def __init__(
+        self,
+        dev,
+        path,
+        n_blocks=16,
+        max_buffers=None,
+        mode="raw",
+        metadata=True,
+        check_overflow=False,
+    ):
+        if mode not in ["raw", "memmap"]:
+            raise ValueError(f"Invalid mode: {mode}. Must be raw or memmap")
+        if mode == "memmap" and not max_buffers:
+            raise ValueError("max_buffers must be set for memmap mode")
+        self._dev = dev
+        self._path = path
+        self._max_buffers = max_buffers
+        self._mode = mode
+        self._metadata = metadata
+        self._worker = capture_worker(
+            dev,
+            n_blocks=n_blocks,
+            raw=True,
+            check_overflow=check_overflow,
+            max_refills=max_buffers,
+        )
+        self._thread = None
+        self._error = None
+        self._file = None
+        self._memmap = None
+        self._start_time = None
+        self._info = {}
+        self.buffers_written = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """running: True while buffers are being captured or written"""
+        return self._worker.running or (
+            self._thread is not None and self._thread.is_alive()
+        )
+
+    @property
+    def dropped_blocks(self) -> int:
+        """dropped_blocks: Buffers lost because the writer fell behind"""
+        return self._worker.dropped_blocks
+
+    @property
+    def overflows(self) -> int:
+        """overflows: DMA overflows reported while recording"""
+        return self._worker.overflows
+
+    @property
+    def meta_path(self) -> str:
+        """meta_path: Path of the SigMF metadata file"""
+        return os.path.splitext(self._path)[0] + ".sigmf-meta"
+
+    def _read_first(self, names):
+        for name in names:
+            try:
+                return getattr(self._dev, name)
+            except Exception:
+                continue
+        return None
+
+    def start(self):
+        """Read the device settings, open the file and start recording"""
+        if self.running:
+            return
+        # Settings are read before capture starts to keep the context free
+        self._info = {
+            "sample_rate": self._read_first(self._attrs_sample_rate),
+            "frequency": self._read_first(self._attrs_frequency),
+            "gain": self._read_first(self._attrs_gain),
+        }
+        self.buffers_written = 0
+        self._error = None
+        self._start_time = datetime.datetime.now(datetime.timezone.utc)
+        self._worker.start()
+        try:
+            nbytes = self._worker.block_shape[0]
+            if self._mode == "memmap":
+                self._memmap = np.memmap(
+                    self._path,
+                    dtype=np.uint8,
+                    mode="w+",
+                    shape=(self._max_buffers, nbytes),
+                )
+            else:
+                self._file = open(self._path, "wb")
+            self._thread = threading.Thread(target=self._write, daemon=True)
+            self._thread.start()
+        except Exception:
+            # Release the RX buffer held by the capture thread
+            self._worker.stop()
+            if self._file:
+                self._file.close()
+                self._file = None
+            self._memmap = None
+            self._thread = None
+            raise
+
+    def stop(self):
+        """Stop capturing, write out captured buffers and the metadata"""
+        self._worker.stop()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self._close()
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+
+    def wait(self, timeout=None):
+        """Wait until max_buffers buffers are written
+
+        parameters:
+            timeout: type=float
+                Seconds to wait. None waits until done
+
+        returns: type=bool
+            True if recording finished
+        """
+        if self._thread:
+            self._thread.join(timeout)
+        return not self.running
+
+    def _write(self):
+        worker = self._worker
+        try:
+            while self._max_buffers is None or self.buffers_written < self._max_buffers:
+                block = worker.get()
+                if block is None:
+                    break
+                if self._memmap is not None:
+                    self._memmap[self.buffers_written] = block
+                else:
+                    self._file.write(block)
+                worker.release()
+                self.buffers_written += 1
+        except Exception as ex:
+            self._error = ex
+        finally:
+            worker.stop()
+
+    def _close(self):
+        if self._memmap is not None:
+            self._memmap.flush()
+            self._memmap = None
+            if self.buffers_written < self._max_buffers:
+                # Drop the unused tail of the preallocated file
+                with open(self._path, "r+b") as f:
+                    f.truncate(self.buffers_written * self._worker.block_shape[0])
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._metadata and self._start_time:
+            with open(self.meta_path, "w") as f:
+                json.dump(self._sigmf(), f, indent=4)
+
+    def _sigmf(self) -> dict:
+        dev = self._dev
+        dtype = np.dtype(dev._rx_data_type)
+        datatype = "{}{}{}_le".format(
+            "c" if dev._complex_data else "r", dtype.kind, dtype.itemsize * 8
+        )
+        step = 2 if dev._complex_data else 1
+        names = [dev.rx_channel_names[m * step] for m in dev.rx_enabled_channels]
+        meta = {
+            "global": {
+                "core:datatype": datatype,
+                "core:version": "1.0.0",
+                "core:num_channels": len(names),
+                "core:recorder": "pyadi-iio",
+                "adi:device": type(dev).__name__,
+                "adi:channel_names": names,
+                "adi:buffer_size": dev.rx_buffer_size,
+                "adi:buffers": self.buffers_written,
+                "adi:dropped_buffers": self.dropped_blocks,
+                "adi:overflows": self.overflows,
+            },
+            "captures": [
+                {
+                    "core:sample_start": 0,
+                    "core:datetime": self._start_time.isoformat().replace(
+                        "+00:00", "Z"
+                    ),
+                }
+            ],
+            "annotations": [],
+        }
+        if self._info["sample_rate"] is not None:
+            meta["global"]["core:sample_rate"] = float(self._info["sample_rate"])
+        if self._info["frequency"] is not None:
+            meta["captures"][0]["core:frequency"] = float(self._info["frequency"])
+        if self._info["gain"] is not None:
+            meta["global"]["adi:gain"] = self._info["gain"]
+        return meta
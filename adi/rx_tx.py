@@ -31,15 +31,26 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF
 # THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
+import ctypes
+import functools
+import hashlib
+import json
+import os
+import time
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 
 import iio
 
 import numpy as np
-from adi.attribute import attribute
+from adi.attribute import attribute, get_numbers
 from adi.context_manager import context_manager
 from adi.dds import dds
+from adi.pipeline import pipeline
+from adi.stream import tx_streamer
 
 
 class phy(attribute):
@@ -52,9 +63,57 @@ class phy(attribute):
 class rx_tx_common(attribute):
     """Common functions for RX and TX"""
 
+    __executor = None
+
     def _annotate(self, data, cnames: List[str], echans: List[int]):
         return {cnames[ec]: data[i] for i, ec in enumerate(echans)}
 
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        """_executor: Single thread executor running blocking I/O of this
+        device for the asyncio methods. One thread per device keeps calls to
+        the same context ordered while separate devices run in parallel
+        """
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=type(self).__name__
+            )
+        return self.__executor
+
+    def _executor_shutdown(self):
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
+    async def _run_blocking(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args)
+        )
+
+    async def aget(self, name: str):
+        """Read a property of the device without blocking the event loop
+
+        args:
+            name: type=string
+                Name of the property, for example "rx_lo"
+
+        returns:
+            Value of the property
+        """
+        return await self._run_blocking(getattr, self, name)
+
+    async def aset(self, name: str, value):
+        """Write a property of the device without blocking the event loop
+
+        args:
+            name: type=string
+                Name of the property, for example "rx_lo"
+            value:
+                Value to write
+        """
+        await self._run_blocking(setattr, self, name, value)
+
 
 class rx(rx_tx_common):
     """Buffer handling for receive devices"""
@@ -68,9 +127,24 @@ class rx(rx_tx_common):
     __rx_buffer_size = 1024
     __rx_enabled_channels = [0]
     _rx_output_type = "raw"
+    _rx_complex_dtype = "complex128"
     __rxbuf = None
+    __rx_plan = None
+    __rx_plan_pool = None
+    _rx_plan_pool_size = 4
+    _rx_plan_pool_policy = "lru"
+    __rx_kernel_buffers = None
+    __rx_stream_gaps: List[int] = []
+    __rx_burst_gaps: List[int] = []
+    _rx_burst_max_kernel_buffers = 16
+    _rx_dma_status_register = 0x80000088
     _rx_unbuffered_data = False
+    _rx_unbuffered_interval = None
+    __rx_unbuffered_attrs = None
+    __rx_unbuffered_timestamps = None
+    __rx_unbuffered_rate = None
     _rx_annotated = False
+    __rx_pipeline = None
     _rx_stack_interleaved = True  # Convert from channel to sample interleaved
 
     def __init__(self, rx_buffer_size=1024):
@@ -110,6 +184,43 @@ class rx(rx_tx_common):
             raise ValueError(f"Invalid rx_output_type: {value}. Must be raw or SI")
         self._rx_output_type = value
 
+    @property
+    def rx_complex_dtype(self) -> str:
+        """rx_complex_dtype: Data type of rx() output for complex data devices.
+        Options are:
+        complex128: Complex samples in double precision (default)
+        complex64: Complex samples in single precision
+        iq_int16: Raw I/Q pairs as an array of shape (N, 2) of the device data
+        type. This is a view of the buffer without conversion when I and Q are
+        adjacent 16 bit samples
+        """
+        return self._rx_complex_dtype
+
+    @rx_complex_dtype.setter
+    def rx_complex_dtype(self, value: str):
+        if value not in ["complex128", "complex64", "iq_int16"]:
+            raise ValueError(
+                f"Invalid rx_complex_dtype: {value}. "
+                + "Must be complex128, complex64 or iq_int16"
+            )
+        self._rx_complex_dtype = value
+
+    @property
+    def rx_pipeline(self) -> pipeline:
+        """rx_pipeline: Host side processing applied to the output of rx(),
+        rx_stream and arx. Set to an adi.pipeline.pipeline, a list of stages or
+        None to disable. Setting it resets the state of its stages
+        """
+        return self.__rx_pipeline
+
+    @rx_pipeline.setter
+    def rx_pipeline(self, value):
+        if isinstance(value, list):
+            value = pipeline(*value)
+        if value is not None:
+            value.reset()
+        self.__rx_pipeline = value
+
     @property
     def rx_buffer_size(self):
         """rx_buffer_size: Size of receive buffer in samples"""
@@ -119,6 +230,97 @@ class rx(rx_tx_common):
     def rx_buffer_size(self, value):
         self.__rx_buffer_size = value
 
+    @property
+    def rx_plan_pool_size(self) -> int:
+        """rx_plan_pool_size: Number of buffer configurations, combinations of
+        rx_enabled_channels and rx_buffer_size, whose capture plans are kept.
+        Switching back to a pooled configuration reuses its channel handles,
+        sample layout and SI scales and offsets
+        """
+        return self._rx_plan_pool_size
+
+    @rx_plan_pool_size.setter
+    def rx_plan_pool_size(self, value: int):
+        if int(value) < 1:
+            raise ValueError("rx_plan_pool_size must be at least 1")
+        self._rx_plan_pool_size = int(value)
+        self.__rx_trim_plan_pool()
+
+    @property
+    def rx_plan_pool_policy(self) -> str:
+        """rx_plan_pool_policy: Which capture plan is evicted when the pool is
+        full. Options are:
+        lru: The least recently used configuration (default)
+        fifo: The configuration added first
+        """
+        return self._rx_plan_pool_policy
+
+    @rx_plan_pool_policy.setter
+    def rx_plan_pool_policy(self, value: str):
+        if value not in ["lru", "fifo"]:
+            raise ValueError(
+                f"Invalid rx_plan_pool_policy: {value}. Must be lru or fifo"
+            )
+        self._rx_plan_pool_policy = value
+
+    @property
+    def rx_kernel_buffers(self):
+        """rx_kernel_buffers: Number of kernel buffers queued by the driver for
+        the RX buffer. None keeps the driver default. Changing this recreates the
+        buffer on the next capture
+        """
+        return self.__rx_kernel_buffers
+
+    @rx_kernel_buffers.setter
+    def rx_kernel_buffers(self, value):
+        if value is not None and int(value) < 1:
+            raise ValueError("rx_kernel_buffers must be at least 1")
+        if value != self.__rx_kernel_buffers:
+            self.__rx_kernel_buffers = value
+            self.rx_destroy_buffer()
+
+    @property
+    def rx_burst_gaps(self) -> List[int]:
+        """rx_burst_gaps: Sample indexes in the output of the last rx_burst
+        before which a DMA overflow was reported, meaning samples were lost
+        between the refills on either side
+        """
+        return self.__rx_burst_gaps
+
+    @property
+    def rx_unbuffered_interval(self):
+        """rx_unbuffered_interval: Target time in seconds between samples of
+        unbuffered devices. Samples are taken as fast as possible when None
+        """
+        return self._rx_unbuffered_interval
+
+    @rx_unbuffered_interval.setter
+    def rx_unbuffered_interval(self, value):
+        if value is not None and value <= 0:
+            raise ValueError("rx_unbuffered_interval must be positive or None")
+        self._rx_unbuffered_interval = value
+
+    @property
+    def rx_unbuffered_timestamps(self) -> np.ndarray:
+        """rx_unbuffered_timestamps: Time each sample of the last unbuffered
+        capture was taken, in seconds since the epoch
+        """
+        return self.__rx_unbuffered_timestamps
+
+    @property
+    def rx_unbuffered_rate(self):
+        """rx_unbuffered_rate: Sample rate in samples per second achieved by
+        the last unbuffered capture
+        """
+        return self.__rx_unbuffered_rate
+
+    @property
+    def rx_stream_gaps(self) -> List[int]:
+        """rx_stream_gaps: Indexes of buffers yielded by the last rx_stream that
+        were preceded by a DMA overflow, meaning samples were lost before them
+        """
+        return self.__rx_stream_gaps
+
     @property
     def rx_enabled_channels(self) -> List[int]:
         """rx_enabled_channels: List of enabled channels (channel 1 is 0)
@@ -173,10 +375,13 @@ class rx(rx_tx_common):
         return len(self.__rx_enabled_channels)
 
     def rx_destroy_buffer(self):
-        """rx_destroy_buffer: Clears RX buffer"""
+        """rx_destroy_buffer: Clears RX buffer and pooled capture plans"""
         self.__rxbuf = None
+        self.__rx_plan = None
+        self.__rx_plan_pool = None
 
     def __del__(self):
+        self._executor_shutdown()
         self.__rxbuf = []
         if hasattr("self", "_rxadc") and self._rxadc:
             for m in self._rx_channel_names:
@@ -187,7 +392,7 @@ class rx(rx_tx_common):
     def __get_rx_channel_scales(self):
         rx_scale = []
         for i in self.rx_enabled_channels:
-            v = self._rxadc.find_channel(self._rx_channel_names[i])
+            v = self._find_channel(self._rxadc, self._rx_channel_names[i])
             if "scale" in v.attrs:
                 scale = self._get_iio_attr(self._rx_channel_names[i], "scale", False)
             else:
@@ -198,7 +403,7 @@ class rx(rx_tx_common):
     def __get_rx_channel_offsets(self):
         rx_offset = []
         for i in self.rx_enabled_channels:
-            v = self._rxadc.find_channel(self._rx_channel_names[i])
+            v = self._find_channel(self._rxadc, self._rx_channel_names[i])
             if "offset" in v.attrs:
                 offset = self._get_iio_attr(self._rx_channel_names[i], "offset", False)
             else:
@@ -207,97 +412,395 @@ class rx(rx_tx_common):
         return rx_offset
 
     def _rx_init_channels(self):
+        self.__rxbuf = None  # Release any previous buffer first
         for m in self._rx_channel_names:
-            v = self._rxadc.find_channel(m)
+            v = self._find_channel(self._rxadc, m)
             if not v:
                 raise Exception(f"Channel {m} not found")
             v.enabled = False
 
         if self._complex_data:
             for m in self.rx_enabled_channels:
-                v = self._rxadc.find_channel(self._rx_channel_names[m * 2])
+                v = self._find_channel(self._rxadc, self._rx_channel_names[m * 2])
                 v.enabled = True
-                v = self._rxadc.find_channel(self._rx_channel_names[m * 2 + 1])
+                v = self._find_channel(self._rxadc, self._rx_channel_names[m * 2 + 1])
                 v.enabled = True
         else:
             for m in self.rx_enabled_channels:
-                v = self._rxadc.find_channel(self._rx_channel_names[m])
+                v = self._find_channel(self._rxadc, self._rx_channel_names[m])
                 v.enabled = True
+        if self.__rx_kernel_buffers is not None:
+            self._rxadc.set_kernel_buffers_count(self.__rx_kernel_buffers)
         self.__rxbuf = iio.Buffer(self._rxadc, self.__rx_buffer_size, False)
+        self.__rx_plan = self.__rx_pooled_plan()
+
+    def __rx_plan_key(self):
+        return tuple(self.rx_enabled_channels), self.__rx_buffer_size
+
+    def __rx_build_plan(self) -> dict:
+        """Build the capture plan for the current buffer configuration
+
+        The plan holds everything that stays constant between refills of a
+        buffer: channel handles, sample layout and, once first needed, scales
+        and offsets for SI output. Plans are kept per combination of
+        rx_enabled_channels and rx_buffer_size in a pool of
+        rx_plan_pool_size entries.
+        """
+        names = self.__rx_enabled_channel_names()
+        channels = {name: self._find_channel(self._rxadc, name) for name in names}
+        formats = {}
+        for name, chan in channels.items():
+            df = chan.data_format
+            formats[name] = ("i" if df.is_signed is True else "u") + str(df.length // 8)
+        return {
+            "key": self.__rx_plan_key(),
+            "names": names,
+            "channels": channels,
+            "formats": formats,
+            "layout": self.__rx_buffer_layout(names, channels),
+            "scales": None,
+            "offsets": None,
+            "scale_writes": None,
+        }
+
+    def __rx_pooled_plan(self) -> dict:
+        """Capture plan for the current buffer configuration, taken from the
+        pool when the configuration was used before
+        """
+        if self.__rx_plan_pool is None:
+            self.__rx_plan_pool = OrderedDict()
+        key = self.__rx_plan_key()
+        plan = self.__rx_plan_pool.get(key)
+        if plan is None:
+            plan = self.__rx_build_plan()
+            self.__rx_plan_pool[key] = plan
+            self.__rx_trim_plan_pool()
+        elif self._rx_plan_pool_policy == "lru":
+            self.__rx_plan_pool.move_to_end(key)
+        return plan
+
+    def __rx_trim_plan_pool(self):
+        while self.__rx_plan_pool and (
+            len(self.__rx_plan_pool) > self._rx_plan_pool_size
+        ):
+            self.__rx_plan_pool.popitem(last=False)
+
+    def __rx_prepare_buffer(self):
+        """Create the RX buffer if needed and refill it"""
+        if (
+            not self.__rxbuf
+            or not self.__rx_plan
+            or self.__rx_plan["key"] != self.__rx_plan_key()
+        ):
+            self._rx_init_channels()
+        self.__rxbuf.refill()
+
+    def _rx_refill_raw(self) -> np.ndarray:
+        """Refill the RX buffer and return its bytes without demuxing
+
+        The returned array may be a view of the buffer memory, which is only
+        valid until the next refill.
+        """
+        if self._rx_unbuffered_data:
+            raise Exception("Raw buffer access is not supported for unbuffered devices")
+        self.__rx_prepare_buffer()
+        return self.__rx_buffer_memory()
+
+    def _rx_dma_overflow(self):
+        """Read and clear the overflow flag of the RX DMA status register
+
+        Returns True if an overflow occurred since the last check, or None if
+        the register is not accessible for this device or context.
+        """
+        try:
+            v = self._rxadc.reg_read(self._rx_dma_status_register)
+            if v & 4:
+                self._rxadc.reg_write(self._rx_dma_status_register, v)  # Clear
+                return True
+        except Exception:
+            return None
+        return False
+
+    def _rx_overflow_check_start(self, check_overflow) -> bool:
+        """Prepare DMA overflow checks for a capture
+
+        Clears flags left from before the capture. Returns True when
+        check_overflow is set and the status register can be accessed, in which
+        case _rx_dma_overflow should be called after each refill. The register
+        is that of the AXI DMAC, so checks are only requested for devices known
+        to use it.
+        """
+        return bool(check_overflow) and self._rx_dma_overflow() is not None
+
+    def __rx_scales_offsets(self):
+        """Scales and offsets of enabled channels, cached in the capture plan"""
+        plan = self.__rx_plan
+        if not plan or plan["key"] != self.__rx_plan_key():
+            return self.__get_rx_channel_scales(), self.__get_rx_channel_offsets()
+        # Scales change when written by any object, such as the channel
+        # objects of precision ADCs
+        writes = [self._attr_write_count(self._ctrl, a) for a in ("scale", "offset")]
+        if plan["scales"] is None or plan["scale_writes"] != writes:
+            plan["scales"] = self.__get_rx_channel_scales()
+            plan["offsets"] = self.__get_rx_channel_offsets()
+            plan["scale_writes"] = writes
+        return plan["scales"], plan["offsets"]
+
+    def __rx_enabled_channel_names(self) -> List[str]:
+        """Names of the enabled component channels in rx_enabled_channels order"""
+        if self._complex_data:
+            ecn = []
+            for m in self.rx_enabled_channels:
+                ecn.extend(
+                    (self._rx_channel_names[m * 2], self._rx_channel_names[m * 2 + 1])
+                )
+            return ecn
+        return [self._rx_channel_names[m] for m in self.rx_enabled_channels]
+
+    def __rx_buffer_layout(self, names: List[str], channels: dict):
+        """Describe one sample of the RX buffer as a structured numpy dtype
+
+        Fields are placed at the same offsets libiio uses when packing the
+        enabled channels, ordered by scan index. Returns None when the layout
+        cannot be expressed this way, in which case data is demuxed per channel
+        by libiio.
+        """
+        chans = [(name, channels[name]) for name in names]
+        if not all(hasattr(chan, "index") for _, chan in chans):
+            return None  # Scan index not exposed by older bindings
+        chans.sort(key=lambda c: c[1].index)
+        names, formats, offsets, conversions = [], [], [], {}
+        size = 0
+        prev_index = None
+        for name, chan in chans:
+            df = chan.data_format
+            length = df.length // 8
+            if df.repeat > 1 or length not in (1, 2, 4, 8):
+                return None
+            if chan.index == prev_index:
+                # Channels with the same index share samples
+                offset = offsets[-1]
+            else:
+                if size % length:
+                    size += length - size % length
+                offset = size
+                size += length
+            prev_index = chan.index
+            kind = "i" if df.is_signed is True else "u"
+            names.append(name)
+            offsets.append(offset)
+            formats.append((">" if df.is_be else "<") + kind + str(length))
+            conversions[name] = (
+                kind + str(length),
+                df.shift,
+                None if df.is_fully_defined else df.bits,
+            )
+        if size != self._rxadc.sample_size:
+            return None
+        dtype = np.dtype(
+            {"names": names, "formats": formats, "offsets": offsets, "itemsize": size}
+        )
+        return dtype, conversions
+
+    def __rx_buffer_memory(self) -> np.ndarray:
+        """Bytes of the RX buffer as a numpy array
+
+        Where the libiio bindings allow it this is a view of the buffer memory
+        itself, valid until the next refill, otherwise a copy.
+        """
+        # These are private to the bindings, so fall back to a copy when a
+        # version does not provide them
+        if not (
+            hasattr(iio, "_buffer_start")
+            and hasattr(iio, "_buffer_end")
+            and hasattr(self.__rxbuf, "_buffer")
+        ):
+            return np.frombuffer(self.__rxbuf.read(), dtype=np.uint8)
+        start = iio._buffer_start(self.__rxbuf._buffer)
+        end = iio._buffer_end(self.__rxbuf._buffer)
+        return np.ctypeslib.as_array(
+            (ctypes.c_uint8 * (end - start)).from_address(start)
+        )
+
+    def __rx_demux(self, raw: np.ndarray, copy=False) -> List[np.ndarray]:
+        """Split raw RX buffer bytes into one array per enabled component channel
+
+        Channels already in host format are returned as strided views of raw,
+        or as copies of them when copy is set, otherwise they are converted
+        like libiio's iio_channel_convert. Either way each channel is copied
+        at most once.
+        """
+        dtype, conversions = self.__rx_plan["layout"]
+        samples = raw[: len(raw) // dtype.itemsize * dtype.itemsize].view(dtype)
+        data = []
+        for name in self.__rx_plan["names"]:
+            x = samples[name]
+            fmt, shift, bits = conversions[name]
+            if x.dtype != np.dtype(fmt) or shift or bits:
+                x = x.astype(fmt)
+            elif copy:
+                x = x.copy()
+            if shift:
+                u = x.view("u" + fmt[1:])
+                u >>= shift
+            if bits:
+                if fmt[0] == "i":
+                    x <<= x.itemsize * 8 - bits
+                    x >>= x.itemsize * 8 - bits
+                else:
+                    x &= (1 << bits) - 1
+            data.append(x)
+        return data
+
+    def __rx_unbuffered_raw_attrs(self) -> list:
+        """raw attributes of the enabled channels, looked up once per set of
+        enabled channels
+        """
+        key = tuple(self.rx_enabled_channels)
+        if self.__rx_unbuffered_attrs is None or self.__rx_unbuffered_attrs[0] != key:
+            names = [self._rx_channel_names[m] for m in key]
+            attrs = [self._find_channel(self._rxadc, n).attrs["raw"] for n in names]
+            self.__rx_unbuffered_attrs = (key, attrs)
+        return self.__rx_unbuffered_attrs[1]
+
+    def __rx_unbuffered_fill(self, rows: List[np.ndarray]):
+        """Sample the raw attribute of each enabled channel rx_buffer_size
+        times into rows, one per enabled channel
+
+        Each tick reads all channels back to back, paced by
+        rx_unbuffered_interval. Timestamps and the achieved rate are kept in
+        rx_unbuffered_timestamps and rx_unbuffered_rate.
+        """
+        attrs = self.__rx_unbuffered_raw_attrs()
+        n = self.rx_buffer_size
+        si = self._rx_output_type == "SI"
+
+        # Get scalers first
+        if si:
+            rx_scale = self.__get_rx_channel_scales()
+            rx_offset = self.__get_rx_channel_offsets()
+            raw = np.empty((len(attrs), n))
+        else:
+            raw = rows
+
+        interval = self._rx_unbuffered_interval
+        stamps = np.empty(n)
+        epoch = time.time()
+        start = time.perf_counter()
+        for samp in range(n):
+            if interval:
+                # Pace against the start time so delays do not accumulate
+                delay = start + samp * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            stamps[samp] = time.perf_counter()
+            for i, attr in enumerate(attrs):
+                raw[i][samp] = get_numbers(attr.value)
+
+        if si:
+            for i, row in enumerate(rows):
+                raw[i] *= rx_scale[i]
+                raw[i] += rx_offset[i]
+                np.copyto(row[:n], raw[i], casting="unsafe")
+
+        duration = stamps[-1] - stamps[0] if n else 0
+        self.__rx_unbuffered_rate = (n - 1) / duration if duration > 0 else None
+        stamps += epoch - start
+        self.__rx_unbuffered_timestamps = stamps
 
     def __rx_unbuffered_data(self):
-        x = []
         t = (
             self._rx_data_si_type
             if self._rx_output_type == "SI"
             else self._rx_data_type
         )
-        for _ in range(len(self.rx_enabled_channels)):
-            x.append(np.zeros(self.rx_buffer_size, dtype=t))
-
-        # Get scalers first
-        if self._rx_output_type == "SI":
-            rx_scale = self.__get_rx_channel_scales()
-            rx_offset = self.__get_rx_channel_offsets()
+        x = [
+            np.zeros(self.rx_buffer_size, dtype=t)
+            for _ in range(len(self.rx_enabled_channels))
+        ]
+        self.__rx_unbuffered_fill(x)
+        return x
 
-        for samp in range(self.rx_buffer_size):
-            for i, m in enumerate(self.rx_enabled_channels):
-                s = self._get_iio_attr(
-                    self._rx_channel_names[m], "raw", False, self._rxadc
-                )
-                if self._rx_output_type == "SI":
-                    x[i][samp] = rx_scale[i] * s + rx_offset[i]
-                else:
-                    x[i][samp] = s
+    def __rx_buffered_channels(self) -> List[np.ndarray]:
+        """Read each enabled component channel from the filled RX buffer"""
+        plan = self.__rx_plan
+        data_channel_interleaved = []
+        for name in plan["names"]:
+            chan = plan["channels"][name]
+            bytearray_data = chan.read(self.__rxbuf)  # Do local type conversion
+            data_channel_interleaved.append(
+                np.frombuffer(bytearray_data, dtype=plan["formats"][name])
+            )
 
-        return x
+        return data_channel_interleaved
 
-    def __rx_buffered_data(self) -> Union[List[np.ndarray], np.ndarray]:
+    def __rx_buffered_data(self, copy=True) -> Union[List[np.ndarray], np.ndarray]:
         """__rx_buffered_data: Read data from RX buffer
 
+        Args:
+            copy: When False, channels in host format may be returned as views
+                of the buffer memory, which are only valid until the next
+                refill. Callers then create their own arrays from them
+
         Returns:
             List of numpy arrays containing the data from the RX buffer that are
             channel interleaved
         """
-        if not self.__rxbuf:
-            self._rx_init_channels()
-        self.__rxbuf.refill()
+        self.__rx_prepare_buffer()
 
-        data_channel_interleaved = []
-        ecn = []
-        if self._complex_data:
-            for m in self.rx_enabled_channels:
-                ecn.extend(
-                    (self._rx_channel_names[m * 2], self._rx_channel_names[m * 2 + 1])
-                )
-        else:
-            ecn = [self._rx_channel_names[m] for m in self.rx_enabled_channels]
+        if self.__rx_plan["layout"]:
+            return self.__rx_demux(self.__rx_buffer_memory(), copy)
+        return self.__rx_buffered_channels()
 
-        for name in ecn:
-            chan = self._rxadc.find_channel(name)
-            bytearray_data = chan.read(self.__rxbuf)  # Do local type conversion
-            # create format strings
-            df = chan.data_format
-            fmt = ("i" if df.is_signed is True else "u") + str(df.length // 8)
-            data_channel_interleaved.append(np.frombuffer(bytearray_data, dtype=fmt))
+    @staticmethod
+    def __rx_iq_pairs(i: np.ndarray, q: np.ndarray) -> np.ndarray:
+        """Combine I and Q component arrays into an (N, 2) array
 
-        return data_channel_interleaved
+        When Q directly follows I in the same buffer, as for int16 samples
+        demuxed from the structured layout, the pairs are copied out of that
+        buffer in one pass. Otherwise the components are stacked into a new
+        array.
+        """
+        itemsize = i.dtype.itemsize
+        if (
+            i.dtype == q.dtype
+            and i.dtype.isnative
+            and i.strides == q.strides
+            and q.__array_interface__["data"][0]
+            == i.__array_interface__["data"][0] + itemsize
+        ):
+            return np.array(
+                np.lib.stride_tricks.as_strided(
+                    i, shape=(len(i), 2), strides=(i.strides[0], itemsize)
+                )
+            )
+        return np.stack((i, q), axis=1)
 
     def __rx_complex(self):
-        x = self.__rx_buffered_data()
+        # Every branch below builds new arrays from the buffer views
+        x = self.__rx_buffered_data(copy=False)
         if len(x) % 2 != 0:
             raise Exception(
                 "Complex data must have an even number of component channels"
             )
-        out = [x[i] + 1j * x[i + 1] for i in range(0, len(x), 2)]
+        if self._rx_complex_dtype == "iq_int16":
+            out = [self.__rx_iq_pairs(x[i], x[i + 1]) for i in range(0, len(x), 2)]
+        else:
+            out = []
+            for i in range(0, len(x), 2):
+                # Fill the parts in place rather than building I + 1j * Q
+                c = np.empty(len(x[i]), dtype=self._rx_complex_dtype)
+                c.real = x[i]
+                c.imag = x[i + 1]
+                out.append(c)
         # Don't return list if a single channel
         return out[0] if len(x) == 2 else out
 
     def __rx_non_complex(self):
-        x = self.__rx_buffered_data()
+        # Scaling creates new arrays, raw output needs copies of the buffer
+        x = self.__rx_buffered_data(copy=self._rx_output_type != "SI")
         if self._rx_output_type == "SI":
-            rx_scale = self.__get_rx_channel_scales()
-            rx_offset = self.__get_rx_channel_offsets()
+            rx_scale, rx_offset = self.__rx_scales_offsets()
             x = x if isinstance(x, list) else [x]
             x = [rx_scale[i] * x[i] + rx_offset[i] for i in range(len(x))]
         elif self._rx_output_type != "raw":
@@ -306,6 +809,219 @@ class rx(rx_tx_common):
         # Don't return list if a single channel
         return x[0] if len(self.rx_enabled_channels) == 1 else x
 
+    def rx_into(self, out: Union[List[np.ndarray], np.ndarray]):
+        """Receive data from hardware buffers directly into preallocated arrays
+        for each channel index in rx_enabled_channels.
+
+        Samples are deinterleaved from the refilled buffer straight into out,
+        without the intermediate arrays created by rx(). For unbuffered devices
+        samples are written into out as they are read.
+
+        args: type=numpy.array or list of numpy.array
+            A 2D array with one row per enabled channel or a list of arrays, each
+            with room for rx_buffer_size samples. For complex data devices the
+            arrays are either complex, one per enabled channel, or real with one
+            row per I and Q component. With an rx_output_type of SI, integer
+            arrays receive the scaled values truncated to their type.
+
+        returns: type=numpy.array or list of numpy.array
+            out, filled with samples from a channel or set of channels.
+        """
+        rows = [out] if isinstance(out, np.ndarray) and out.ndim == 1 else list(out)
+        if self._rx_unbuffered_data:
+            if len(rows) != len(self.rx_enabled_channels):
+                raise Exception(
+                    "Number of output arrays does not match enabled channels"
+                )
+            if any(len(row) < self.rx_buffer_size for row in rows):
+                raise Exception(
+                    f"Output arrays must hold at least {self.rx_buffer_size} samples"
+                )
+            self.__rx_unbuffered_fill(rows)
+            return out
+
+        self.__rx_prepare_buffer()
+        if self.__rx_plan["layout"]:
+            x = self.__rx_demux(self.__rx_buffer_memory())
+        else:
+            x = self.__rx_buffered_channels()
+
+        complex_out = self._complex_data and np.iscomplexobj(rows[0])
+        if len(rows) != (len(x) // 2 if complex_out else len(x)):
+            raise Exception("Number of output arrays does not match enabled channels")
+        n = len(x[0])
+        si = self._rx_output_type == "SI" and not self._complex_data
+        if si:
+            rx_scale, rx_offset = self.__rx_scales_offsets()
+        for i, row in enumerate(rows):
+            if len(row) < n:
+                raise Exception(f"Output arrays must hold at least {n} samples")
+            if complex_out:
+                np.copyto(row.real[:n], x[2 * i], casting="unsafe")
+                np.copyto(row.imag[:n], x[2 * i + 1], casting="unsafe")
+            elif si and not np.issubdtype(row.dtype, np.inexact):
+                # Scale in floating point, then truncate into the integer output
+                y = x[i] * rx_scale[i] + rx_offset[i]
+                np.copyto(row[:n], y, casting="unsafe")
+            else:
+                np.copyto(row[:n], x[i], casting="unsafe")
+                if si:
+                    row[:n] *= rx_scale[i]
+                    row[:n] += rx_offset[i]
+        return out
+
+    def rx_burst(self, total_samples, kernel_buffers=None, check_overflow=False):
+        """Capture more samples than fit in one buffer by refilling back to back
+        into one preallocated array per channel.
+
+        The hardware buffer keeps its rx_buffer_size, and consecutive refills
+        are written straight into the output with rx_into. Buffers preceded by
+        a DMA overflow are listed in rx_burst_gaps. The previous
+        rx_kernel_buffers setting is restored afterwards.
+
+        args:
+            total_samples: type=int
+                Number of samples to capture per channel
+            kernel_buffers: type=int
+                Number of kernel buffers the driver keeps queued, see
+                rx_kernel_buffers. When None one per refill is used, up to 16
+            check_overflow: type=bool
+                Check the DMA status register after each refill. Only enable
+                this for devices whose RX data is moved by an AXI DMAC
+
+        returns: type=numpy.array or list of numpy.array
+            An array or list of arrays of total_samples samples each, in the
+            same form as returned by rx(). With an rx_complex_dtype of iq_int16
+            each array has shape (total_samples, 2). When rx_pipeline is set,
+            its output over the whole capture is returned instead
+        """
+        if self._rx_unbuffered_data:
+            raise Exception("rx_burst is not supported for unbuffered devices")
+        n = self.rx_buffer_size
+        n_buffers = -(-int(total_samples) // n)
+        if kernel_buffers is None:
+            kernel_buffers = min(n_buffers, self._rx_burst_max_kernel_buffers)
+        previous_kernel_buffers = self.__rx_kernel_buffers
+        self.rx_kernel_buffers = kernel_buffers
+        try:
+            data = self.__rx_burst_capture(n_buffers, check_overflow)
+        finally:
+            self.rx_kernel_buffers = previous_kernel_buffers
+
+        data = [chan[:total_samples] for chan in data]
+        # Don't return list if a single channel
+        data = data[0] if len(data) == 1 else data
+        if self.__rx_pipeline is not None:
+            data = self.__rx_pipeline(data)
+        if self._rx_annotated:
+            return self._annotate(
+                data, self._rx_channel_names, self.rx_enabled_channels
+            )
+        return data
+
+    def __rx_burst_capture(self, n_buffers, check_overflow):
+        """Refill n_buffers times into one array per enabled channel"""
+        n = self.rx_buffer_size
+        n_chan = len(self.rx_enabled_channels)
+        if self._complex_data and self._rx_complex_dtype == "iq_int16":
+            out = np.empty((n_chan, n_buffers * n, 2), dtype=np.int16)
+            rows = [out[c, :, part] for c in range(n_chan) for part in (0, 1)]
+        else:
+            if self._complex_data:
+                dtype = self._rx_complex_dtype
+            elif self._rx_output_type == "SI":
+                dtype = np.float64
+            else:
+                dtype = self._rx_data_type
+            out = np.empty((n_chan, n_buffers * n), dtype=dtype)
+            rows = list(out)
+
+        self.__rx_burst_gaps = []
+        check_overflow = self._rx_overflow_check_start(check_overflow)
+        for k in range(n_buffers):
+            self.rx_into([row[k * n : (k + 1) * n] for row in rows])
+            if check_overflow and self._rx_dma_overflow() and k:
+                self.__rx_burst_gaps.append(k * n)
+        return out
+
+    def rx_stream(self, n_buffers=None, kernel_buffers=None, check_overflow=False):
+        """Continuously receive data from one persistent hardware buffer for
+        each channel index in rx_enabled_channels.
+
+        args:
+            n_buffers: type=int
+                Number of buffers to yield. When None buffers are yielded until
+                the generator is closed
+            kernel_buffers: type=int
+                Number of kernel buffers the driver keeps queued between
+                refills, see rx_kernel_buffers. None keeps the current setting
+            check_overflow: type=bool
+                Check the DMA status register after each refill and record
+                buffers preceded by an overflow in rx_stream_gaps. The
+                register is read and written back, so only enable this for
+                devices whose RX data is moved by an AXI DMAC
+
+        yields: type=numpy.array or list of numpy.array
+            Data of each buffer, in the same form as returned by rx()
+        """
+        if self._rx_unbuffered_data:
+            raise Exception("rx_stream is not supported for unbuffered devices")
+        if kernel_buffers is not None:
+            self.rx_kernel_buffers = kernel_buffers
+        self.__rx_stream_gaps = []
+        check_overflow = self._rx_overflow_check_start(check_overflow)
+
+        count = 0
+        while n_buffers is None or count < n_buffers:
+            data = self.rx()
+            if check_overflow and self._rx_dma_overflow():
+                self.__rx_stream_gaps.append(count)
+            yield data
+            count += 1
+
+    async def arx(self):
+        """Receive data from hardware buffers without blocking the event loop.
+        The refill runs on the executor of this device.
+
+        returns: type=numpy.array or list of numpy.array
+            Data in the same form as returned by rx()
+        """
+        return await self._run_blocking(self.rx)
+
+    async def arx_stream(
+        self, n_buffers=None, kernel_buffers=None, check_overflow=False
+    ):
+        """Asynchronous form of rx_stream for use with async for. Each refill
+        runs on the executor of this device, so many devices can stream from
+        one event loop.
+
+        args:
+            n_buffers: type=int
+                Number of buffers to yield. When None buffers are yielded until
+                the generator is closed
+            kernel_buffers: type=int
+                Number of kernel buffers the driver keeps queued between
+                refills, see rx_kernel_buffers. None keeps the current setting
+            check_overflow: type=bool
+                Check the DMA status register after each refill and record
+                buffers preceded by an overflow in rx_stream_gaps. The
+                register is read and written back, so only enable this for
+                devices whose RX data is moved by an AXI DMAC
+
+        yields: type=numpy.array or list of numpy.array
+            Data of each buffer, in the same form as returned by rx()
+        """
+        stream = self.rx_stream(n_buffers, kernel_buffers, check_overflow)
+        done = object()
+        try:
+            while True:
+                data = await self._run_blocking(next, stream, done)
+                if data is done:
+                    return
+                yield data
+        finally:
+            await self._run_blocking(stream.close)
+
     def rx(self):
         """Receive data from hardware buffers for each channel index in
         rx_enabled_channels.
@@ -314,6 +1030,7 @@ class rx(rx_tx_common):
             An array or list of arrays when more than one receive channel
             is enabled containing samples from a channel or set of channels.
             Data will be complex when using a complex data device.
+            When rx_pipeline is set, its output is returned instead.
         """
         if self._rx_unbuffered_data:
             data = self.__rx_unbuffered_data()
@@ -322,6 +1039,8 @@ class rx(rx_tx_common):
                 data = self.__rx_complex()
             else:
                 data = self.__rx_non_complex()
+        if self.__rx_pipeline is not None:
+            data = self.__rx_pipeline(data)
         if self._rx_annotated:
             return self._annotate(
                 data, self._rx_channel_names, self.rx_enabled_channels
@@ -339,6 +1058,20 @@ class tx(dds, rx_tx_common):
     __txbuf = None
     _output_byte_filename = "out.bin"
     _push_to_file = False
+    _tx_file_flush_interval = 1.0
+    _tx_file_metadata = False
+    __tx_file = None
+    __tx_file_path = None
+    __tx_file_flushed = 0.0
+    __tx_file_start = 0
+    __tx_file_bytes = 0
+    _tx_saturate = False
+    _tx_convert_block = 2 ** 16
+    __tx_kernel_buffers = None
+    _tx_dma_status_register = 0x80000088
+    _tx_cyclic_cache_size = 0
+    __tx_cyclic_cache = None
+    __tx_loaded_key = None
 
     def __init__(self, tx_cyclic_buffer=False):
         if self._complex_data:
@@ -352,6 +1085,8 @@ class tx(dds, rx_tx_common):
         dds.__init__(self)
 
     def __del__(self):
+        self._executor_shutdown()
+        self.tx_file_close()
         self.__txbuf = []
         if hasattr("self", "_txdac") and self._txdac:
             for m in self._tx_channel_names:
@@ -373,6 +1108,148 @@ class tx(dds, rx_tx_common):
             )
         self.__tx_cyclic_buffer = value
 
+    @property
+    def tx_file_sink(self):
+        """tx_file_sink: Path of a file that data passed to tx() and tx_raw()
+        is appended to instead of the hardware buffer. The file is kept open
+        between calls until tx_file_close() is called or the buffer is
+        destroyed. None sends data to hardware (default)
+        """
+        return self._output_byte_filename if self._push_to_file else None
+
+    @tx_file_sink.setter
+    def tx_file_sink(self, value):
+        if value != self.tx_file_sink:
+            self.tx_file_close()
+        self._push_to_file = value is not None
+        if value is not None:
+            self._output_byte_filename = value
+
+    @property
+    def tx_file_flush_interval(self) -> float:
+        """tx_file_flush_interval: Minimum time in seconds between flushes of
+        the file sink to disk. 0 flushes after every call
+        """
+        return self._tx_file_flush_interval
+
+    @tx_file_flush_interval.setter
+    def tx_file_flush_interval(self, value: float):
+        if value < 0:
+            raise ValueError("tx_file_flush_interval must not be negative")
+        self._tx_file_flush_interval = value
+
+    @property
+    def tx_file_metadata(self) -> bool:
+        """tx_file_metadata: Write a SigMF metadata file describing the data
+        next to the file sink when it is closed
+        """
+        return self._tx_file_metadata
+
+    @tx_file_metadata.setter
+    def tx_file_metadata(self, value: bool):
+        self._tx_file_metadata = bool(value)
+
+    def tx_file_close(self):
+        """tx_file_close: Flush and close the file sink"""
+        if not self.__tx_file:
+            return
+        self.__tx_file.close()
+        self.__tx_file = None
+        if self._tx_file_metadata:
+            self.__tx_file_write_metadata()
+
+    def __tx_file_write(self, data: np.ndarray):
+        if self.__tx_file and self.__tx_file_path != self._output_byte_filename:
+            self.tx_file_close()
+        if not self.__tx_file:
+            self.__tx_file = open(self._output_byte_filename, "ab")
+            self.__tx_file_path = self._output_byte_filename
+            self.__tx_file_flushed = time.monotonic()
+            # Data already in the file is not described by the metadata
+            self.__tx_file_start = self.__tx_file.tell()
+            self.__tx_file_bytes = 0
+        self.__tx_file.write(data)
+        self.__tx_file_bytes += memoryview(data).nbytes
+        now = time.monotonic()
+        if now - self.__tx_file_flushed >= self._tx_file_flush_interval:
+            self.__tx_file.flush()
+            self.__tx_file_flushed = now
+
+    def __tx_file_write_metadata(self):
+        step = 2 if self._complex_data else 1
+        sample_size = 2 * self._tx_stride
+        meta = {
+            "global": {
+                "core:datatype": ("c" if self._complex_data else "r") + "i16_le",
+                "core:version": "1.0.0",
+                "core:num_channels": self._num_tx_channels_enabled,
+                "core:recorder": "pyadi-iio",
+                "adi:device": type(self).__name__,
+                "adi:channel_names": [
+                    self._tx_channel_names[m * step] for m in self.tx_enabled_channels
+                ],
+                "adi:samples": self.__tx_file_bytes // sample_size,
+            },
+            "captures": [{"core:sample_start": self.__tx_file_start // sample_size}],
+            "annotations": [],
+        }
+        for name in ["sample_rate", "tx_sample_rate"]:
+            try:
+                meta["global"]["core:sample_rate"] = float(getattr(self, name))
+                break
+            except Exception:
+                continue
+        path = os.path.splitext(self.__tx_file_path)[0] + ".sigmf-meta"
+        with open(path, "w") as f:
+            json.dump(meta, f, indent=4)
+
+    @property
+    def tx_kernel_buffers(self):
+        """tx_kernel_buffers: Number of kernel buffers queued by the driver for
+        the TX buffer. None keeps the driver default. Changing this destroys the
+        current buffer
+        """
+        return self.__tx_kernel_buffers
+
+    @tx_kernel_buffers.setter
+    def tx_kernel_buffers(self, value):
+        if value is not None and int(value) < 1:
+            raise ValueError("tx_kernel_buffers must be at least 1")
+        if value != self.__tx_kernel_buffers:
+            self.__tx_kernel_buffers = value
+            self.tx_destroy_buffer()
+
+    @property
+    def tx_cyclic_cache_size(self) -> int:
+        """tx_cyclic_cache_size: Number of packed cyclic waveforms kept by tx().
+        When non-zero, calling tx() in cyclic mode with the waveform that is
+        already being transmitted does nothing instead of raising an error, and
+        recently used waveforms are pushed without packing them again. 0
+        disables the cache (default)
+        """
+        return self._tx_cyclic_cache_size
+
+    @tx_cyclic_cache_size.setter
+    def tx_cyclic_cache_size(self, value: int):
+        if int(value) < 0:
+            raise ValueError("tx_cyclic_cache_size must not be negative")
+        self._tx_cyclic_cache_size = int(value)
+        while self.__tx_cyclic_cache and (
+            len(self.__tx_cyclic_cache) > self._tx_cyclic_cache_size
+        ):
+            self.__tx_cyclic_cache.popitem(last=False)
+
+    @property
+    def tx_saturate(self) -> bool:
+        """tx_saturate: Clip samples passed to tx() to the int16 range instead
+        of letting out of range values wrap around
+        """
+        return self._tx_saturate
+
+    @tx_saturate.setter
+    def tx_saturate(self, value: bool):
+        self._tx_saturate = bool(value)
+
     @property
     def _num_tx_channels_enabled(self):
         return len(self.tx_enabled_channels)
@@ -433,88 +1310,248 @@ class tx(dds, rx_tx_common):
         self.__tx_enabled_channels = value
 
     def tx_destroy_buffer(self):
-        """tx_destroy_buffer: Clears TX buffer"""
+        """tx_destroy_buffer: Clears TX buffer and closes the file sink"""
         self.__txbuf = None
+        self.tx_file_close()
+        self.__tx_loaded_key = None
 
     def _tx_init_channels(self):
         if self._complex_data:
             for m in self.tx_enabled_channels:
-                v = self._txdac.find_channel(self._tx_channel_names[m * 2], True)
+                v = self._find_channel(self._txdac, self._tx_channel_names[m * 2], True)
                 v.enabled = True
-                v = self._txdac.find_channel(self._tx_channel_names[m * 2 + 1], True)
+                v = self._find_channel(
+                    self._txdac, self._tx_channel_names[m * 2 + 1], True
+                )
                 v.enabled = True
         else:
             for m in self.tx_enabled_channels:
-                v = self._txdac.find_channel(self._tx_channel_names[m], True)
+                v = self._find_channel(self._txdac, self._tx_channel_names[m], True)
                 v.enabled = True
+        if self.__tx_kernel_buffers is not None:
+            self._txdac.set_kernel_buffers_count(self.__tx_kernel_buffers)
         self.__txbuf = iio.Buffer(
             self._txdac, self._tx_buffer_size, self.__tx_cyclic_buffer
         )
 
-    def tx(self, data_np=None):
-        """Transmit data to hardware buffers for each channel index in
-        tx_enabled_channels.
+    def _tx_dma_underflow(self):
+        """Read and clear the underflow flag of the TX DMA status register
+
+        Returns True if an underflow occurred since the last check, or None if
+        the register is not accessible for this device or context.
+        """
+        try:
+            v = self._txdac.reg_read(self._tx_dma_status_register)
+            if v & 1:
+                self._txdac.reg_write(self._tx_dma_status_register, v)  # Clear
+                return True
+        except Exception:
+            return None
+        return False
+
+    def tx_stream(
+        self, source, n_prefetch=4, kernel_buffers=4, raw=False, check_underflow=True
+    ):
+        """Continuously transmit blocks from an iterable with a non-cyclic
+        buffer, returning once the iterable is exhausted.
+
+        Blocks are taken from source and packed on a background thread while
+        another thread keeps pushing them, see adi.stream.tx_streamer.
+
+        args:
+            source: type=iterable
+                Blocks in the form accepted by tx(), or by tx_raw() when raw is
+                set. All blocks must have the same number of samples
+            n_prefetch: type=int
+                Number of packed blocks kept ready ahead of the pushes
+            kernel_buffers: type=int
+                Number of kernel buffers the driver keeps queued, see
+                tx_kernel_buffers. None keeps the current setting
+            raw: type=bool
+                Blocks are already interleaved int16 data
+            check_underflow: type=bool
+                Check the DMA status register after each push and count
+                underflows
+
+        returns: type=adi.stream.tx_streamer
+            The finished streamer, holding the push and underflow counters
+        """
+        with tx_streamer(
+            self, source, n_prefetch, kernel_buffers, raw, check_underflow
+        ) as streamer:
+            streamer.wait()
+        return streamer
+
+    def tx_from_file(
+        self,
+        path,
+        buffer_size=2 ** 16,
+        loop=False,
+        offset=0,
+        n_prefetch=4,
+        kernel_buffers=4,
+        check_underflow=True,
+    ):
+        """Transmit a file of interleaved int16 samples with a non-cyclic
+        buffer, returning once the file has been sent.
+
+        The file is memory mapped and sent in chunks of buffer_size samples
+        with tx_stream, so chunks are passed to the buffer as views of the
+        mapping without conversion or copies. Samples must be interleaved in
+        the order used by the hardware for tx_enabled_channels, with I before
+        Q for complex data devices. A final partial chunk is padded with zeros.
+
+        args:
+            path: type=string
+                Path of the file
+            buffer_size: type=int
+                Number of samples pushed per buffer
+            loop: type=bool or int
+                Number of times to send the file. True repeats until
+                interrupted
+            offset: type=int
+                Number of bytes to skip at the start of the file
+            n_prefetch: type=int
+                Number of chunks kept ready ahead of the pushes
+            kernel_buffers: type=int
+                Number of kernel buffers the driver keeps queued, see
+                tx_kernel_buffers
+            check_underflow: type=bool
+                Check the DMA status register after each push and count
+                underflows
+
+        returns: type=adi.stream.tx_streamer
+            The finished streamer, holding the push and underflow counters and
+            the achieved rate
+        """
+        stride = self._tx_stride
+        # Copy on write mapping, libiio needs writable memory but never writes
+        data = np.memmap(path, dtype=np.int16, mode="c", offset=offset)
+        n_samples = len(data) // stride
+        if not n_samples:
+            raise Exception(f"{path} holds less than one sample")
+        data = data[: n_samples * stride].reshape(n_samples, stride)
+
+        def chunks():
+            count = 0
+            while loop is True or count < max(int(loop), 1):
+                for start in range(0, n_samples, buffer_size):
+                    chunk = data[start : start + buffer_size]
+                    if len(chunk) < buffer_size:
+                        chunk = np.concatenate(
+                            (
+                                chunk,
+                                np.zeros((buffer_size - len(chunk), stride), np.int16),
+                            )
+                        )
+                    yield chunk
+                count += 1
+
+        return self.tx_stream(
+            chunks(),
+            n_prefetch,
+            kernel_buffers,
+            raw=True,
+            check_underflow=check_underflow,
+        )
+
+    async def atx(self, data_np=None):
+        """Transmit data to hardware buffers without blocking the event loop.
+        The push runs on the executor of this device.
 
         args: type=numpy.array or list of numpy.array
-            An array or list of arrays when more than one transmit channel
-            is enabled containing samples from a channel or set of channels.
-            Data must be complex when using a complex data device.
+            Data in the same form as accepted by tx()
         """
-        if not self.__tx_enabled_channels and data_np:
-            raise Exception(
-                "When tx_enabled_channels is None or empty,"
-                + " the input to tx() must be None or empty or not provided"
-            )
-        if not self.__tx_enabled_channels:
-            # Set TX DAC to zero source
-            for chan in self._txdac.channels:
-                if chan.output:
-                    chan.attrs["raw"].value = "0"
-                    return
-            raise Exception("No DDS channels found for TX, TX zeroing does not apply")
+        await self._run_blocking(self.tx, data_np)
 
+    def __tx_check_push(self):
+        if not self.__tx_enabled_channels:
+            raise Exception("No TX channels enabled to push data to")
         if self.__txbuf and self.tx_cyclic_buffer:
             raise Exception(
                 "TX buffer has been submitted in cyclic mode. "
                 "To push more data the tx buffer must be destroyed first."
             )
 
+    @property
+    def _tx_stride(self) -> int:
+        """_tx_stride: Number of interleaved components per TX sample"""
         if self._complex_data:
-            if self._num_tx_channels_enabled == 1:
-                data_np = [data_np]
-
-            if len(data_np) != self._num_tx_channels_enabled:
-                raise Exception("Not enough data provided for channel mapping")
-
-            indx = 0
-            stride = self._num_tx_channels_enabled * 2
-            data = np.empty(stride * len(data_np[0]), dtype=np.int16)
-            for chan in data_np:
-                i = np.real(chan)
-                q = np.imag(chan)
-                data[indx::stride] = i.astype(int)
-                data[indx + 1 :: stride] = q.astype(int)
-                indx = indx + 2
-        else:
-            if self._num_tx_channels_enabled == 1:
-                data_np = [data_np]
+            return self._num_tx_channels_enabled * 2
+        return self._num_tx_channels_enabled
+
+    def __tx_convert(self, out: np.ndarray, x: np.ndarray):
+        """Convert one component to int16 into out, which may be strided
+
+        Integer input is cast directly. Other input is truncated through a
+        small int64 scratch block, so out of range values wrap exactly as with
+        astype(int), or are clipped when tx_saturate is set.
+        """
+        if not self._tx_saturate and x.dtype.kind in "bui":
+            np.copyto(out, x, casting="unsafe")
+            return
+        block = self._tx_convert_block
+        scratch = np.empty(min(len(x), block), dtype=np.int64)
+        for start in range(0, len(x), block):
+            chunk = scratch[: min(block, len(x) - start)]
+            np.copyto(chunk, x[start : start + len(chunk)], casting="unsafe")
+            if self._tx_saturate:
+                np.clip(chunk, -32768, 32767, out=chunk)
+            np.copyto(out[start : start + len(chunk)], chunk, casting="unsafe")
+
+    def __tx_cache_key(self, data_np) -> tuple:
+        """Key of a waveform in the cyclic cache: a hash of the data of each
+        channel with its type and shape, and the settings used to pack it
+        """
+        h = hashlib.blake2b(digest_size=16)
+        if self._num_tx_channels_enabled == 1:
+            data_np = [data_np]
+        for chan in data_np:
+            chan = np.ascontiguousarray(chan)
+            h.update(f"{chan.dtype.str}{chan.shape}".encode())
+            h.update(chan)
+        return h.digest(), tuple(self.tx_enabled_channels), self._tx_saturate
+
+    def _tx_pack(self, data_np) -> np.ndarray:
+        """Interleave channel data into one int16 array of shape
+        (samples, components), ready to be passed to tx_raw
+        """
+        if self._num_tx_channels_enabled == 1:
+            data_np = [data_np]
+
+        if len(data_np) != self._num_tx_channels_enabled:
+            raise Exception("Not enough data provided for channel mapping")
+
+        data_np = [np.asarray(chan) for chan in data_np]
+        data = np.empty((len(data_np[0]), self._tx_stride), dtype=np.int16)
+        for indx, chan in enumerate(data_np):
+            if self._complex_data:
+                self.__tx_convert(data[:, 2 * indx], np.real(chan))
+                self.__tx_convert(data[:, 2 * indx + 1], np.imag(chan))
+            else:
+                self.__tx_convert(data[:, indx], chan)
+        return data
 
-            if len(data_np) != self._num_tx_channels_enabled:
-                raise Exception("Not enough data provided for channel mapping")
+    def __tx_push(self, data: np.ndarray):
+        """Push sample interleaved bytes to the TX buffer, creating the
+        buffer on the first push
 
-            indx = 0
-            stride = self._num_tx_channels_enabled
-            data = np.empty(stride * len(data_np[0]), dtype=np.int16)
-            for chan in data_np:
-                data[indx::stride] = chan.astype(int)
-                indx = indx + 1
+        args: type=numpy.array
+            Contiguous, writable uint8 array with a whole number of samples
+        """
+        sample_size = 2 * self._tx_stride
+        if len(data) % sample_size:
+            raise Exception(
+                f"Data length of {len(data)} bytes is not a multiple of "
+                + f"the {sample_size} byte sample size"
+            )
 
         if not self.__txbuf:
             self.disable_dds()
-            self._tx_buffer_size = len(data) // stride
+            self._tx_buffer_size = len(data) // sample_size
             self._tx_init_channels()
 
-        if len(data) // stride != self._tx_buffer_size:
+        if len(data) // sample_size != self._tx_buffer_size:
             raise Exception(
                 "Buffer length different than data length. "
                 "Cannot change buffer length on the fly"
@@ -522,13 +1559,79 @@ class tx(dds, rx_tx_common):
 
         # Send data to buffer
         if self._push_to_file:
-            f = open(self._output_byte_filename, "ab")
-            f.write(bytearray(data))
-            f.close()
+            self.__tx_file_write(data)
         else:
-            self.__txbuf.write(bytearray(data))
+            self.__txbuf.write(data)
             self.__txbuf.push()
 
+    def tx_raw(self, data: Union[np.ndarray, memoryview, bytes, bytearray]):
+        """Transmit already interleaved int16 data to hardware buffers
+
+        Data must hold the samples of all enabled channels interleaved in
+        the order used by the hardware, with I before Q for complex data
+        devices. Writable contiguous input is passed to the buffer without
+        any copies.
+
+        args: type=numpy.array, memoryview or bytes
+            int16 samples, either flat or of shape (samples, components),
+            or the equivalent raw bytes
+        """
+        self.__tx_check_push()
+        if isinstance(data, np.ndarray):
+            if data.dtype != np.int16:
+                raise Exception("tx_raw data must be of type int16")
+            data = np.ascontiguousarray(data).reshape(-1).view(np.uint8)
+        else:
+            data = np.frombuffer(data, dtype=np.uint8)
+        if not data.flags.writeable:
+            # libiio wraps the source with ctypes, which needs writable memory
+            data = data.copy()
+        self.__tx_push(data)
+
+    def tx(self, data_np=None):
+        """Transmit data to hardware buffers for each channel index in
+        tx_enabled_channels.
+
+        args: type=numpy.array or list of numpy.array
+            An array or list of arrays when more than one transmit channel
+            is enabled containing samples from a channel or set of channels.
+            Data must be complex when using a complex data device.
+        """
+        if not self.__tx_enabled_channels and data_np:
+            raise Exception(
+                "When tx_enabled_channels is None or empty,"
+                + " the input to tx() must be None or empty or not provided"
+            )
+        if not self.__tx_enabled_channels:
+            # Set TX DAC to zero source
+            for chan in self._txdac.channels:
+                if chan.output:
+                    chan.attrs["raw"].value = "0"
+                    return
+            raise Exception("No DDS channels found for TX, TX zeroing does not apply")
+
+        key = None
+        if self.tx_cyclic_buffer and self._tx_cyclic_cache_size:
+            key = self.__tx_cache_key(data_np)
+            if self.__txbuf and key == self.__tx_loaded_key:
+                return  # Waveform is already being transmitted
+            if self.__tx_cyclic_cache is None:
+                self.__tx_cyclic_cache = OrderedDict()
+
+        self.__tx_check_push()
+        if key is None:
+            data = self._tx_pack(data_np)
+        elif key in self.__tx_cyclic_cache:
+            data = self.__tx_cyclic_cache[key]
+            self.__tx_cyclic_cache.move_to_end(key)
+        else:
+            data = self._tx_pack(data_np)
+            self.__tx_cyclic_cache[key] = data
+            if len(self.__tx_cyclic_cache) > self._tx_cyclic_cache_size:
+                self.__tx_cyclic_cache.popitem(last=False)
+        self.__tx_push(data.reshape(-1).view(np.uint8))
+        self.__tx_loaded_key = key
+
 
 class rx_tx(rx, tx, phy):
     def __init__(self):
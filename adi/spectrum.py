@@ -0,0 +1,476 @@
+# Copyright (C) 2026 Analog Devices, Inc.
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#     - Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#     - Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in
+#       the documentation and/or other materials provided with the
+#       distribution.
+#     - Neither the name of Analog Devices, Inc. nor the names of its
+#       contributors may be used to endorse or promote products derived
+#       from this software without specific prior written permission.
+#     - The use of this software may or may not infringe the patent rights
+#       of one or more patent holders.  This license does not release you
+#       from the requirement that you obtain separate licenses from these
+#       patent holders to use this software.
+#     - Use of the software either in source or binary form, must be run
+#       on or directly connected to an Analog Devices Inc. component.
+#
+# THIS SOFTWARE IS PROVIDED BY ANALOG DEVICES "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, NON-INFRINGEMENT, MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED.
+#
+# IN NO EVENT SHALL ANALOG DEVICES BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, INTELLECTUAL PROPERTY
+# RIGHTS, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF
+# THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import functools
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+_windows = {
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+    "bartlett": np.bartlett,
+    "rect": np.ones,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def get_window(name: str, size: int) -> np.ndarray:
+    """Window function of a given size. Results are cached and read-only
+
+    args:
+        name: type=string
+            Window function: hann, hamming, blackman, bartlett or rect
+        size: type=int
+            Number of samples
+
+    returns: type=numpy.array
+        Window coefficients
+    """
+    if name not in _windows:
+        raise ValueError(
+            f"Invalid window: {name}. Must be one of " + ", ".join(_windows)
+        )
+    w = _windows[name](size)
+    w.flags.writeable = False
+    return w
+
+
+@functools.lru_cache(maxsize=32)
+def frequencies(size: int, sample_rate=1.0, onesided=False, shift=False):
+    """Frequencies of FFT bins. Results are cached and read-only
+
+    args:
+        size: type=int
+            FFT size
+        sample_rate: type=float
+            Sample rate in samples per second
+        onesided: type=bool
+            Bins of a real input FFT from DC to Nyquist, as numpy.fft.rfftfreq
+        shift: type=bool
+            Order bins from negative to positive frequencies, as
+            numpy.fft.fftshift. Ignored when onesided
+
+    returns: type=numpy.array
+        Frequency of each bin in Hz
+    """
+    if onesided:
+        f = np.fft.rfftfreq(size, 1 / sample_rate)
+    else:
+        f = np.fft.fftfreq(size, 1 / sample_rate)
+        if shift:
+            f = np.fft.fftshift(f)
+    f.flags.writeable = False
+    return f
+
+
+def full_scale(dev) -> float:
+    """Full scale amplitude of raw samples of a receive device, from the bit
+    width of its first enabled channel
+
+    args:
+        dev: type=adi.rx_tx.rx
+            Receive device
+
+    returns: type=float
+        Largest sample magnitude, e.g. 2**15 for signed 16 bit data
+    """
+    m = dev.rx_enabled_channels[0]
+    name = dev._rx_channel_names[2 * m if dev._complex_data else m]
+    df = dev._find_channel(dev._rxadc, name).data_format
+    return 2.0 ** (df.bits - 1 if df.is_signed else df.bits)
+
+
+def _segments(x: np.ndarray, leftover, size: int, step: int):
+    """Split the last axis of x, after samples left over from the previous
+    buffer, into segments of size samples every step samples. Returns the
+    segments as a strided view and the samples to keep for the next buffer
+    """
+    if leftover is not None and leftover.shape[-1]:
+        x = np.concatenate((leftover, x), axis=-1)
+    x = np.ascontiguousarray(x)
+    n_seg = max((x.shape[-1] - size) // step + 1, 0)
+    segments = as_strided(
+        x,
+        shape=x.shape[:-1] + (n_seg, size),
+        strides=x.strides[:-1] + (x.strides[-1] * step, x.strides[-1]),
+        writeable=False,
+    )
+    return segments, x[..., n_seg * step :].copy()
+
+
+def _power(segments: np.ndarray, w: np.ndarray, onesided: bool) -> np.ndarray:
+    """Squared magnitude of the windowed FFT of all segments in one call.
+    Complex data is ordered from negative to positive frequencies
+    """
+    if onesided:
+        spec = np.fft.rfft(segments * w, axis=-1)
+    else:
+        spec = np.fft.fftshift(np.fft.fft(segments * w, axis=-1), -1)
+    return spec.real ** 2 + spec.imag ** 2
+
+
+class welch:
+    """Averaged power spectrum of streaming buffers using Welch's method
+
+    Buffers passed to update() are split into segments of size samples that
+    overlap by the given fraction. All segments of all channels of a buffer
+    are windowed and transformed in one FFT call and folded into a running
+    average. Samples that do not complete a segment are kept for the next
+    buffer. Windows and bin frequencies are computed once per size.
+
+    Power is normalized so a tone at full scale, complex or real, reads
+    0 dBFS with spectrum scaling. With density scaling, power is given per Hz.
+
+    parameters:
+        size: type=int
+            Number of samples per segment and FFT size
+        overlap: type=float
+            Fraction of a segment shared with the next one, in [0, 1)
+        window: type=string
+            Window function: hann, hamming, blackman, bartlett or rect
+        averaging: type=string
+            linear: Mean of all segments since the last reset.
+            exponential: Each segment is weighted by alpha and older
+            segments decay by 1 - alpha
+        alpha: type=float
+            Weight of the newest segment for exponential averaging
+        sample_rate: type=float
+            Sample rate in samples per second, used for frequencies and
+            density scaling
+        full_scale: type=float
+            Sample magnitude that reads 0 dBFS
+        scaling: type=string
+            spectrum or density
+    """
+
+    def __init__(
+        self,
+        size,
+        overlap=0.5,
+        window="hann",
+        averaging="linear",
+        alpha=0.1,
+        sample_rate=1.0,
+        full_scale=2 ** 15,
+        scaling="spectrum",
+    ):
+        if not 0 <= overlap < 1:
+            raise ValueError("overlap must be in [0, 1)")
+        if averaging not in ["linear", "exponential"]:
+            raise ValueError(
+                f"Invalid averaging: {averaging}. Must be linear or exponential"
+            )
+        if scaling not in ["spectrum", "density"]:
+            raise ValueError(f"Invalid scaling: {scaling}. Must be spectrum or density")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.size = size
+        self.step = max(int(round(size * (1 - overlap))), 1)
+        self.window_name = window
+        self.averaging = averaging
+        self.alpha = alpha
+        self.sample_rate = sample_rate
+        self.full_scale = full_scale
+        self.scaling = scaling
+        self._window = get_window(window, size)
+        self.reset()
+
+    @classmethod
+    def from_device(cls, dev, size, **kwargs):
+        """Create an engine for the receive data of a device. sample_rate and
+        full_scale default to the device sample rate and bit width
+
+        args:
+            dev: type=adi.rx_tx.rx
+                Receive device
+            size: type=int
+                Number of samples per segment and FFT size
+            kwargs:
+                Other parameters of welch
+        """
+        if "sample_rate" not in kwargs and hasattr(dev, "sample_rate"):
+            kwargs["sample_rate"] = float(dev.sample_rate)
+        if "full_scale" not in kwargs:
+            kwargs["full_scale"] = full_scale(dev)
+        return cls(size, **kwargs)
+
+    def reset(self):
+        """Clear the average and any samples kept from the last buffer"""
+        self._power = None
+        self._leftover = None
+        self._single = False
+        self._onesided = None
+        self.n_averaged = 0
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """frequencies: Frequency of each bin in Hz. Complex data is ordered
+        from negative to positive frequencies, real data from DC to Nyquist
+        """
+        onesided = bool(self._onesided)
+        return frequencies(self.size, self.sample_rate, onesided, not onesided)
+
+    @property
+    def power(self) -> np.ndarray:
+        """power: Averaged power per bin relative to full scale, one row per
+        channel. None before the first segment
+        """
+        if self._power is None:
+            return None
+        return self._power[0] if self._single else self._power
+
+    @property
+    def dbfs(self) -> np.ndarray:
+        """dbfs: Averaged power per bin in dBFS, one row per channel"""
+        p = self.power
+        return None if p is None else 10 * np.log10(p + 1e-30)
+
+    def _scale(self) -> float:
+        w = self._window
+        if self.scaling == "density":
+            s = 1 / (self.sample_rate * np.sum(w * w))
+        else:
+            s = 1 / np.sum(w) ** 2
+        return s / self.full_scale ** 2
+
+    def update(self, data) -> int:
+        """Add the segments of a buffer to the average
+
+        args:
+            data: type=numpy.array or list of numpy.array
+                Samples of one channel or one row or array per channel, as
+                returned by rx()
+
+        returns: type=int
+            Number of segments added
+        """
+        x = np.stack(data) if isinstance(data, list) else np.asarray(data)
+        single = x.ndim == 1
+        if single:
+            x = x[np.newaxis]
+        if self._onesided is None:
+            self._onesided = not np.iscomplexobj(x)
+            self._single = single
+        segments, self._leftover = _segments(x, self._leftover, self.size, self.step)
+        n_seg = segments.shape[1]
+        if n_seg == 0:
+            return 0
+
+        p = _power(segments, self._window, self._onesided)
+        p *= self._scale()
+        if self._onesided:
+            # Fold negative frequencies into the positive bins. For spectrum
+            # scaling a real tone is referenced to the power of a full scale
+            # sine wave instead of a full scale complex tone
+            p[..., 1 : (self.size + 1) // 2] *= 4 if self.scaling == "spectrum" else 2
+
+        if self.averaging == "linear":
+            total = p.sum(axis=1)
+            n = self.n_averaged
+            if self._power is None:
+                self._power = total / n_seg
+            else:
+                self._power = (self._power * n + total) / (n + n_seg)
+        else:
+            a = self.alpha
+            if self._power is None:
+                # Start from the first segment instead of from zero
+                self._power = p[:, 0]
+                p = p[:, 1:]
+            k = p.shape[1]
+            weights = a * (1 - a) ** np.arange(k - 1, -1, -1)
+            self._power = self._power * (1 - a) ** k + np.tensordot(
+                weights, p, axes=([0], [1])
+            )
+        self.n_averaged += n_seg
+        return n_seg
+
+
+class spectrogram:
+    """Waterfall of power spectra kept in a fixed amount of memory
+
+    Buffers passed to update() are split into segments, transformed in one
+    FFT call per buffer and written as rows in dBFS into a ring of n_rows
+    rows. Each row is stored twice, at its slot and n_rows slots later, so
+    the latest n_rows rows ordered from oldest to newest are always a
+    contiguous slice of the ring and rows can be read without copying.
+    Memory use does not grow with the length of a run.
+
+    parameters:
+        size: type=int
+            Number of samples per segment and FFT size
+        n_rows: type=int
+            Number of rows kept
+        overlap: type=float
+            Fraction of a segment shared with the next one, in [0, 1)
+        window: type=string
+            Window function: hann, hamming, blackman, bartlett or rect
+        average: type=int
+            Number of consecutive segments averaged into each row
+        sample_rate: type=float
+            Sample rate in samples per second
+        full_scale: type=float
+            Sample magnitude that reads 0 dBFS
+        floor: type=float
+            Value in dBFS of rows not written yet
+        dtype: type=numpy.dtype
+            Data type of the ring
+    """
+
+    def __init__(
+        self,
+        size,
+        n_rows,
+        overlap=0.0,
+        window="hann",
+        average=1,
+        sample_rate=1.0,
+        full_scale=2 ** 15,
+        floor=-200.0,
+        dtype=np.float32,
+    ):
+        if not 0 <= overlap < 1:
+            raise ValueError("overlap must be in [0, 1)")
+        if n_rows < 1 or average < 1:
+            raise ValueError("n_rows and average must be at least 1")
+        self.size = size
+        self.n_rows = n_rows
+        self.step = max(int(round(size * (1 - overlap))), 1)
+        self.average = average
+        self.sample_rate = sample_rate
+        self.full_scale = full_scale
+        self.floor = floor
+        self.dtype = np.dtype(dtype)
+        self._window = get_window(window, size)
+        self.reset()
+
+    @classmethod
+    def from_device(cls, dev, size, n_rows, **kwargs):
+        """Create a spectrogram for the receive data of a device. sample_rate
+        and full_scale default to the device sample rate and bit width
+
+        args:
+            dev: type=adi.rx_tx.rx
+                Receive device
+            size: type=int
+                Number of samples per segment and FFT size
+            n_rows: type=int
+                Number of rows kept
+            kwargs:
+                Other parameters of spectrogram
+        """
+        if "sample_rate" not in kwargs and hasattr(dev, "sample_rate"):
+            kwargs["sample_rate"] = float(dev.sample_rate)
+        if "full_scale" not in kwargs:
+            kwargs["full_scale"] = full_scale(dev)
+        return cls(size, n_rows, **kwargs)
+
+    def reset(self):
+        """Clear all rows and any samples kept from the last buffer"""
+        self._ring = None
+        self._leftover = None
+        self._pending = None
+        self._onesided = None
+        self.n_total = 0
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """frequencies: Frequency of each column in Hz. Complex data is ordered
+        from negative to positive frequencies, real data from DC to Nyquist
+        """
+        onesided = bool(self._onesided)
+        return frequencies(self.size, self.sample_rate, onesided, not onesided)
+
+    @property
+    def rows(self) -> np.ndarray:
+        """rows: Read-only view of the latest n_rows rows in dBFS, oldest
+        first. The view is only valid until the next update. Copy it to keep
+        it longer. None before the first buffer
+        """
+        if self._ring is None:
+            return None
+        start = self.n_total % self.n_rows
+        view = self._ring[start : start + self.n_rows]
+        view.flags.writeable = False
+        return view
+
+    def _scale(self) -> float:
+        return 1 / (np.sum(self._window) ** 2 * self.full_scale ** 2)
+
+    def update(self, data: np.ndarray) -> int:
+        """Add the spectra of a buffer as new rows
+
+        args:
+            data: type=numpy.array
+                Samples of one channel
+
+        returns: type=int
+            Number of rows added
+        """
+        x = np.asarray(data)
+        if x.ndim != 1:
+            raise ValueError("spectrogram takes the samples of one channel")
+        if self._ring is None:
+            self._onesided = not np.iscomplexobj(x)
+            n_bins = self.size // 2 + 1 if self._onesided else self.size
+            self._ring = np.full(
+                (2 * self.n_rows, n_bins), self.floor, dtype=self.dtype
+            )
+        segments, self._leftover = _segments(x, self._leftover, self.size, self.step)
+        if len(segments) == 0:
+            return 0
+        p = _power(segments, self._window, self._onesided)
+        p *= self._scale()
+        if self._onesided:
+            # Real tones are referenced to a full scale sine, as in welch
+            p[..., 1 : (self.size + 1) // 2] *= 4
+
+        # Segments of an incomplete row wait for the next buffer
+        if self._pending is not None:
+            p = np.concatenate((self._pending, p))
+        n_new = len(p) // self.average
+        self._pending = p[n_new * self.average :]
+        if n_new == 0:
+            return 0
+        p = p[: n_new * self.average].reshape(n_new, self.average, -1).mean(axis=1)
+
+        # Older rows of this update would be overwritten anyway
+        skip = max(n_new - self.n_rows, 0)
+        idx = (self.n_total + np.arange(skip, n_new)) % self.n_rows
+        rows = 10 * np.log10(p[skip:] + 1e-30)
+        self._ring[idx] = rows
+        self._ring[idx + self.n_rows] = rows
+        self.n_total += n_new
+        return n_new
@@ -0,0 +1,470 @@
+# Copyright (C) 2026 Analog Devices, Inc.
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#     - Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#     - Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in
+#       the documentation and/or other materials provided with the
+#       distribution.
+#     - Neither the name of Analog Devices, Inc. nor the names of its
+#       contributors may be used to endorse or promote products derived
+#       from this software without specific prior written permission.
+#     - The use of this software may or may not infringe the patent rights
+#       of one or more patent holders.  This license does not release you
+#       from the requirement that you obtain separate licenses from these
+#       patent holders to use this software.
+#     - Use of the software either in source or binary form, must be run
+#       on or directly connected to an Analog Devices Inc. component.
+#
+# THIS SOFTWARE IS PROVIDED BY ANALOG DEVICES "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, NON-INFRINGEMENT, MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED.
+#
+# IN NO EVENT SHALL ANALOG DEVICES BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, INTELLECTUAL PROPERTY
+# RIGHTS, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF
+# THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import queue
+import threading
+import time
+
+import numpy as np
+
+
+class capture_worker:
+    """Capture RX buffers on a background thread into a preallocated ring
+
+    A dedicated thread keeps refilling the RX buffer of a device and writes
+    each block into the next free slot of a ring of numpy arrays. Consumers
+    take completed blocks with get() and hand them back with release(). Blocks
+    are views of the ring, so no data is copied after the refill. When the
+    consumer falls behind and the ring is full, new blocks are dropped and
+    counted in dropped_blocks.
+
+    parameters:
+        dev: type=adi.rx_tx.rx
+            Device to capture from. rx_enabled_channels and rx_buffer_size
+            must be set before starting and not changed while running
+        n_blocks: type=int
+            Number of blocks in the ring
+        raw: type=bool
+            Store the raw interleaved bytes of each buffer instead of one row
+            of samples per enabled channel
+        dtype: type=numpy.dtype
+            Sample type of the ring when not raw. Defaults to rx_complex_dtype
+            for complex data devices and the device data type otherwise. With
+            iq_int16 the ring holds one row per I and Q component
+        check_overflow: type=bool
+            Check the DMA status register after each refill and count
+            overflows in overflows. Only enable this for devices whose RX
+            data is moved by an AXI DMAC
+        max_refills: type=int
+            Stop capturing after this many refills. None captures until
+            stopped
+    """
+
+    _n_latencies = 4096
+
+    def __init__(
+        self,
+        dev,
+        n_blocks=8,
+        raw=False,
+        dtype=None,
+        check_overflow=False,
+        max_refills=None,
+    ):
+        if n_blocks < 1:
+            raise ValueError("n_blocks must be at least 1")
+        self._dev = dev
+        self._max_refills = max_refills
+        self._n_blocks = n_blocks
+        self._raw = raw
+        self._dtype = dtype
+        self._check_overflow = check_overflow
+        self._overflow_checks = False
+        self._ring = None
+        self._scratch = None
+        self._thread = None
+        self._running = False
+        self._ready = threading.Event()
+        self._error = None
+        self._head = 0  # Next slot written, only changed by the capture thread
+        self._tail = 0  # Oldest unreleased slot, only changed by the consumer
+        self._pending = False
+        self.dropped_blocks = 0
+        self.overflows = 0
+        self._latencies = np.zeros(self._n_latencies)
+        self._n_refills = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def __iter__(self):
+        while True:
+            block = self.get()
+            if block is None:
+                return
+            yield block
+            self.release()
+
+    @property
+    def running(self) -> bool:
+        """running: True while the capture thread is active"""
+        return self._running
+
+    @property
+    def block_shape(self) -> tuple:
+        """block_shape: Shape of each block, known once started"""
+        return None if self._ring is None else self._ring.shape[1:]
+
+    @property
+    def available(self) -> int:
+        """available: Number of completed blocks not yet taken by get()"""
+        return self._head - self._tail - self._pending
+
+    def _allocate(self):
+        dev = self._dev
+        if self._raw:
+            # Buffer size in bytes is only known once the buffer exists
+            shape = (len(dev._rx_refill_raw()),)
+            dtype = np.uint8
+        else:
+            shape = (len(dev.rx_enabled_channels), dev.rx_buffer_size)
+            if dev._complex_data and dev.rx_complex_dtype == "iq_int16":
+                # One row per I and Q component
+                shape = (2 * shape[0], shape[1])
+            if self._dtype is not None:
+                dtype = self._dtype
+            elif dev._complex_data and dev.rx_complex_dtype != "iq_int16":
+                dtype = dev.rx_complex_dtype
+            else:
+                dtype = dev._rx_data_type
+        self._ring = self._new_ring((self._n_blocks,) + shape, dtype)
+        self._scratch = np.zeros(shape, dtype=dtype)
+
+    def _new_ring(self, shape: tuple, dtype) -> np.ndarray:
+        """Allocate the ring. Subclasses can place it in other memory"""
+        return np.zeros(shape, dtype=dtype)
+
+    def start(self):
+        """Allocate the ring and start the capture thread"""
+        if self._running:
+            return
+        self._allocate()
+        self._head = self._tail = 0
+        self._pending = False
+        self._error = None
+        self.dropped_blocks = 0
+        self.overflows = 0
+        self._n_refills = 0
+        self._overflow_checks = self._dev._rx_overflow_check_start(self._check_overflow)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the capture thread. Completed blocks remain available"""
+        self._running = False
+        thread, self._thread = self._thread, None
+        if thread and thread is not threading.current_thread():
+            thread.join()
+        self._ready.set()
+
+    def _run(self):
+        dev = self._dev
+        try:
+            while self._running and (
+                self._max_refills is None or self._n_refills < self._max_refills
+            ):
+                full = self._head - self._tail >= self._n_blocks
+                block = (
+                    self._scratch if full else self._ring[self._head % self._n_blocks]
+                )
+                start = time.perf_counter()
+                if self._raw:
+                    np.copyto(block, dev._rx_refill_raw())
+                else:
+                    dev.rx_into(block)
+                self._latencies[self._n_refills % self._n_latencies] = (
+                    time.perf_counter() - start
+                )
+                self._n_refills += 1
+                if self._overflow_checks and dev._rx_dma_overflow():
+                    self.overflows += 1
+                if full:
+                    self.dropped_blocks += 1
+                else:
+                    self._head += 1
+                    self._ready.set()
+        except Exception as ex:
+            self._error = ex
+        finally:
+            self._running = False
+            self._ready.set()
+
+    def get(self, timeout=None):
+        """Take the oldest completed block
+
+        The returned array is a view of the ring and stays valid until
+        release() is called. Only one block can be held at a time.
+
+        parameters:
+            timeout: type=float
+                Seconds to wait for a block. None waits until one is available
+
+        returns: type=numpy.array
+            Block of samples, with one row per enabled channel unless raw, or
+            None if no block became available
+        """
+        if self._pending:
+            raise Exception("Previous block must be released before getting another")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._ready.clear()
+            if self._head != self._tail:
+                break
+            if self._error:
+                raise self._error
+            if not self._running:
+                return None
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self._ready.wait(remaining)
+        self._pending = True
+        return self._ring[self._tail % self._n_blocks]
+
+    def release(self):
+        """Return the block taken by get() to the ring"""
+        if self._pending:
+            self._pending = False
+            self._tail += 1
+
+    def latency_percentiles(self, q=(50, 90, 99)):
+        """Refill latency percentiles over the most recent refills
+
+        parameters:
+            q: type=list
+                Percentiles to compute
+
+        returns: type=numpy.array
+            Refill latencies in seconds for each requested percentile
+        """
+        n = min(self._n_refills, self._n_latencies)
+        if not n:
+            return np.full(len(q), np.nan)
+        return np.percentile(self._latencies[:n], q)
+
+
+class tx_streamer:
+    """Transmit blocks from an iterable continuously on background threads
+
+    One thread takes blocks from the source and packs them to interleaved
+    int16 data, keeping up to n_prefetch blocks ready. A second thread pushes
+    them to a non-cyclic TX buffer. Pushes block while all kernel buffers are
+    queued, so the hardware always has data waiting as long as the source
+    keeps up. Underflows reported by the DMA are counted in underflows, and
+    pushes that had to wait for the source are counted in starved.
+
+    parameters:
+        dev: type=adi.rx_tx.tx
+            Device to transmit on. tx_enabled_channels must be set before
+            starting and not changed while running
+        source: type=iterable
+            Blocks in the form accepted by tx(), or by tx_raw() when raw is
+            set. All blocks must have the same number of samples
+        n_prefetch: type=int
+            Number of packed blocks kept ready ahead of the pushes
+        kernel_buffers: type=int
+            Number of kernel buffers the driver keeps queued, see
+            tx_kernel_buffers. None keeps the current setting
+        raw: type=bool
+            Blocks are already interleaved int16 data
+        check_underflow: type=bool
+            Check the DMA status register after each push and count
+            underflows in underflows
+    """
+
+    _poll_interval = 0.1
+
+    def __init__(
+        self,
+        dev,
+        source,
+        n_prefetch=4,
+        kernel_buffers=4,
+        raw=False,
+        check_underflow=True,
+    ):
+        if n_prefetch < 1:
+            raise ValueError("n_prefetch must be at least 1")
+        self._dev = dev
+        self._source = source
+        self._n_prefetch = n_prefetch
+        self._kernel_buffers = kernel_buffers
+        self._raw = raw
+        self._check_underflow = check_underflow
+        self._queue = None
+        self._threads = []
+        self._running = False
+        self._error = None
+        self.pushed_blocks = 0
+        self.pushed_samples = 0
+        self.underflows = 0
+        self.starved = 0
+        self._start_time = None
+        self._end_time = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """running: True until the source is exhausted or the streamer stopped"""
+        return self._running
+
+    @property
+    def rate(self):
+        """rate: Average rate in samples per second at which blocks were
+        pushed, measured from the first push. None before the second push
+        """
+        if self._start_time is None or self.pushed_blocks < 2:
+            return None
+        end = self._end_time if self._end_time is not None else time.perf_counter()
+        if end <= self._start_time:
+            return None
+        samples = self.pushed_samples * (self.pushed_blocks - 1) / self.pushed_blocks
+        return samples / (end - self._start_time)
+
+    def start(self):
+        """Start the packing and pushing threads"""
+        if self._running:
+            return
+        dev = self._dev
+        if dev.tx_cyclic_buffer:
+            raise Exception("tx_streamer requires tx_cyclic_buffer to be False")
+        if self._kernel_buffers is not None:
+            dev.tx_kernel_buffers = self._kernel_buffers
+        self._queue = queue.Queue(self._n_prefetch)
+        self._error = None
+        self.pushed_blocks = 0
+        self.pushed_samples = 0
+        self.underflows = 0
+        self.starved = 0
+        self._start_time = self._end_time = None
+        if self._check_underflow:
+            # Clears stale flags and detects if the register can be used at all
+            self._check_underflow = dev._tx_dma_underflow() is not None
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._pack, daemon=True),
+            threading.Thread(target=self._push, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Stop streaming. Blocks not yet pushed are discarded"""
+        self._running = False
+        self._join()
+
+    def wait(self, timeout=None):
+        """Wait until every block of the source has been pushed
+
+        parameters:
+            timeout: type=float
+                Seconds to wait. None waits until the source is exhausted
+
+        returns: type=bool
+            True if streaming finished
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            thread.join(remaining if remaining is None else max(remaining, 0))
+        done = not any(thread.is_alive() for thread in self._threads)
+        if done and self._error:
+            error, self._error = self._error, None
+            raise error
+        return done
+
+    def _join(self):
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+
+    def _put(self, item) -> bool:
+        while self._running:
+            try:
+                self._queue.put(item, timeout=self._poll_interval)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self):
+        while self._running:
+            try:
+                return self._queue.get(timeout=self._poll_interval)
+            except queue.Empty:
+                continue
+        return None
+
+    def _pack(self):
+        try:
+            for block in self._source:
+                if not self._running:
+                    return
+                if not self._raw:
+                    block = self._dev._tx_pack(block)
+                if not self._put(block):
+                    return
+        except Exception as ex:
+            self._error = ex
+            self._running = False
+        self._put(None)
+
+    def _push(self):
+        dev = self._dev
+        try:
+            while self._running:
+                try:
+                    block = self._queue.get_nowait()
+                except queue.Empty:
+                    if self.pushed_blocks:
+                        self.starved += 1
+                    block = self._get()
+                if block is None:
+                    break
+                dev.tx_raw(block)
+                if self._start_time is None:
+                    # Rate is measured from the end of the first push
+                    self._start_time = time.perf_counter()
+                self.pushed_blocks += 1
+                self.pushed_samples += dev._tx_buffer_size
+                if self._check_underflow and dev._tx_dma_underflow():
+                    self.underflows += 1
+        except Exception as ex:
+            self._error = ex
+        finally:
+            self._end_time = time.perf_counter()
+            self._running = False
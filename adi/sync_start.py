@@ -71,7 +71,7 @@ class sync_start(attribute):
         try:
             self._set_iio_dev_attr_str("sync_start_enable", value, _ctrl=self._txdac)
         except:  # noqa: E722
-            chan = self._txdac.find_channel("altvoltage0", True)
+            chan = self._find_channel(self._txdac, "altvoltage0", True)
             chan.attrs["raw"].value = "1"
 
     @property
@@ -46,6 +46,11 @@ def update_devs():
         "jesd_internal",
         "sync_start",
         "dsp",
+        "stream",
+        "recorder",
+        "pipeline",
+        "spectrum",
+        "parallel",
     ]
     adi_rst_path = os.path.join(root, "source", "devices", "adi.rst")
     with open(adi_rst_path, "r") as f:
@@ -1,12 +1,11 @@
 import argparse
 import sys
-import threading
 import time
-from queue import Full, Queue
 
 import adi
 import numpy as np
 import pyqtgraph as pg
+from adi.stream import capture_worker
 from PyQt5 import QtGui
 from pyqtgraph.Qt import QtCore, QtGui
 from scipy import signal
@@ -19,7 +18,6 @@ class ADIPlotter(object):
     def __init__(self, classname, uri):
 
         self.classname = classname
-        self.q = Queue(maxsize=20)
         self.stream = eval("adi." + classname + "(uri='" + uri + "')")
         self.stream.sample_rate = 10000000
         if REAL_DEV_NAME not in classname.lower():
@@ -70,18 +68,8 @@ class ADIPlotter(object):
         self.min = -100
         self.window = signal.kaiser(self.stream.rx_buffer_size, beta=38)
 
-        self.run_source = True
-        self.thread = threading.Thread(target=self.source)
-        self.thread.start()
-
-    def source(self):
-        print("Thread running")
-        while self.run_source:
-            data = self.stream.rx()
-            try:
-                self.q.put(data, block=False, timeout=4)
-            except Full:
-                continue
+        self.worker = capture_worker(self.stream, n_blocks=20)
+        self.worker.start()
 
     def start(self):
         if (sys.flags.interactive != 1) or not hasattr(QtCore, "PYQT_VERSION"):
@@ -112,8 +100,8 @@ class ADIPlotter(object):
                 )
 
     def update(self):
-        while not self.q.empty():
-            wf_data = self.q.get()
+        while self.worker.available:
+            wf_data = self.worker.get()[0]
             self.set_plotdata(
                 name="waveform", data_x=self.x, data_y=np.real(wf_data),
             )
@@ -121,13 +109,14 @@ class ADIPlotter(object):
             sp_data = np.abs(np.fft.fftshift(sp_data)) / self.stream.rx_buffer_size
             sp_data = 20 * np.log10(sp_data / (2 ** 11))
             self.set_plotdata(name="spectrum", data_x=self.f, data_y=sp_data)
+            self.worker.release()
 
     def animation(self):
         timer = QtCore.QTimer()
         timer.timeout.connect(self.update)
         timer.start(1)
         self.start()
-        self.run_source = False
+        self.worker.stop()
 
 
 if __name__ == "__main__":
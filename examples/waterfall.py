@@ -4,7 +4,7 @@
 import adi
 import numpy as np
 import pygame
-from matplotlib import mlab as mlab
+from adi.spectrum import spectrogram
 from PIL import Image
 
 DISPLAY_WIDTH = 256
@@ -21,40 +21,18 @@ sdr.dds_enabled = [1, 1, 1, 1]
 sdr.dds_frequencies = [1e6, 1e6, 1e6, 1e6]
 sdr.dds_scales = [1, 1, 0, 0]
 
-image = []
+# Keep one row of 1024 bins per buffer, averaged over its 16 segments
+waterfall = spectrogram.from_device(sdr, 1024, DISPLAY_HEIGHT, average=16)
 
 
 def get_data():
-    samples = sdr.rx()
-    power, _ = mlab.psd(samples, NFFT=1024, Fs=int(sdr.sample_rate) / 1e6)
-
-    max_pow = 0
-    min_pow = 10
-
-    # search whole data set for maximum and minimum value
-    for dat in power:
-        if dat > max_pow:
-            max_pow = dat
-        elif dat < min_pow:
-            min_pow = dat
-
-    # update image data
-    imagelist = []
-    for dat in power:
-        imagelist.append(mymap(dat, min_pow, max_pow, 0, 255))
-    image.append(
-        imagelist[
-            round(len(imagelist) / 2)
-            - round(len(imagelist) / 8) : round(len(imagelist) / 2)
-            + round(len(imagelist) / 8)
-        ]
-    )
-    if len(image) > 200:
-        image.pop(0)
-
-
-def mymap(x, in_min, in_max, out_min, out_max):
-    return int((x - in_min) * (out_max - out_min) / (in_max - in_min) + out_min)
+    waterfall.update(sdr.rx())
+    # Center quarter of the spectrum, oldest row at the top
+    rows = waterfall.rows[:, 384:640]
+    # Scale colors over the rows written so far, not the empty ones at the floor
+    filled = rows[-min(waterfall.n_total, len(rows)) :]
+    lo, hi = filled.min(), filled.max()
+    return (np.clip(rows - lo, 0, None) * (255 / max(hi - lo, 1e-9))).astype(np.ubyte)
 
 
 pygame.init()
@@ -75,9 +53,7 @@ while not game_quit:
         if event.type == pygame.QUIT:
             game_quit = True
 
-    get_data()
-    outimage = np.array(image, np.ubyte)
-    outimage = Image.fromarray(outimage, mode="L")
+    outimage = Image.fromarray(get_data(), mode="L")
     outimage = outimage.convert("RGBA")
     strFormat = "RGBA"
     raw_str = outimage.tobytes("raw", strFormat)
@@ -251,3 +251,111 @@ def attribute_write_only_str_with_depends(uri, classname, attr, value, depends):
     except Exception as e:
         del sdr
         raise Exception(e)
+
+
+def attribute_cache(uri, classname, attr, values, tol, repeats=10):
+    """attribute_cache: Read a class property repeatedly with the attribute
+    cache enabled and verify reads are served from the cache and writes are
+    read back
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        attr: type=string
+            Attribute name to be written. Must be property of classname
+        values: type=list
+            Values to write into attr property
+        tol: type=integer
+            Allowable error of written value compared to read back value
+        repeats: type=integer
+            Number of reads after each write
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.attr_cache = True
+    sdr.attr_cache_ttl = 60
+    try:
+        for value in values:
+            setattr(sdr, attr, value)
+            reads = [getattr(sdr, attr) for _ in range(repeats)]
+            assert all(abs(r - value) <= tol for r in reads)
+        stats = sdr.attr_cache_stats
+        del sdr
+    except Exception as e:
+        del sdr
+        raise Exception(e)
+    assert stats["hits"] >= len(values) * (repeats - 1)
+
+
+def attribute_batch(uri, classname, param_set):
+    """attribute_batch: Write a set of class properties in one batch, verify
+    they are read back, and verify a batch writing back the values just read
+    makes no writes
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        param_set: type=dict
+            Dictionary of attribute and values to be set
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    try:
+        with sdr.batch():
+            for p in param_set:
+                setattr(sdr, p, param_set[p])
+        first = sdr.batch_stats
+        with sdr.batch():
+            for p in param_set:
+                setattr(sdr, p, getattr(sdr, p))
+        second = sdr.batch_stats
+        values = {p: getattr(sdr, p) for p in param_set}
+        del sdr
+    except Exception as e:
+        del sdr
+        raise Exception(e)
+
+    assert first["requested"] == len(param_set)
+    for p, value in param_set.items():
+        if isinstance(value, str):
+            assert values[p] == value, p
+        else:
+            assert np.isclose(values[p], value, rtol=1e-3, atol=1), p
+    assert second["written"] == 0
+
+
+def attribute_snapshot_restore(uri, classname, param_set):
+    """attribute_snapshot_restore: Take a snapshot of the device state, change
+    a set of class properties, restore the snapshot and verify the properties
+    are back to their original values
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        param_set: type=dict
+            Dictionary of attribute and values to be set after the snapshot
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    try:
+        before = {p: getattr(sdr, p) for p in param_set}
+        snapshot = sdr.snapshot()
+        for p in param_set:
+            setattr(sdr, p, param_set[p])
+        stats = sdr.restore(snapshot)
+        after = {p: getattr(sdr, p) for p in param_set}
+        del sdr
+    except Exception as e:
+        del sdr
+        raise Exception(e)
+
+    changed = [p for p in param_set if param_set[p] != before[p]]
+    assert stats["written"] >= len(changed) > 0 or not changed
+    for p in param_set:
+        if isinstance(before[p], str):
+            assert after[p] == before[p], p
+        else:
+            assert np.isclose(after[p], before[p], rtol=1e-3, atol=1), p
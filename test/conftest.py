@@ -47,6 +47,11 @@ def test_stress_rx_buffer_length(request):
     yield stress_rx_buffer_length
 
 
+@pytest.fixture()
+def test_stress_rx_config_switch(request):
+    yield stress_rx_config_switch
+
+
 @pytest.fixture()
 def test_stress_rx_buffer_creation(request):
     yield stress_rx_buffer_creation
@@ -77,11 +82,81 @@ def test_attribute_single_value_pow2(request):
     yield attribute_single_value_pow2
 
 
+@pytest.fixture()
+def test_attribute_cache(request):
+    yield attribute_cache
+
+
+@pytest.fixture()
+def test_attribute_batch(request):
+    yield attribute_batch
+
+
+@pytest.fixture()
+def test_attribute_snapshot_restore(request):
+    yield attribute_snapshot_restore
+
+
 @pytest.fixture()
 def test_dma_rx(request):
     yield dma_rx
 
 
+@pytest.fixture()
+def test_dma_rx_unbuffered(request):
+    yield dma_rx_unbuffered
+
+
+@pytest.fixture()
+def test_dma_rx_into(request):
+    yield dma_rx_into
+
+
+@pytest.fixture()
+def test_dma_rx_burst(request):
+    yield dma_rx_burst
+
+
+@pytest.fixture()
+def test_dma_rx_stream(request):
+    yield dma_rx_stream
+
+
+@pytest.fixture()
+def test_dma_rx_pipeline(request):
+    yield dma_rx_pipeline
+
+
+@pytest.fixture()
+def test_dma_rx_spectrogram(request):
+    yield dma_rx_spectrogram
+
+
+@pytest.fixture()
+def test_dma_rx_process_pool(request):
+    yield dma_rx_process_pool
+
+
+@pytest.fixture()
+def test_dma_arx_stream(request):
+    yield dma_arx_stream
+
+
+@pytest.fixture()
+def test_dma_rx_record(request):
+    yield dma_rx_record
+
+
+@pytest.fixture()
+def test_dma_capture_worker(request):
+    yield dma_capture_worker
+
+
+@pytest.fixture()
+def test_dma_rx_complex_dtype(request):
+    yield dma_rx_complex_dtype
+
+
 @pytest.fixture()
 def test_dma_tx(request):
     yield dma_tx
@@ -97,6 +172,11 @@ def test_cyclic_buffer_exception(request):
     yield cyclic_buffer_exception
 
 
+@pytest.fixture()
+def test_cyclic_buffer_cache(request):
+    yield cyclic_buffer_cache
+
+
 @pytest.fixture()
 def test_dma_loopback(request):
     yield dma_loopback
@@ -169,11 +249,26 @@ def test_attribute_write_only_str(request):
     yield attribute_write_only_str
 
 
+@pytest.fixture()
+def test_dma_tx_raw(request):
+    yield dma_tx_raw
+
+
+@pytest.fixture()
+def test_dma_tx_file_sink(request):
+    yield dma_tx_file_sink
+
+
 @pytest.fixture()
 def test_dma_dac_zeros(request):
     yield dma_dac_zeros
 
 
+@pytest.fixture()
+def test_dds_spectrum_average(request):
+    yield dds_spectrum_average
+
+
 @pytest.fixture()
 def test_dds_two_tone(request):
     yield dds_two_tone
@@ -187,3 +282,13 @@ def test_verify_overflow(request):
 @pytest.fixture()
 def test_verify_underflow(request):
     yield verify_underflow
+
+
+@pytest.fixture()
+def test_dma_tx_stream(request):
+    yield dma_tx_stream
+
+
+@pytest.fixture()
+def test_dma_tx_from_file(request):
+    yield dma_tx_from_file
@@ -1,6 +1,11 @@
+import asyncio
 import heapq
+import json
+import os
+import tempfile
 import test.rf.spec as spec
 import time
+import tracemalloc
 
 import adi
 import numpy as np
@@ -71,6 +76,449 @@ def dma_rx(
     del sdr
 
 
+def dma_rx_unbuffered(uri, classname, channel, buffer_size, interval):
+    """dma_rx_unbuffered: Sample an unbuffered device at a fixed interval and
+    verify timestamps are increasing and the achieved rate is not above the
+    target rate
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        buffer_size: type=int
+            Number of samples to take
+        interval: type=float
+            Target time between samples in seconds
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = buffer_size
+    sdr.rx_unbuffered_interval = interval
+    try:
+        out = np.zeros((len(sdr.rx_enabled_channels), buffer_size))
+        sdr.rx_into(out)
+        stamps = sdr.rx_unbuffered_timestamps
+        rate = sdr.rx_unbuffered_rate
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+    print(f"Achieved sample rate: {rate} Hz")
+    assert len(stamps) == buffer_size
+    assert np.all(np.diff(stamps) > 0), "Timestamps not increasing"
+    assert rate <= 1 / interval * 1.01
+
+
+def dma_rx_into(uri, classname, channel, buffer_size=2 ** 15):
+    """dma_rx_into: Verify rx_into fills preallocated arrays and allocates less
+    memory per call than rx. Allocations are traced over 10 buffers for each
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        buffer_size: type=int
+            Size of RX buffer in samples. Defaults to 2**15
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = buffer_size
+    dtype = np.complex128 if sdr._complex_data else np.float64
+    out = np.zeros((len(sdr.rx_enabled_channels), buffer_size), dtype=dtype)
+
+    def traced(func):
+        tracemalloc.start()
+        for _ in range(10):
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    try:
+        sdr.rx()  # Create buffer outside of traced region
+        rx_peak = traced(sdr.rx)
+        rx_into_peak = traced(lambda: sdr.rx_into(out))
+        for chan in out:
+            assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+    print(f"Peak allocations rx: {rx_peak} bytes, rx_into: {rx_into_peak} bytes")
+    assert rx_into_peak < rx_peak / 4
+
+
+def dma_rx_burst(uri, classname, channel, buffer_size, total_samples):
+    """dma_rx_burst: Capture more samples than fit in one buffer with rx_burst
+    and verify the length of the output, that no overflows occur and that the
+    kernel buffer setting is restored
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        buffer_size: type=int
+            Size of each hardware buffer
+        total_samples: type=int
+            Number of samples to capture per channel
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = buffer_size
+    try:
+        kernel_buffers = sdr.rx_kernel_buffers
+        data = sdr.rx_burst(total_samples, check_overflow=True)
+        gaps = sdr.rx_burst_gaps
+        restored = sdr.rx_kernel_buffers == kernel_buffers
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+    data = data if isinstance(data, list) else [data]
+    for chan in data:
+        assert len(chan) == total_samples
+        assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+    assert not gaps, f"Overflows occurred before samples {gaps}"
+    assert restored, "rx_kernel_buffers not restored"
+
+
+def dma_rx_stream(uri, classname, channel, n_buffers, sample_rate):
+    """dma_rx_stream: Stream buffers from one persistent RX buffer and verify
+    data is non-zero and no overflows occur between buffers
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        n_buffers: type=int
+            Number of buffers to stream
+        sample_rate=int
+            Value to set sample rate of device in samples per second
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = 2 ** 16
+    # Set low rate so we can keep up
+    sdr.sample_rate = sample_rate
+    try:
+        count = 0
+        for data in sdr.rx_stream(n_buffers, kernel_buffers=8, check_overflow=True):
+            data = data if isinstance(data, list) else [data]
+            for chan in data:
+                assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+            count += 1
+        gaps = sdr.rx_stream_gaps
+        kernel_buffers = sdr.rx_kernel_buffers
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+    assert count == n_buffers
+    assert kernel_buffers == 8
+    assert not gaps, f"Overflows occurred before buffers {gaps}"
+
+
+def dma_rx_pipeline(uri, classname, channel, n_buffers, decimation):
+    """dma_rx_pipeline: Receive buffers through a DC removal and decimation
+    pipeline and verify the output length and that the DC offset is removed
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        n_buffers: type=int
+            Number of buffers to receive
+        decimation: type=int
+            Decimation factor of the pipeline
+    """
+    from adi.pipeline import dc_remove, decimator
+
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = 2 ** 14
+    sdr.rx_pipeline = [dc_remove(), decimator(decimation)]
+    try:
+        blocks = []
+        for data in sdr.rx_stream(n_buffers):
+            blocks.append(data if isinstance(data, list) else [data])
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+    del sdr
+
+    for chan in zip(*blocks):
+        out = np.concatenate(chan)
+        assert len(out) == n_buffers * 2 ** 14 // decimation
+        assert np.abs(np.mean(out)) < 0.1 * np.std(out), "DC offset not removed"
+
+
+def dma_rx_spectrogram(uri, classname, channel, n_buffers, n_rows):
+    """dma_rx_spectrogram: Stream more buffers into a spectrogram than it keeps
+    rows and verify only the latest rows are held and all were written
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=int
+            Channel to enable through rx_enabled_channels
+        n_buffers: type=int
+            Number of buffers to stream
+        n_rows: type=int
+            Number of rows of the spectrogram
+    """
+    from adi.spectrum import spectrogram
+
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = [channel]
+    sdr.rx_buffer_size = 2 ** 14
+    waterfall = spectrogram.from_device(sdr, 2 ** 10, n_rows, average=4)
+    try:
+        for data in sdr.rx_stream(n_buffers):
+            waterfall.update(data)
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+    del sdr
+
+    assert waterfall.n_total == n_buffers * 2 ** 14 // 2 ** 12
+    assert waterfall.rows.shape == (n_rows, 2 ** 10)
+    assert np.all(waterfall.rows > waterfall.floor), "Rows not written"
+
+
+def _block_peak(block):
+    return np.max(np.abs(block))
+
+
+def dma_rx_process_pool(uri, classname, channel, n_buffers):
+    """dma_rx_process_pool: Process captured buffers from shared memory on a
+    pool of processes and verify a result is returned for every buffer
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        n_buffers: type=int
+            Number of buffers to capture
+    """
+    from adi.parallel import process_worker
+
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = 2 ** 16
+    try:
+        with process_worker(sdr, _block_peak, max_refills=n_buffers) as worker:
+            peaks = list(worker.results())
+            dropped = worker.dropped_blocks
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+    del sdr
+
+    assert len(peaks) == n_buffers - dropped
+    assert all(p > 0 for p in peaks), "Buffer all zeros"
+
+
+def dma_arx_stream(uri, classname, channel, n_buffers):
+    """dma_arx_stream: Stream buffers with async for while reading attributes
+    from the same event loop and verify data is non-zero
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        n_buffers: type=int
+            Number of buffers to stream
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = 2 ** 14
+
+    async def stream():
+        count = 0
+        async for data in sdr.arx_stream(n_buffers, check_overflow=False):
+            data = data if isinstance(data, list) else [data]
+            for chan in data:
+                assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+            count += 1
+        return count
+
+    async def run():
+        return await asyncio.gather(stream(), sdr.aget("sample_rate"))
+
+    try:
+        count, sample_rate = asyncio.run(run())
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+    assert count == n_buffers
+    assert sample_rate > 0
+
+
+def dma_rx_record(uri, classname, channel, n_buffers, sample_rate):
+    """dma_rx_record: Record buffers to disk and verify the size of the data
+    file and the SigMF metadata written next to it. Also check that a file
+    that cannot be opened stops the capture again
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        n_buffers: type=int
+            Number of buffers to record
+        sample_rate=int
+            Value to set sample rate of device in samples per second
+    """
+    from adi.recorder import recorder
+
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = 2 ** 16
+    sdr.sample_rate = sample_rate
+    n_components = len(sdr.rx_enabled_channels) * (2 if sdr._complex_data else 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "capture.sigmf-data")
+        try:
+            # A file that cannot be opened must not leave the capture running
+            failed = recorder(sdr, os.path.join(tmp, "missing", "capture.sigmf-data"))
+            with pytest.raises(OSError):
+                failed.start()
+            assert not failed.running, "Capture left running"
+            with recorder(sdr, path, max_buffers=n_buffers) as rec:
+                rec.wait()
+        except Exception as e:
+            del sdr
+            raise Exception(e) from e
+        del sdr
+
+        data = np.fromfile(path, dtype=np.int16)
+        with open(rec.meta_path) as f:
+            meta = json.load(f)
+
+    assert rec.buffers_written + rec.dropped_blocks == n_buffers
+    assert len(data) == rec.buffers_written * 2 ** 16 * n_components
+    assert np.max(np.abs(data)) > 0, "Recording all zeros"
+    assert abs(meta["global"]["core:sample_rate"] - sample_rate) < 1
+    assert meta["global"]["core:num_channels"] == n_components // (
+        2 if meta["global"]["core:datatype"].startswith("c") else 1
+    )
+
+
+def dma_capture_worker(uri, classname, channel, n_blocks):
+    """dma_capture_worker: Capture buffers on a background thread and verify
+    blocks are non-zero and none are dropped while the consumer keeps up
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        n_blocks: type=int
+            Number of blocks to collect from the worker
+    """
+    from adi.stream import capture_worker
+
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = 2 ** 14
+    try:
+        with capture_worker(sdr, n_blocks=8) as worker:
+            for _ in range(n_blocks):
+                block = worker.get(timeout=5)
+                assert block is not None, "No block captured"
+                assert block.shape == (len(sdr.rx_enabled_channels), 2 ** 14)
+                for chan in block:
+                    assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+                worker.release()
+        latencies = worker.latency_percentiles()
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+    print(f"Refill latency percentiles (50, 90, 99): {latencies}")
+    assert worker.dropped_blocks == 0
+
+
+def dma_rx_complex_dtype(uri, classname, channel, complex_dtype):
+    """dma_rx_complex_dtype: Receive complex data with a given
+    rx_complex_dtype and verify the type and shape of the output
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        complex_dtype: type=string
+            Value to set rx_complex_dtype to
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = 2 ** 12
+    sdr.rx_complex_dtype = complex_dtype
+    try:
+        data = sdr.rx()
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+    data = data if isinstance(data, list) else [data]
+    for chan in data:
+        if complex_dtype == "iq_int16":
+            assert chan.shape == (2 ** 12, 2)
+            assert chan.dtype == np.int16
+        else:
+            assert chan.shape == (2 ** 12,)
+            assert chan.dtype == np.dtype(complex_dtype)
+        assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+
+
 def dma_tx(uri, classname, channel, use_tx2=False):
     """dma_tx: Construct TX buffers and verify no errors occur when pushed.
     Buffer is of size 2**15 and 10 buffers are pushed
@@ -117,6 +565,86 @@ def dma_tx(uri, classname, channel, use_tx2=False):
     del sdr
 
 
+def dma_tx_raw(uri, classname, channel):
+    """dma_tx_raw: Push pre-interleaved int16 buffers with tx_raw and verify
+    no errors occur. Buffer is of size 2**15 and 10 buffers are pushed
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through tx_enabled_channels
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.tx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    N = 2 ** 15
+    stride = len(sdr.tx_enabled_channels) * (2 if sdr._complex_data else 1)
+    d = np.cos(2 * np.pi * np.arange(N) / 32) * 2 ** 15 * 0.5
+    data = np.empty((N, stride), dtype=np.int16)
+    data[:] = d[:, np.newaxis]
+
+    try:
+        for _ in range(10):
+            sdr.tx_raw(data)
+        sdr.tx_raw(memoryview(data.reshape(-1)))
+    except Exception as e:
+        del sdr
+        raise Exception(e)
+
+    del sdr
+
+
+def dma_tx_file_sink(uri, classname, channel, n_buffers):
+    """dma_tx_file_sink: Send buffers to a file sink instead of hardware and
+    verify the size of the file and its SigMF metadata. The file already holds
+    one buffer, which the metadata must not count
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through tx_enabled_channels
+        n_buffers: type=int
+            Number of buffers to write
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.tx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    N = 2 ** 12
+    d = np.exp(2j * np.pi * np.arange(N) / 32) * 2 ** 14
+    d = [d] * len(sdr.tx_enabled_channels)
+    d = d[0] if len(d) == 1 else d
+    stride = len(sdr.tx_enabled_channels) * (2 if sdr._complex_data else 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.bin")
+        with open(path, "wb") as f:
+            f.write(bytes(N * stride * 2))
+        try:
+            sdr.tx_file_sink = path
+            sdr.tx_file_metadata = True
+            for _ in range(n_buffers):
+                sdr.tx(d)
+            sdr.tx_file_close()
+        except Exception as e:
+            del sdr
+            raise Exception(e)
+        del sdr
+
+        size = os.path.getsize(path)
+        with open(os.path.join(tmp, "out.sigmf-meta")) as f:
+            meta = json.load(f)
+
+    assert size == (n_buffers + 1) * N * stride * 2
+    assert meta["global"]["adi:samples"] == n_buffers * N
+    assert meta["captures"][0]["core:sample_start"] == N
+
+
 def dma_dac_zeros(uri, classname, channel):
     """dma_dac_zeros: Test DMA digital loopback with a zeros.
     This test requires a AD936x or similar device with internal loopback
@@ -328,6 +856,66 @@ def dds_loopback(
     assert tone_peaks[indx] > peak_min
 
 
+def dds_spectrum_average(
+    uri, classname, param_set, channel, frequency, scale, n_buffers, peak_min
+):
+    """dds_spectrum_average: Average the spectrum of many received buffers of
+    a DDS tone with the Welch engine of adi.spectrum. The averaged peak must
+    be within 1% of the expected frequency with a specified peak
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        param_set: type=dict
+            Dictionary of attribute and values to be set before tone is
+            generated and received
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through tx_enabled_channels
+        frequency: type=integer
+            Frequency in Hz of transmitted tone
+        scale: type=float
+            Scale of DDS tone. Range [0,1]
+        n_buffers: type=int
+            Number of buffers to average
+        peak_min: type=float
+            Minimum acceptable value of maximum peak in dBFS of received tone
+    """
+    from adi.spectrum import welch
+
+    sdr = eval(classname + "(uri='" + uri + "')")
+    for p in param_set.keys():
+        setattr(sdr, p, param_set[p])
+    sdr.rx_enabled_channels = [channel]
+    sdr.rx_buffer_size = 2 ** 14
+    if hasattr(sdr, "sample_rate"):
+        RXFS = int(sdr.sample_rate)
+    else:
+        RXFS = int(sdr.rx_sample_rate)
+    sdr.dds_single_tone(frequency, scale, channel)
+
+    try:
+        engine = welch.from_device(sdr, 2 ** 12, sample_rate=RXFS)
+        for _ in range(10):  # Wait
+            sdr.rx()
+        for data in sdr.rx_stream(n_buffers):
+            engine.update(data)
+    except Exception as e:
+        del sdr
+        raise Exception(e)
+    del sdr
+
+    indx = np.argmax(engine.dbfs)
+    diff = np.abs(engine.frequencies[indx] - frequency)
+    print("Peak: " + str(engine.dbfs[indx]) + "@" + str(engine.frequencies[indx]))
+    # Segments overlap by half and continue across buffers
+    assert engine.n_averaged == n_buffers * 2 ** 14 // 2 ** 11 - 1
+    assert (frequency * 0.01) > diff
+    assert engine.dbfs[indx] > peak_min
+
+
 def dds_two_tone(
     uri,
     classname,
@@ -1034,6 +1622,52 @@ def cyclic_buffer_exception(uri, classname, channel, param_set):
         pytest.fail(msg)
 
 
+def cyclic_buffer_cache(uri, classname, channel, param_set):
+    """cyclic_buffer_cache: Construct Cyclic TX buffers with the waveform
+    cache enabled and verify pushing the loaded waveform again is a no-op,
+    while a different waveform still requires the buffer to be destroyed
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through tx_enabled_channels
+        param_set: type=dict
+            Dictionary of attribute and values to be set before tone is
+            generated
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    # Set custom device parameters
+    for p in param_set.keys():
+        setattr(sdr, p, param_set[p])
+
+    N = 1024
+    t = np.arange(N)
+    iq = np.exp(2j * np.pi * t * 8 / N) * 2 ** 14
+    iq2 = np.exp(2j * np.pi * t * 16 / N) * 2 ** 14
+    sdr.tx_cyclic_buffer = True
+    sdr.tx_cyclic_cache_size = 2
+    sdr.tx_enabled_channels = [channel]
+    try:
+        sdr.tx(iq)
+        sdr.tx(iq)
+        sdr.tx_destroy_buffer()
+        sdr.tx(iq2)
+        sdr.tx_destroy_buffer()
+        sdr.tx(iq)
+        try:
+            sdr.tx(iq2)
+        except Exception as e:
+            assert "TX buffer has been submitted in cyclic mode" in str(e)
+        else:
+            pytest.fail("ExpectedException not raised")
+    finally:
+        del sdr
+
+
 #########################################
 
 
@@ -1108,6 +1742,40 @@ def stress_rx_buffer_length(uri, classname, channel, buffer_sizes):
     del sdr
 
 
+def stress_rx_config_switch(uri, classname, configs, repeats):
+    """stress_rx_config_switch: Repeatedly switch between buffer
+    configurations kept in the capture plan pool and verify the data of each
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        configs: type=list
+            List of (rx_enabled_channels, rx_buffer_size) tuples
+        repeats: type=int
+            Number of times to cycle through configs
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_plan_pool_size = len(configs)
+    try:
+        for _ in range(repeats):
+            for channels, size in configs:
+                sdr.rx_enabled_channels = channels
+                sdr.rx_buffer_size = size
+                data = sdr.rx()
+                data = data if isinstance(data, list) else [data]
+                assert len(data) == len(channels)
+                for chan in data:
+                    assert len(chan) == size
+                    assert np.max(np.abs(chan)) > 0
+    except Exception as e:
+        del sdr
+        raise Exception(e)
+
+    del sdr
+
+
 def stress_rx_buffer_creation(uri, classname, channel, repeats):
     """stress_rx_buffer_creation: Repeatedly create and destroy buffers
 
@@ -1302,3 +1970,85 @@ def verify_overflow(uri, classname, channel, buffer_size, sample_rate):
     del sdr
 
     assert overflow_occured, "No overflow occurred, but one was expected"
+
+
+def dma_tx_stream(uri, classname, channel, n_blocks, buffer_size, sample_rate):
+    """dma_tx_stream: Stream blocks with tx_stream and verify all blocks are
+    pushed without underflows
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through tx_enabled_channels
+        n_blocks: type=int
+            Number of blocks to stream
+        buffer_size type=int
+            Number of samples in each block
+        sample_rate=int
+            Value to set sample rate of device in samples per second
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.tx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.tx_cyclic_buffer = False
+    # Set low rate so we can keep up
+    sdr.sample_rate = sample_rate
+    d = np.exp(2j * np.pi * np.arange(buffer_size) / 32) * 2 ** 14
+    d = [d] * len(sdr.tx_enabled_channels)
+    d = d[0] if len(d) == 1 else d
+
+    try:
+        streamer = sdr.tx_stream((d for _ in range(n_blocks)), kernel_buffers=8)
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+    assert streamer.pushed_blocks == n_blocks
+    assert streamer.underflows == 0, f"{streamer.underflows} underflows occurred"
+
+
+def dma_tx_from_file(uri, classname, channel, buffer_size, n_buffers, sample_rate):
+    """dma_tx_from_file: Write a tone to a file, transmit it twice with
+    tx_from_file and verify all buffers are pushed without underflows
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through tx_enabled_channels
+        buffer_size type=int
+            Number of samples in each buffer
+        n_buffers: type=int
+            Length of the file in buffers
+        sample_rate=int
+            Value to set sample rate of device in samples per second
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.tx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.tx_cyclic_buffer = False
+    # Set low rate so we can keep up
+    sdr.sample_rate = sample_rate
+    stride = len(sdr.tx_enabled_channels) * (2 if sdr._complex_data else 1)
+    d = np.cos(2 * np.pi * np.arange(buffer_size * n_buffers) / 32) * 2 ** 14
+    data = np.repeat(d.astype(np.int16)[:, np.newaxis], stride, axis=1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tone.bin")
+        data.tofile(path)
+        try:
+            streamer = sdr.tx_from_file(path, buffer_size=buffer_size, loop=2)
+        except Exception as e:
+            del sdr
+            raise Exception(e) from e
+
+    del sdr
+    print(f"Achieved rate: {streamer.rate} samples per second")
+    assert streamer.pushed_blocks == 2 * n_buffers
+    assert streamer.underflows == 0, f"{streamer.underflows} underflows occurred"
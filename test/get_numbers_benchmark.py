@@ -0,0 +1,33 @@
+"""Micro-benchmark of adi.attribute.get_numbers against the regular
+expression parser it replaced. Run with python -m test.get_numbers_benchmark
+"""
+
+import timeit
+from test.test_attribute import get_numbers_regex
+
+from adi.attribute import get_numbers, get_numbers_array
+
+values = ["1000000000", "-89.750000", "-89.750000 dB", "[2083333 1 61440000]"]
+
+
+def main(number=200000):
+    print(f"{'value':<24}{'regex (us)':>12}{'get_numbers (us)':>18}")
+    for value in values:
+        t_regex = timeit.timeit(lambda: get_numbers_regex(value), number=number)
+        t_fast = timeit.timeit(lambda: get_numbers(value), number=number)
+        print(
+            f"{repr(value):<24}{t_regex / number * 1e6:>12.2f}"
+            f"{t_fast / number * 1e6:>18.2f}"
+        )
+
+    vector = " ".join(str(i * 0.5) for i in range(1024))
+    t_list = timeit.timeit(lambda: get_numbers(vector), number=number // 100)
+    t_array = timeit.timeit(lambda: get_numbers_array(vector), number=number // 100)
+    print(
+        f"1024 values: get_numbers {t_list / (number // 100) * 1e6:.1f} us, "
+        f"get_numbers_array {t_array / (number // 100) * 1e6:.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from __future__ import division
 
 import numpy as np
+from adi.spectrum import frequencies
 from numpy import (
     absolute,
     argmax,
@@ -13,8 +14,7 @@ from numpy import (
     multiply,
     pi,
 )
-from numpy.fft import fft, fftfreq, fftshift
-from scipy import signal
+from numpy.fft import fft, fftshift
 from scipy.signal import find_peaks
 
 
@@ -22,16 +22,12 @@ def spec_est(x, fs, ref=2 ** 15, plot=False):
 
     N = len(x)
 
-    # Apply window
-    window = signal.kaiser(N, beta=38)
-    # x = multiply(x, window)
-
     # Use FFT to get the amplitude of the spectrum
     ampl = 1 / N * absolute(fft(x))
     ampl = 20 * log10(ampl / ref + 10 ** -20)
 
-    # FFT frequency bins
-    freqs = fftfreq(N, 1 / fs)
+    # FFT frequency bins, cached per size and rate
+    freqs = frequencies(N, fs)
 
     # ampl and freqs for real data
     if not np.iscomplexobj(x):
@@ -88,6 +88,28 @@ def test_ad9081_rx_data(test_dma_rx, iio_uri, classname, channel):
     test_dma_rx(iio_uri, classname, channel)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0, [0, 1]])
+@pytest.mark.parametrize("buffer_size, total_samples", [(2 ** 16, 10 * 2 ** 16 + 100)])
+def test_ad9081_rx_burst(
+    test_dma_rx_burst, iio_uri, classname, channel, buffer_size, total_samples
+):
+    test_dma_rx_burst(iio_uri, classname, channel, buffer_size, total_samples)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [[0, 1, 2, 3]])
+@pytest.mark.parametrize("n_buffers", [100])
+def test_ad9081_rx_process_pool(
+    test_dma_rx_process_pool, iio_uri, classname, channel, n_buffers
+):
+    test_dma_rx_process_pool(iio_uri, classname, channel, n_buffers)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -226,6 +248,45 @@ def test_ad9081_dds_loopback(
     )
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize("frequency, scale", [(10000000, 0.5)])
+@pytest.mark.parametrize(
+    "param_set",
+    [
+        dict(
+            loopback_mode=0,
+            rx_main_nco_frequencies=[1000000000, 1000000000, 1000000000, 1000000000],
+            tx_main_nco_frequencies=[1000000000, 1000000000, 1000000000, 1000000000],
+            rx_channel_nco_frequencies=[0, 0, 0, 0],
+            tx_channel_nco_frequencies=[0, 0, 0, 0],
+            rx_main_nco_phases=[0, 0, 0, 0],
+            tx_main_nco_phases=[0, 0, 0, 0],
+            rx_channel_nco_phases=[0, 0, 0, 0],
+            tx_channel_nco_phases=[0, 0, 0, 0],
+        )
+    ],
+)
+@pytest.mark.parametrize("n_buffers", [200])
+@pytest.mark.parametrize("peak_min", [-30])
+def test_ad9081_spectrum_average(
+    test_dds_spectrum_average,
+    iio_uri,
+    classname,
+    param_set,
+    channel,
+    frequency,
+    scale,
+    n_buffers,
+    peak_min,
+):
+    test_dds_spectrum_average(
+        iio_uri, classname, param_set, channel, frequency, scale, n_buffers, peak_min
+    )
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware, True)
 @pytest.mark.parametrize("classname", [(classname)])
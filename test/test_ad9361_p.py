@@ -146,6 +146,34 @@ def test_ad9361_attr(
     )
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize(
+    "param_set",
+    [
+        params["one_cw_tone_manual"],
+        params["change_sampling_rate_60MSPS_slow_attack"],
+        params["one_cw_tone_slow_attack"],
+    ],
+)
+def test_ad9361_attr_batch(test_attribute_batch, iio_uri, classname, param_set):
+    test_attribute_batch(iio_uri, classname, param_set)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize(
+    "param_set",
+    [params["one_cw_tone_manual"], params["change_sampling_rate_60MSPS_slow_attack"]],
+)
+def test_ad9361_snapshot_restore(
+    test_attribute_snapshot_restore, iio_uri, classname, param_set
+):
+    test_attribute_snapshot_restore(iio_uri, classname, param_set)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware, True)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -154,6 +182,36 @@ def test_ad9361_rx_data(test_dma_rx, iio_uri, classname, channel):
     test_dma_rx(iio_uri, classname, channel)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0, [0, 1]])
+def test_ad9361_rx_into(test_dma_rx_into, iio_uri, classname, channel):
+    test_dma_rx_into(iio_uri, classname, channel)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0, [0, 1]])
+@pytest.mark.parametrize("n_blocks", [50])
+def test_ad9361_capture_worker(
+    test_dma_capture_worker, iio_uri, classname, channel, n_blocks
+):
+    test_dma_capture_worker(iio_uri, classname, channel, n_blocks)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0, [0, 1]])
+@pytest.mark.parametrize("complex_dtype", ["complex128", "complex64", "iq_int16"])
+def test_ad9361_rx_complex_dtype(
+    test_dma_rx_complex_dtype, iio_uri, classname, channel, complex_dtype
+):
+    test_dma_rx_complex_dtype(iio_uri, classname, channel, complex_dtype)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -162,6 +220,25 @@ def test_ad9361_tx_data(test_dma_tx, iio_uri, classname, channel):
     test_dma_tx(iio_uri, classname, channel)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0, [0, 1]])
+def test_ad9361_tx_raw(test_dma_tx_raw, iio_uri, classname, channel):
+    test_dma_tx_raw(iio_uri, classname, channel)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0, [0, 1]])
+@pytest.mark.parametrize("n_buffers", [20])
+def test_ad9361_tx_file_sink(
+    test_dma_tx_file_sink, iio_uri, classname, channel, n_buffers
+):
+    test_dma_tx_file_sink(iio_uri, classname, channel, n_buffers)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware, True)
 @pytest.mark.parametrize("classname", [(classname)])
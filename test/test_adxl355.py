@@ -11,6 +11,17 @@ def test_adxl355_rx_data(test_dma_rx, iio_uri, classname, channel):
     test_dma_rx(iio_uri, classname, channel, buffer_size=2 ** 5)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [[0, 1, 2]])
+@pytest.mark.parametrize("buffer_size, interval", [(2 ** 5, 0.01)])
+def test_adxl355_rx_unbuffered(
+    test_dma_rx_unbuffered, iio_uri, classname, channel, buffer_size, interval
+):
+    test_dma_rx_unbuffered(iio_uri, classname, channel, buffer_size, interval)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware)
 @pytest.mark.parametrize("classname", [(classname)])
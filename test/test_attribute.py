@@ -0,0 +1,457 @@
+"""Tests of attribute handling that run against a fake device"""
+
+import json
+import re
+
+import adi
+import numpy as np
+import pytest
+from adi.attribute import get_numbers, get_numbers_array
+
+
+def get_numbers_regex(s):
+    """Regular expression parser get_numbers must stay equivalent to"""
+    v = re.findall(r"[-+]?[.]?[\d]+(?:,\d\d\d)*[\.]?\d*(?:[eE][-+]?\d+)?", s)
+    v = [float(i) for i in v]
+    if len(v) == 1:
+        v = v[0]
+        if int(v) == v:
+            v = int(v)
+    return v
+
+
+def parse(func, s):
+    try:
+        v = func(s)
+    except Exception as e:
+        return type(e)
+    return type(v), v
+
+
+class fake_attr:
+    def __init__(self, value, read_only=False):
+        self._value = value
+        self.read_only = read_only
+        self.writes = 0
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if self.read_only:
+            raise OSError(13, "Permission denied")
+        self.writes += 1
+        self._value = value
+
+
+class fake_channel:
+    def __init__(self, id, output, attrs):
+        self.id = id
+        self.name = None
+        self.output = output
+        self.attrs = attrs
+
+
+class fake_device:
+    def __init__(self, channels, attrs=None, debug_attrs=None):
+        self.id = "iio:device0"
+        self.name = "fake-phy"
+        self.channels = channels
+        self.attrs = attrs or {}
+        self.debug_attrs = debug_attrs or {}
+        self.lookups = 0
+
+    def find_channel(self, name, output=False):
+        self.lookups += 1
+        for chan in self.channels:
+            if (name in (chan.id, chan.name)) and chan.output == output:
+                return chan
+        return None
+
+
+class fake_phy(adi.attribute.attribute):
+    def __init__(self):
+        self._ctrl = fake_device(
+            [
+                fake_channel(
+                    "voltage0",
+                    False,
+                    {
+                        "hardwaregain": fake_attr("10.000000 dB"),
+                        "rssi": fake_attr("50.00 dB", read_only=True),
+                        "raw": fake_attr("100"),
+                        "sampling_frequency_available": fake_attr(
+                            "[1 1 10]", read_only=True
+                        ),
+                    },
+                ),
+                fake_channel("voltage0", True, {"hardwaregain": fake_attr("-10")}),
+            ],
+            attrs={
+                "ensm_mode": fake_attr("fdd"),
+                "rx_path_rates": fake_attr("BBPLL:983 ADC:245", read_only=True),
+            },
+            debug_attrs={"loopback": fake_attr("0")},
+        )
+
+
+def test_restore_skips_read_only_and_volatile():
+    dev = fake_phy()
+    snapshot = dev.snapshot()
+    ctrl = dev._ctrl
+    rx, tx = ctrl.channels
+    rx.attrs["hardwaregain"]._value = "20.000000 dB"
+    tx.attrs["hardwaregain"]._value = "-20"
+    rx.attrs["rssi"]._value = "60.00 dB"
+    rx.attrs["raw"]._value = "200"
+    rx.attrs["sampling_frequency_available"]._value = "[2 1 20]"
+    ctrl.attrs["rx_path_rates"]._value = "BBPLL:900 ADC:200"
+    ctrl.debug_attrs["loopback"]._value = "1"
+
+    stats = dev.restore(snapshot)
+
+    assert stats["written"] == 2
+    assert not stats["failed"]
+    assert rx.attrs["hardwaregain"].value == "10.000000 dB"
+    assert tx.attrs["hardwaregain"].value == "-10"
+    assert rx.attrs["raw"].writes == 0
+    assert ctrl.debug_attrs["loopback"].value == "1"
+
+    stats = dev.restore(snapshot, debug=True)
+    assert stats["written"] == 1
+    assert ctrl.debug_attrs["loopback"].value == "0"
+
+
+def test_restore_allowlist():
+    dev = fake_phy()
+    snapshot = dev.snapshot()
+    rx, tx = dev._ctrl.channels
+    rx.attrs["hardwaregain"]._value = "20.000000 dB"
+    dev._ctrl.attrs["ensm_mode"]._value = "tdd"
+    rx.attrs["raw"]._value = "200"
+
+    stats = dev.restore(snapshot, attrs=["raw"])
+    assert stats["written"] == 1
+    assert rx.attrs["raw"].value == "100"
+    assert rx.attrs["hardwaregain"].value == "20.000000 dB"
+    assert dev._ctrl.attrs["ensm_mode"].value == "tdd"
+
+    rx.attrs["rssi"]._value = "60.00 dB"
+    stats = dev.restore(snapshot, attrs=["rssi"])
+    assert len(stats["failed"]) == 1
+    with pytest.raises(Exception):
+        dev.restore(snapshot, strict=True, attrs=["rssi"])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "1000000",
+        "-5",
+        "+3",
+        "2.5",
+        "-89.750000",
+        "-.5",
+        "5.",
+        "0",
+        "-0",
+        "1e5",
+        "2.5E-3",
+        "-1.5e+3",
+        " 42\n",
+        "9007199254740993",
+        "inf",
+        "-inf",
+        "nan",
+        "1_000",
+        "1,000",
+        "1e500",
+        "[1 2 3]",
+        "[-1.5 0.25 10]",
+        "0 1 2 3",
+        "-10 -20.5 1e3",
+        "12 dB",
+        "-89.750000 dB",
+        "1.5e",
+        "0x10",
+        "abc",
+        "",
+    ],
+)
+def test_get_numbers_matches_regex(value):
+    assert parse(get_numbers, value) == parse(get_numbers_regex, value)
+
+
+def test_get_numbers_random():
+    rng = np.random.default_rng(0)
+    chars = list("0123456789+-.eE _,[]xinfa \n")
+    for _ in range(20000):
+        value = "".join(rng.choice(chars, rng.integers(0, 9)))
+        assert parse(get_numbers, value) == parse(get_numbers_regex, value), value
+        expected = re.findall(
+            r"[-+]?[.]?[\d]+(?:,\d\d\d)*[\.]?\d*(?:[eE][-+]?\d+)?", value
+        )
+        try:
+            expected = [float(i) for i in expected]
+        except ValueError:
+            with pytest.raises(ValueError):
+                get_numbers_array(value)
+            continue
+        np.testing.assert_array_equal(get_numbers_array(value), expected)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("[2083333 1 61440000]", [2083333, 1, 61440000]),
+        ("-10 -20.5 1e3", [-10, -20.5, 1000]),
+        ("42", [42]),
+        ("[-1.5 .25 5. 1e-3]", [-1.5, 0.25, 5, 1e-3]),
+        ("1 2 dB", [1, 2]),
+        ("", []),
+    ],
+)
+def test_get_numbers_array(value, expected):
+    x = get_numbers_array(value)
+    assert x.dtype == np.float64
+    np.testing.assert_array_equal(x, expected)
+    assert get_numbers_array(value, np.int64).dtype == np.int64
+
+
+def test_channel_index_matches_find_channel():
+    dev = fake_phy()
+    ctrl = dev._ctrl
+    altvoltage = fake_channel("altvoltage0", True, {})
+    altvoltage.name = "TX1_I_F1"
+    ctrl.channels.append(altvoltage)
+
+    names = ["voltage0", "altvoltage0", "TX1_I_F1", "voltage9"]
+    for name in names:
+        for output in (False, True):
+            expected = ctrl.find_channel(name, output)
+            assert dev._find_channel(ctrl, name, output) is expected
+    # Input and output channels sharing a name stay apart
+    assert dev._find_channel(ctrl, "voltage0", False) is ctrl.channels[0]
+    assert dev._find_channel(ctrl, "voltage0", True) is ctrl.channels[1]
+    assert dev._device_channels(ctrl) is ctrl.channels
+
+    # Found channels are served from the index
+    lookups = ctrl.lookups
+    for name in names[:3]:
+        dev._find_channel(ctrl, name, name != "voltage0")
+    assert ctrl.lookups == lookups
+
+    # A new device object gets its own index
+    dev._ctrl = fake_phy()._ctrl
+    chan = dev._find_channel(dev._ctrl, "voltage0", True)
+    assert chan is dev._ctrl.channels[1]
+
+
+def test_attr_cache_keys_on_channel_id():
+    dev = fake_phy()
+    altvoltage = fake_channel("altvoltage0", True, {"frequency": fake_attr("1000")})
+    altvoltage.name = "TX1_I_F1"
+    dev._ctrl.channels.append(altvoltage)
+    dev.attr_cache = True
+    dev.attr_cache_ttl = 60
+
+    assert dev._get_iio_attr("TX1_I_F1", "frequency", True) == 1000
+    dev._set_iio_attr("altvoltage0", "frequency", True, 2000)
+    assert dev._get_iio_attr("TX1_I_F1", "frequency", True) == 2000
+    dev._set_iio_attr("TX1_I_F1", "frequency", True, 3000)
+    assert dev._get_iio_attr("altvoltage0", "frequency", True) == 3000
+    assert dev.attr_cache_stats["entries"] == 1
+
+
+def test_attr_cache_ttl_values():
+    dev = fake_phy()
+    dev.attr_cache_ttl = 0
+    assert dev.attr_cache_ttl == 0
+    with pytest.raises(ValueError, match="non-negative"):
+        dev.attr_cache_ttl = -1
+
+
+class logged_attr(fake_attr):
+    def __init__(self, name, value, log):
+        super().__init__(value)
+        self.name = name
+        self.log = log
+
+    @fake_attr.value.setter
+    def value(self, value):
+        self.log.append((self.name, value))
+        fake_attr.value.fset(self, value)
+
+
+def fake_ad9364(log):
+    dev = adi.ad9364.__new__(adi.ad9364)
+    dev._ctrl = fake_device(
+        [
+            fake_channel(
+                "voltage0",
+                False,
+                {"sampling_frequency": logged_attr("rate", "1000000", log)},
+            ),
+            fake_channel(
+                "out", False, {"voltage_filter_fir_en": logged_attr("fir", "1", log)}
+            ),
+            fake_channel(
+                "altvoltage0", True, {"frequency": logged_attr("lo", "1000", log)}
+            ),
+        ],
+        attrs={
+            "filter_fir_config": logged_attr("config", "", log),
+            "tx_path_rates": fake_attr(
+                "BBPLL:983040000 DAC:8000000 T2:8000000 T1:4000000 "
+                "TF:2000000 TXSAMP:2000000"
+            ),
+        },
+    )
+    return dev
+
+
+def test_batch_keeps_setter_write_order():
+    direct = []
+    fake_ad9364(direct).sample_rate = 1500000
+    assert [w[0] for w in direct] == ["rate", "fir", "config", "rate", "fir", "rate"]
+
+    log = []
+    dev = fake_ad9364(log)
+    with dev.batch():
+        dev.rx_lo = 2000
+        dev.sample_rate = 1500000
+    # The FIR setter reads tx_path_rates after its first writes, which
+    # applies the writes queued so far, sample rate ones first. All sample
+    # rate writes keep the order of the direct writes
+    assert log == direct[:3] + [("lo", "2000")] + direct[3:]
+    assert dev.batch_stats["written"] == 7
+
+
+def test_batch_orders_and_merges_whole_setters():
+    log = []
+    dev = fake_ad9364(log)
+    with dev.batch():
+        dev.rx_lo = 2000
+        dev.rx_lo = 3000
+        assert dev._get_iio_attr("out", "voltage_filter_fir_en", False) == 1
+        dev._set_iio_attr("voltage0", "sampling_frequency", False, 2000000)
+        dev._set_iio_attr("out", "voltage_filter_fir_en", False, 1)
+        assert dev.rx_lo == 3000
+    assert log == [("rate", "2000000"), ("lo", "3000")]
+    stats = dev.batch_stats
+    assert stats["requested"] == 4
+    assert stats["merged"] == 1
+    assert stats["unchanged"] == 1
+    assert stats["written"] == 2
+
+
+def test_attr_cache(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(adi.attribute.time, "monotonic", lambda: now[0])
+    dev = fake_phy()
+    rx = dev._ctrl.channels[0]
+    dev.attr_cache = True
+    dev.attr_cache_ttl = 1
+
+    assert dev._get_iio_attr("voltage0", "hardwaregain", False) == 10
+    rx.attrs["hardwaregain"]._value = "20.000000 dB"
+    assert dev._get_iio_attr("voltage0", "hardwaregain", False) == 10
+    now[0] += 1
+    assert dev._get_iio_attr("voltage0", "hardwaregain", False) == 20
+
+    # Ranges are kept until written, samples are never cached
+    available = "sampling_frequency_available"
+    assert dev._get_iio_attr("voltage0", available, False) == [1, 1, 10]
+    rx.attrs[available]._value = "[2 1 20]"
+    now[0] += 1000
+    assert dev._get_iio_attr("voltage0", available, False) == [1, 1, 10]
+    assert dev._get_iio_attr("voltage0", "raw", False) == 100
+    rx.attrs["raw"]._value = "200"
+    assert dev._get_iio_attr("voltage0", "raw", False) == 200
+
+    dev._set_iio_attr("voltage0", "hardwaregain", False, 30)
+    assert dev._get_iio_attr("voltage0", "hardwaregain", False) == 30
+    stats = dev.attr_cache_stats
+    assert stats == {"hits": 2, "misses": 6, "invalidations": 1, "entries": 2}
+
+    dev.attr_cache_ttls = {"hardwaregain": 0}
+    assert dev.attr_cache_stats["entries"] == 0
+    dev._get_iio_attr("voltage0", "hardwaregain", False)
+    assert dev.attr_cache_stats["entries"] == 0
+    dev.attr_cache = False
+    assert not dev.attr_cache
+
+
+def test_attr_cache_sees_writes_of_other_objects():
+    dev, other = fake_phy(), fake_phy()
+    other._ctrl = dev._ctrl
+    dev.attr_cache = True
+    assert dev._get_iio_attr("voltage0", "hardwaregain", False) == 10
+    other._set_iio_attr("voltage0", "hardwaregain", False, 15)
+    assert dev._get_iio_attr("voltage0", "hardwaregain", False) == 15
+
+
+def test_batch_failures():
+    dev = fake_phy()
+    ctrl = dev._ctrl
+    with pytest.raises(OSError):
+        with dev.batch():
+            dev._set_iio_attr("voltage0", "rssi", False, 1)
+            dev._set_iio_attr("voltage0", "raw", False, 5)
+    assert ctrl.channels[0].attrs["raw"].writes == 0
+
+    with dev.batch(strict=False):
+        dev._set_iio_attr("voltage0", "rssi", False, 1)
+        dev._set_iio_attr("voltage0", "raw", False, 5)
+    stats = dev.batch_stats
+    assert stats["written"] == 1
+    assert ctrl.channels[0].attrs["raw"].value == "5"
+    ((key, message),) = stats["failed"]
+    assert key[-1] == "rssi" and "Permission denied" in message
+
+    # Writes queued when the block raises are dropped
+    with pytest.raises(RuntimeError):
+        with dev.batch():
+            dev._set_iio_dev_attr_str("ensm_mode", "tdd")
+            with dev.batch():
+                assert dev._get_iio_dev_attr_str("ensm_mode") == "tdd"
+            raise RuntimeError()
+    assert ctrl.attrs["ensm_mode"].value == "fdd"
+    assert ctrl.attrs["ensm_mode"].writes == 0
+
+
+def test_batch_drops_known_values():
+    dev = fake_phy()
+    dev.attr_cache = True
+    tx = dev._ctrl.channels[1]
+    dev._get_iio_attr("voltage0", "hardwaregain", True)
+    with dev.batch():
+        dev._set_iio_attr("voltage0", "hardwaregain", True, -10.0)
+        dev._set_iio_dev_attr_str("ensm_mode", "fdd")
+    assert tx.attrs["hardwaregain"].writes == 0
+    assert dev.batch_stats["unchanged"] == 1
+    assert dev.batch_stats["written"] == 1
+
+
+class unreadable_attr:
+    @property
+    def value(self):
+        raise OSError(22, "Invalid argument")
+
+
+def test_snapshot():
+    dev = fake_phy()
+    dev._ctrl.attrs["direct_reg_access"] = fake_attr("0x0")
+    dev._ctrl.attrs["broken"] = unreadable_attr()
+    snap = dev.snapshot()
+    attrs = snap["fake-phy"]
+    assert json.loads(json.dumps(snap)) == snap
+    assert "direct_reg_access" not in attrs["attrs"]
+    assert "broken" not in attrs["attrs"]
+    with pytest.raises(OSError):
+        dev.snapshot(strict=True)
+    assert attrs["channels"]["voltage0:input"]["raw"] == "100"
+    assert attrs["channels"]["voltage0:output"] == {"hardwaregain": "-10"}
+    assert attrs["debug_attrs"] == {"loopback": "0"}
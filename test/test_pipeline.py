@@ -0,0 +1,124 @@
+"""Tests of the RX pipeline stages that run on generated samples"""
+
+import numpy as np
+import pytest
+from adi.pipeline import dc_remove, decimator, fir, nco, pipeline, stage, window_fft
+
+# Buffer lengths that are not multiples of any stage size
+splits = [100, 37, 1, 250, 64, 300]
+
+
+def buffers(x):
+    """Split the last axis of x into consecutive buffers of varying length"""
+    edges = np.cumsum(splits)[:-1]
+    return np.split(x, edges, axis=-1)
+
+
+def signal(rows=None, complex_data=False):
+    rng = np.random.default_rng(1)
+    shape = (sum(splits),) if rows is None else (rows, sum(splits))
+    x = rng.standard_normal(shape)
+    if complex_data:
+        x = x + 1j * rng.standard_normal(shape)
+    return x
+
+
+def test_stage_requires_process():
+    with pytest.raises(TypeError):
+        stage()
+
+
+@pytest.mark.parametrize("complex_data", [False, True])
+def test_fir_history_across_buffers(complex_data):
+    taps = np.hamming(15)
+    x = signal(complex_data=complex_data)
+    f = fir(taps)
+    y = np.concatenate([f(b) for b in buffers(x)])
+    np.testing.assert_allclose(y, np.convolve(x, taps)[: len(x)])
+
+    f.reset()
+    np.testing.assert_allclose(f(x[:50]), np.convolve(x[:50], taps)[:50])
+
+
+def test_fir_rows_are_channels():
+    taps = np.hamming(9)
+    x = signal(rows=3)
+    f = fir(taps)
+    y = np.concatenate([f(b) for b in buffers(x)], axis=-1)
+    for row, out in zip(x, y):
+        np.testing.assert_allclose(out, np.convolve(row, taps)[: len(row)])
+
+
+@pytest.mark.parametrize("factor", [2, 3, 8])
+def test_decimator_across_buffers(factor):
+    x = signal()
+    d = decimator(factor)
+    assert len(d.taps) == 16 * factor
+    y = np.concatenate([d(b) for b in buffers(x)])
+    np.testing.assert_allclose(y, np.convolve(x, d.taps)[: len(x)][::factor])
+
+
+def test_fir_arguments():
+    with pytest.raises(ValueError):
+        fir([])
+    with pytest.raises(ValueError):
+        fir([1, 2], decimation=0)
+
+
+def test_nco_phase_continuity():
+    fs, f0 = 1e6, 123456.7
+    x = signal(complex_data=True)
+    n = nco(f0, fs)
+    y = np.concatenate([n(b) for b in buffers(x)])
+    expected = x * np.exp(2j * np.pi * f0 / fs * np.arange(len(x)))
+    np.testing.assert_allclose(y, expected, atol=1e-9)
+
+    n.reset()
+    np.testing.assert_allclose(n(x[:10]), expected[:10], atol=1e-12)
+
+
+def test_nco_dtype():
+    y = nco(1000, 1e6, dtype=np.complex64)(np.ones(64, dtype=np.complex64))
+    assert y.dtype == np.complex64
+
+
+def test_window_fft_leftover():
+    size = 64
+    x = signal(complex_data=True)
+    w = window_fft(size, shift=False)
+    y = np.concatenate([w(b) for b in buffers(x)])
+    n_frames = len(x) // size
+    assert y.shape == (n_frames, size)
+    frames = x[: n_frames * size].reshape(n_frames, size)
+    np.testing.assert_allclose(y, np.fft.fft(frames * w.window, axis=-1))
+    # The samples after the last frame wait for the next buffer
+    assert len(w._leftover) == len(x) - n_frames * size
+
+
+def test_window_fft_full_scale_tone():
+    size = 128
+    w = window_fft(size, window="blackman")
+    tone = 0.5 * np.exp(2j * np.pi * 16 / size * np.arange(size))
+    y = np.abs(w(tone))[0]
+    assert np.argmax(y) == size // 2 + 16
+    assert y.max() == pytest.approx(0.5)
+
+
+def test_dc_remove():
+    x = signal() + 3
+    d = dc_remove(alpha=0)
+    np.testing.assert_allclose(d(x).mean(), 0, atol=1e-12)
+    with pytest.raises(ValueError):
+        dc_remove(alpha=1)
+
+
+def test_pipeline_list_input():
+    taps = np.hamming(9)
+    x = signal(rows=2, complex_data=True)
+    p = pipeline(nco(1000, 1e6), decimator(2, taps=taps))
+    out = [p(list(b)) for b in buffers(x)]
+    assert all(isinstance(o, list) and len(o) == 2 for o in out)
+    y = np.concatenate([np.stack(o) for o in out], axis=-1)
+
+    ref = pipeline(nco(1000, 1e6), decimator(2, taps=taps))
+    np.testing.assert_allclose(y, ref(x), atol=1e-9)
@@ -35,6 +35,17 @@ def test_pluto_attr(
     )
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize(
+    "attr, values, tol",
+    [("rx_lo", [1000000000, 2000000000], 8), ("sample_rate", [4000000, 10000000], 4)],
+)
+def test_pluto_attr_cache(test_attribute_cache, iio_uri, classname, attr, values, tol):
+    test_attribute_cache(iio_uri, classname, attr, values, tol)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware, True)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -43,6 +54,63 @@ def test_pluto_rx_data(test_dma_rx, iio_uri, classname, channel):
     test_dma_rx(iio_uri, classname, channel)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize("n_buffers", [100])
+@pytest.mark.parametrize("sample_rate", [2e6])
+def test_pluto_rx_stream(
+    test_dma_rx_stream, iio_uri, classname, channel, n_buffers, sample_rate
+):
+    test_dma_rx_stream(iio_uri, classname, channel, n_buffers, sample_rate)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize("n_buffers", [20])
+def test_pluto_arx_stream(test_dma_arx_stream, iio_uri, classname, channel, n_buffers):
+    test_dma_arx_stream(iio_uri, classname, channel, n_buffers)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize("n_buffers", [20])
+@pytest.mark.parametrize("decimation", [4])
+def test_pluto_rx_pipeline(
+    test_dma_rx_pipeline, iio_uri, classname, channel, n_buffers, decimation
+):
+    test_dma_rx_pipeline(iio_uri, classname, channel, n_buffers, decimation)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize("n_buffers", [100])
+@pytest.mark.parametrize("n_rows", [50])
+def test_pluto_rx_spectrogram(
+    test_dma_rx_spectrogram, iio_uri, classname, channel, n_buffers, n_rows
+):
+    test_dma_rx_spectrogram(iio_uri, classname, channel, n_buffers, n_rows)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize("n_buffers", [50])
+@pytest.mark.parametrize("sample_rate", [2e6])
+def test_pluto_rx_record(
+    test_dma_rx_record, iio_uri, classname, channel, n_buffers, sample_rate
+):
+    test_dma_rx_record(iio_uri, classname, channel, n_buffers, sample_rate)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -95,6 +163,28 @@ def test_pluto_cyclic_buffers_exception(
     test_cyclic_buffer_exception(iio_uri, classname, channel, param_set)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize(
+    "param_set",
+    [
+        dict(
+            tx_lo=1000000000,
+            rx_lo=1000000000,
+            gain_control_mode_chan0="slow_attack",
+            tx_hardwaregain_chan0=-20,
+            sample_rate=4000000,
+        )
+    ],
+)
+def test_pluto_cyclic_buffer_cache(
+    test_cyclic_buffer_cache, iio_uri, classname, channel, param_set
+):
+    test_cyclic_buffer_cache(iio_uri, classname, channel, param_set)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware, True)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -221,3 +311,37 @@ def test_pluto_verify_underflow(
     test_verify_underflow, iio_uri, classname, channel, buffer_size, sample_rate
 ):
     test_verify_underflow(iio_uri, classname, channel, buffer_size, sample_rate)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize("n_blocks", [50])
+@pytest.mark.parametrize("buffer_size", [2 ** 16])
+@pytest.mark.parametrize("sample_rate", [1e6])
+def test_pluto_tx_stream(
+    test_dma_tx_stream, iio_uri, classname, channel, n_blocks, buffer_size, sample_rate,
+):
+    test_dma_tx_stream(iio_uri, classname, channel, n_blocks, buffer_size, sample_rate)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize("buffer_size", [2 ** 16])
+@pytest.mark.parametrize("n_buffers", [20])
+@pytest.mark.parametrize("sample_rate", [1e6])
+def test_pluto_tx_from_file(
+    test_dma_tx_from_file,
+    iio_uri,
+    classname,
+    channel,
+    buffer_size,
+    n_buffers,
+    sample_rate,
+):
+    test_dma_tx_from_file(
+        iio_uri, classname, channel, buffer_size, n_buffers, sample_rate
+    )
@@ -0,0 +1,248 @@
+"""Compare the structured RX demux against the per channel libiio read path"""
+
+import ctypes
+from types import SimpleNamespace
+
+import adi
+import numpy as np
+import pytest
+
+# id, scan index, length, bits, shift, signed, big endian
+formats = [
+    ("voltage0", 0, 16, 12, 4, True, True),
+    ("voltage1", 1, 8, 8, 0, False, False),
+    ("voltage2", 2, 32, 24, 0, True, False),
+    ("voltage3", 3, 16, 14, 2, False, False),
+    ("voltage4", 4, 16, 16, 0, True, False),
+    ("voltage5", 5, 64, 48, 8, True, True),
+]
+
+
+def convert(data, offset, df):
+    """Reference conversion of one sample, as done by iio_channel_convert"""
+    length = df.length // 8
+    v = int.from_bytes(data[offset : offset + length], "big" if df.is_be else "little")
+    v >>= df.shift
+    bits = df.bits if not df.is_fully_defined else df.length
+    v &= (1 << bits) - 1
+    if df.is_signed and v & (1 << (bits - 1)):
+        v -= 1 << bits
+    return v
+
+
+class fake_channel:
+    def __init__(self, id, index, length, bits, shift, signed, be):
+        self.id = id
+        self.name = None
+        self.output = False
+        self.index = index
+        self.enabled = False
+        self.attrs = {}
+        self.data_format = SimpleNamespace(
+            length=length,
+            bits=bits,
+            shift=shift,
+            is_signed=signed,
+            is_be=be,
+            repeat=1,
+            is_fully_defined=(signed and bits == length)
+            or (not signed and bits == length - shift),
+        )
+        self.offset = None
+
+    def read(self, buf):
+        data = buf.read()
+        size = buf.device.sample_size
+        fmt = ("i" if self.data_format.is_signed else "u") + str(
+            self.data_format.length // 8
+        )
+        return np.array(
+            [
+                convert(data, start + self.offset, self.data_format)
+                for start in range(0, len(data) - size + 1, size)
+            ],
+            dtype=fmt,
+        ).tobytes()
+
+
+class fake_device:
+    def __init__(self, channels):
+        self.id = "iio:device0"
+        self.channels = channels
+        self.sample_size = 0
+
+    def update_layout(self):
+        """Place enabled channels like libiio, aligned to their own length"""
+        size = 0
+        for chan in sorted(self.channels, key=lambda c: c.index):
+            if not chan.enabled:
+                continue
+            length = chan.data_format.length // 8
+            size += -size % length
+            chan.offset = size
+            size += length
+        self.sample_size = size
+
+    def find_channel(self, name, output=False):
+        for chan in self.channels:
+            if chan.id == name and chan.output == output:
+                return chan
+        return None
+
+
+class fake_buffer:
+    def __init__(self, device, samples, cyclic=False):
+        self.device = device
+        device.update_layout()
+        rng = np.random.default_rng(samples)
+        self.data = rng.integers(
+            0, 256, samples * device.sample_size, dtype=np.uint8
+        ).tobytes()
+
+    def refill(self):
+        pass
+
+    def read(self):
+        return bytearray(self.data)
+
+
+class fake_rx(adi.rx_tx.rx):
+    _rx_channel_names = [f[0] for f in formats]
+
+    def __init__(self):
+        self._rxadc = fake_device([fake_channel(*f) for f in formats])
+        self._ctrl = self._rxadc
+        adi.rx_tx.rx.__init__(self, rx_buffer_size=257)
+
+
+@pytest.mark.parametrize(
+    "enabled", [[0, 1, 2, 3, 4, 5], [0, 2], [1, 3], [1], [2, 5], [4]]
+)
+def test_rx_demux_matches_channel_read(monkeypatch, enabled):
+    monkeypatch.setattr(adi.rx_tx.iio, "Buffer", fake_buffer)
+    dev = fake_rx()
+    dev.rx_enabled_channels = enabled
+    data = dev.rx()
+    data = data if isinstance(data, list) else [data]
+
+    plan = dev._rx__rx_plan
+    assert plan["layout"] is not None
+    reference = dev._rx__rx_buffered_channels()
+    assert len(data) == len(reference)
+    for x, ref in zip(data, reference):
+        assert x.dtype == ref.dtype
+        assert x.flags["C_CONTIGUOUS"]
+        np.testing.assert_array_equal(x, ref)
+
+    # rx_into fills the same samples from views of the buffer
+    out = [np.empty(257, dtype=x.dtype) for x in data]
+    dev.rx_into(out)
+    for x, ref in zip(out, reference):
+        np.testing.assert_array_equal(x, ref)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int32, np.int16])
+def test_rx_into_si_output(monkeypatch, dtype):
+    monkeypatch.setattr(adi.rx_tx.iio, "Buffer", fake_buffer)
+    dev = fake_rx()
+    dev._rxadc.channels[4].attrs = {"scale": None, "offset": None}
+    monkeypatch.setattr(
+        dev,
+        "_get_iio_attr",
+        lambda name, attr, output, _ctrl=None: 0.5 if attr == "scale" else 3,
+    )
+    dev.rx_enabled_channels = [4]
+    dev.rx_output_type = "SI"
+    dev.rx()
+    expected = dev._rx__rx_buffered_channels()[0] * 0.5 + 3
+    out = np.empty(257, dtype=dtype)
+    dev.rx_into(out)
+    np.testing.assert_array_equal(out, expected.astype(dtype))
+
+
+class fake_attr:
+    def __init__(self, value):
+        self.value = value
+
+
+def test_rx_si_scale_written_by_channel_object(monkeypatch):
+    monkeypatch.setattr(adi.rx_tx.iio, "Buffer", fake_buffer)
+    dev = fake_rx()
+    dev._rxadc.channels[4].attrs = {"scale": fake_attr("0.5"), "offset": fake_attr("3")}
+    dev.rx_enabled_channels = [4]
+    dev.rx_output_type = "SI"
+    raw = dev._rx__rx_buffered_channels
+    np.testing.assert_array_equal(dev.rx(), raw()[0] * 0.5 + 3)
+
+    # Precision ADCs set the scale through separate channel objects
+    chan = adi.ad7124._channel(dev._rxadc, "voltage4")
+    chan.scale = 0.25
+    np.testing.assert_array_equal(dev.rx(), raw()[0] * 0.25 + 3)
+
+
+@pytest.mark.parametrize("output_type", ["raw", "SI"])
+def test_rx_copies_buffer_memory_once(monkeypatch, output_type):
+    monkeypatch.setattr(adi.rx_tx.iio, "Buffer", fake_buffer)
+    monkeypatch.setattr(fake_buffer, "_buffer", None, raising=False)
+    memory = {}
+
+    def buffer_start(_):
+        data = memory["data"]
+        return ctypes.addressof(data)
+
+    monkeypatch.setattr(adi.rx_tx.iio, "_buffer_start", buffer_start, raising=False)
+    monkeypatch.setattr(
+        adi.rx_tx.iio,
+        "_buffer_end",
+        lambda b: buffer_start(b) + len(memory["data"]),
+        raising=False,
+    )
+    dev = fake_rx()
+    dev.rx_enabled_channels = [4]
+    dev.rx_output_type = output_type
+    dev._rx__rx_prepare_buffer()
+    memory["data"] = (ctypes.c_uint8 * len(dev._rx__rxbuf.data)).from_buffer_copy(
+        dev._rx__rxbuf.data
+    )
+    expected = dev._rx__rx_buffered_channels()[0]
+
+    data = dev.rx()
+    np.testing.assert_array_equal(data, expected)
+    # The result is not a view of the buffer memory reused by the next refill
+    ctypes.memset(memory["data"], 0, len(memory["data"]))
+    np.testing.assert_array_equal(data, expected)
+
+
+@pytest.mark.parametrize("policy", ["lru", "fifo"])
+def test_rx_plan_pool(monkeypatch, policy):
+    monkeypatch.setattr(adi.rx_tx.iio, "Buffer", fake_buffer)
+    dev = fake_rx()
+    dev.rx_plan_pool_size = 2
+    dev.rx_plan_pool_policy = policy
+
+    def plan(enabled):
+        dev.rx_enabled_channels = enabled
+        dev.rx()
+        return dev._rx__rx_plan
+
+    first, second = plan([0, 1]), plan([2])
+    assert first is not second
+    assert plan([0, 1]) is first
+    third = plan([3])
+    # lru evicts [2], used longer ago than [0, 1], fifo evicts [0, 1]
+    if policy == "lru":
+        assert plan([0, 1]) is first
+    else:
+        assert plan([2]) is second
+        assert plan([0, 1]) is not first
+
+    # A different buffer size is another configuration
+    dev.rx_buffer_size = 128
+    assert plan([3]) is not third
+    assert len(dev._rx__rx_plan_pool) == 2
+    dev.rx_plan_pool_size = 1
+    assert len(dev._rx__rx_plan_pool) == 1
+    with pytest.raises(ValueError):
+        dev.rx_plan_pool_size = 0
+    with pytest.raises(ValueError):
+        dev.rx_plan_pool_policy = "random"
@@ -0,0 +1,137 @@
+"""Tests of the streaming spectrum engines that run on generated samples"""
+
+import numpy as np
+import pytest
+from adi.spectrum import frequencies, get_window, spectrogram, welch
+
+fs = 1e6
+size = 256
+
+
+def tone(n, bin, amplitude=2 ** 15, complex_data=True):
+    t = np.arange(n)
+    if complex_data:
+        return amplitude * np.exp(2j * np.pi * bin / size * t)
+    return amplitude * np.cos(2 * np.pi * bin / size * t)
+
+
+def noise(n, complex_data=True, seed=2):
+    rng = np.random.default_rng(seed)
+    x = rng.standard_normal(n) * 1000
+    if complex_data:
+        x = x + 1j * rng.standard_normal(n) * 1000
+    return x
+
+
+@pytest.mark.parametrize("complex_data", [False, True])
+def test_welch_full_scale_tone(complex_data):
+    w = welch(size, sample_rate=fs)
+    assert w.update(tone(4096, 32, complex_data=complex_data)) > 0
+    peak = np.argmax(w.dbfs)
+    assert w.frequencies[peak] == pytest.approx(32 * fs / size)
+    assert w.dbfs[peak] == pytest.approx(0, abs=0.01)
+    assert len(w.frequencies) == (size if complex_data else size // 2 + 1)
+
+
+@pytest.mark.parametrize("overlap", [0, 0.5, 0.75])
+def test_welch_buffers_match_whole_signal(overlap):
+    x = noise(5000)
+    whole = welch(size, overlap=overlap)
+    whole.update(x)
+
+    split = welch(size, overlap=overlap)
+    for b in np.split(x, [100, 1000, 1001, 3333]):
+        split.update(b)
+    # Samples short of a segment are kept for the next buffer
+    assert split.n_averaged == whole.n_averaged
+    np.testing.assert_allclose(split.power, whole.power)
+
+
+def test_welch_channels_and_reset():
+    x = [noise(2048, seed=3), noise(2048, seed=4)]
+    w = welch(size)
+    w.update(x)
+    assert w.power.shape == (2, size)
+    single = welch(size)
+    single.update(x[1])
+    np.testing.assert_allclose(w.power[1], single.power)
+
+    w.reset()
+    assert w.power is None and w.n_averaged == 0
+    assert w.update(noise(size - 1)) == 0
+
+
+def test_welch_exponential_average():
+    a = 0.25
+    segments = [noise(size, seed=s) for s in range(4)]
+    w = welch(size, overlap=0, averaging="exponential", alpha=a)
+    w.update(np.concatenate(segments))
+
+    expected = None
+    for seg in segments:
+        one = welch(size, overlap=0)
+        one.update(seg)
+        p = one.power
+        expected = p if expected is None else (1 - a) * expected + a * p
+    np.testing.assert_allclose(w.power, expected)
+
+
+def test_welch_arguments():
+    with pytest.raises(ValueError):
+        welch(size, overlap=1)
+    with pytest.raises(ValueError):
+        welch(size, averaging="median")
+    with pytest.raises(ValueError):
+        welch(size, scaling="peak")
+
+
+def test_cached_tables_are_read_only():
+    assert get_window("hann", 16) is get_window("hann", 16)
+    with pytest.raises(ValueError):
+        get_window("hann", 16)[0] = 1
+    with pytest.raises(ValueError):
+        frequencies(16, fs)[0] = 1
+    with pytest.raises(ValueError):
+        get_window("kaiser", 16)
+
+
+def test_spectrogram_rows_wrap():
+    n_rows = 5
+    s = spectrogram(size, n_rows, sample_rate=fs)
+    assert s.rows is None
+    s.update(tone(2 * size, 10))
+    rows = s.rows
+    assert rows.shape == (n_rows, size)
+    # Rows not written yet hold the floor
+    assert np.all(rows[:3] == s.floor)
+    assert np.argmax(rows[-1]) == size // 2 + 10
+    with pytest.raises(ValueError):
+        rows[0, 0] = 0
+
+    bins = [20, 30, 40, 50, 60, 70, 80]
+    for b in bins:
+        s.update(tone(size, b))
+    assert s.n_total == 2 + len(bins)
+    peaks = np.argmax(s.rows, axis=1) - size // 2
+    np.testing.assert_array_equal(peaks, bins[-n_rows:])
+    assert s.rows.max() == pytest.approx(0, abs=0.01)
+
+
+def test_spectrogram_average_and_leftover():
+    x = noise(10 * size)
+    s = spectrogram(size, 8, average=3)
+    added = sum(s.update(b) for b in np.split(x, [300, 301, 1500]))
+    assert added == s.n_total == 3
+
+    ref = welch(size, overlap=0, full_scale=2 ** 15)
+    rows = []
+    for i in range(3):
+        ref.reset()
+        ref.update(x[i * 3 * size : (i + 1) * 3 * size])
+        rows.append(ref.dbfs)
+    np.testing.assert_allclose(s.rows[-3:], rows, atol=1e-3)
+
+
+def test_spectrogram_one_channel():
+    with pytest.raises(ValueError):
+        spectrogram(size, 4).update(np.zeros((2, size)))
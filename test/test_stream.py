@@ -0,0 +1,143 @@
+"""Tests of RX capture and recording that run against a fake device"""
+
+import os
+import threading
+
+import numpy as np
+import pytest
+from adi.recorder import recorder
+from adi.stream import capture_worker
+
+
+class fake_rx:
+    """Device filling each buffer with the number of its refill"""
+
+    _complex_data = False
+    _rx_data_type = np.int16
+    rx_channel_names = ["voltage0", "voltage1"]
+
+    def __init__(self, fail_after=None):
+        self.rx_enabled_channels = [0, 1]
+        self.rx_buffer_size = 16
+        self.refills = 0
+        self.fail_after = fail_after
+        self.gate = None
+        self.overflow = False
+
+    def __refill(self):
+        if self.gate is not None:
+            self.gate.wait()
+        if self.fail_after is not None and self.refills >= self.fail_after:
+            raise OSError(5, "Input/output error")
+        self.refills += 1
+        return self.refills - 1
+
+    def rx_into(self, out):
+        out[:] = self.__refill()
+        return out
+
+    def _rx_refill_raw(self):
+        n = len(self.rx_enabled_channels) * self.rx_buffer_size
+        return np.full(n, self.__refill(), dtype=np.int16).view(np.uint8)
+
+    def _rx_overflow_check_start(self, check_overflow):
+        return check_overflow
+
+    def _rx_dma_overflow(self):
+        return self.overflow
+
+
+def test_capture_worker_ring_overflow():
+    dev = fake_rx()
+    worker = capture_worker(dev, n_blocks=3, max_refills=7)
+    worker.start()
+    worker._thread.join()
+    # The ring holds the first blocks, later ones are dropped while it is full
+    assert not worker.running
+    assert worker.available == 3
+    assert worker.dropped_blocks == 4
+    assert worker.block_shape == (2, 16)
+    blocks = [block[0, 0] for block in worker]
+    assert blocks == [0, 1, 2]
+    assert worker.get() is None
+
+
+def test_capture_worker_get_and_release():
+    dev = fake_rx()
+    with capture_worker(dev, n_blocks=2, max_refills=5) as worker:
+        block = worker.get(timeout=5)
+        values = [int(block[1, -1])]
+        with pytest.raises(Exception, match="released"):
+            worker.get()
+        worker.release()
+        values += [int(block[1, -1]) for block in worker]
+    assert values[0] == 0
+    assert len(values) + worker.dropped_blocks == 5
+    assert values == sorted(values)
+    assert len(worker.latency_percentiles()) == 3
+
+
+def test_capture_worker_stop():
+    dev = fake_rx()
+    dev.gate = threading.Event()
+    worker = capture_worker(dev, n_blocks=4)
+    worker.start()
+    assert worker.running
+    assert worker.get(timeout=0.05) is None
+    dev.gate.set()
+    assert worker.get(timeout=5) is not None
+    worker.stop()
+    assert not worker.running
+    assert worker._thread is None
+    # Blocks completed before stopping can still be taken
+    worker.release()
+    while worker.get() is not None:
+        worker.release()
+    assert np.all(np.isnan(capture_worker(dev).latency_percentiles()))
+
+
+def test_capture_worker_error_and_overflow():
+    dev = fake_rx(fail_after=2)
+    dev.overflow = True
+    worker = capture_worker(dev, n_blocks=4, check_overflow=True)
+    worker.start()
+    worker._thread.join()
+    assert worker.overflows == 2
+    assert worker.get() is not None
+    worker.release()
+    assert worker.get() is not None
+    worker.release()
+    with pytest.raises(OSError):
+        worker.get()
+
+
+def test_recorder_running(tmp_path):
+    dev = fake_rx()
+    path = str(tmp_path / "capture.sigmf-data")
+    with recorder(dev, path, max_buffers=4, metadata=False) as rec:
+        assert rec.wait(timeout=5)
+        assert not rec.running
+    data = np.fromfile(path, dtype=np.int16).reshape(-1, 32)
+    assert rec.buffers_written + rec.dropped_blocks == 4
+    assert len(data) == rec.buffers_written
+    assert not os.path.exists(rec.meta_path)
+
+    # Capture and writer both stop when the file cannot be opened
+    failed = recorder(dev, str(tmp_path / "missing" / "capture.sigmf-data"))
+    with pytest.raises(OSError):
+        failed.start()
+    assert not failed.running
+    assert not failed._worker.running
+
+
+def test_recorder_running_until_stopped(tmp_path):
+    dev = fake_rx()
+    rec = recorder(dev, str(tmp_path / "capture.sigmf-data"), metadata=False)
+    rec.start()
+    dev.gate = threading.Event()
+    assert rec.running
+    assert not rec.wait(timeout=0.05)
+    dev.gate.set()
+    rec.stop()
+    assert not rec.running
+    assert rec.wait()
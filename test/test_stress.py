@@ -42,3 +42,15 @@ def test_ad9361_stress_rx_buffer_length(
     test_stress_rx_buffer_length, iio_uri, classname, channel, buffer_sizes
 ):
     test_stress_rx_buffer_length(iio_uri, classname, channel, buffer_sizes)
+
+
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize(
+    "configs", [[([0], 2 ** 12), ([0, 1], 2 ** 12), ([1], 2 ** 16)]]
+)
+@pytest.mark.parametrize("repeats", [50])
+def test_ad9361_stress_rx_config_switch(
+    test_stress_rx_config_switch, iio_uri, classname, configs, repeats
+):
+    test_stress_rx_config_switch(iio_uri, classname, configs, repeats)
@@ -0,0 +1,203 @@
+"""Tests of TX packing, the cyclic waveform cache and tx_streamer that run
+against a fake device
+"""
+
+import adi
+import numpy as np
+import pytest
+from adi.stream import tx_streamer
+
+
+class fake_tx_buffer:
+    def __init__(self, device, samples, cyclic=False):
+        self.device = device
+        self.samples = samples
+        self.cyclic = cyclic
+        device.buffers.append(self)
+        self.pushed = []
+        self._data = None
+
+    def write(self, data):
+        self._data = bytes(data)
+
+    def push(self):
+        self.pushed.append(self._data)
+
+
+class fake_tx_channel:
+    def __init__(self, id):
+        self.id = id
+        self.name = None
+        self.output = True
+        self.enabled = False
+        self.attrs = {}
+
+
+class fake_dac:
+    def __init__(self, names, underflow=None):
+        self.id = "iio:device1"
+        self.channels = [fake_tx_channel(n) for n in names]
+        self.buffers = []
+        self.kernel_buffers = None
+        self.underflow = underflow
+        self.reg_reads = 0
+
+    def find_channel(self, name, output=False):
+        for chan in self.channels:
+            if chan.id == name and chan.output == output:
+                return chan
+        return None
+
+    def set_kernel_buffers_count(self, count):
+        self.kernel_buffers = count
+
+    def reg_read(self, reg):
+        if self.underflow is None:
+            raise OSError(19, "No such device")
+        self.reg_reads += 1
+        return 1 if self.underflow else 0
+
+    def reg_write(self, reg, value):
+        pass
+
+
+class fake_tx(adi.rx_tx.tx):
+    _complex_data = True
+    _tx_channel_names = ["voltage0", "voltage1", "voltage2", "voltage3"]
+
+    def __init__(self, underflow=None):
+        self._txdac = fake_dac(self._tx_channel_names, underflow)
+        adi.rx_tx.tx.__init__(self)
+
+
+def blocks(n, size=64):
+    rng = np.random.default_rng(5)
+    for _ in range(n):
+        yield [
+            (rng.integers(-1000, 1000, size) + 1j * rng.integers(-1000, 1000, size))
+            for _ in range(2)
+        ]
+
+
+def test_tx_pack_wraps_or_saturates():
+    dev = fake_tx()
+    dev.tx_enabled_channels = [1]
+    x = np.array([0, 1.9, -1.9, 32767.5, 32768, -32769, 70000.7, -1e6])
+    y = x[::-1] * 1j
+    packed = dev._tx_pack(x + y)
+    assert packed.dtype == np.int16 and packed.shape == (8, 2)
+    np.testing.assert_array_equal(packed[:, 0], x.astype(int).astype(np.int16))
+    np.testing.assert_array_equal(packed[:, 1], y.imag.astype(int).astype(np.int16))
+
+    dev.tx_saturate = True
+    packed = dev._tx_pack(x + y)
+    np.testing.assert_array_equal(packed[:, 0], np.clip(x.astype(int), -32768, 32767))
+    np.testing.assert_array_equal(
+        packed[:, 1], np.clip(y.imag.astype(int), -32768, 32767)
+    )
+    # Integer input is clipped too
+    packed = dev._tx_pack(np.array([40000, -40000, 5], dtype=np.int64) * (1 + 1j))
+    np.testing.assert_array_equal(packed[:, 0], [32767, -32768, 5])
+
+
+def test_tx_pack_in_blocks():
+    dev = fake_tx()
+    dev.tx_saturate = True
+    dev._tx_convert_block = 7
+    rng = np.random.default_rng(6)
+    x = [rng.uniform(-40000, 40000, 50) * (1 - 1j) for _ in range(2)]
+    packed = dev._tx_pack(x)
+    for i, chan in enumerate(x):
+        for k, part in enumerate([chan.real, chan.imag]):
+            expected = np.clip(part.astype(int), -32768, 32767)
+            np.testing.assert_array_equal(packed[:, 2 * i + k], expected)
+    with pytest.raises(Exception, match="channel mapping"):
+        dev._tx_pack(x[:1])
+
+
+def test_tx_cyclic_cache(monkeypatch):
+    monkeypatch.setattr(adi.rx_tx.iio, "Buffer", fake_tx_buffer)
+    dev = fake_tx()
+    dev.tx_cyclic_buffer = True
+    dev.tx_cyclic_cache_size = 2
+    packs = []
+    pack = dev._tx_pack
+    monkeypatch.setattr(dev, "_tx_pack", lambda d: packs.append(1) or pack(d))
+    a, b, c = [list(w) for w in blocks(3)]
+
+    dev.tx(a)
+    # The waveform already loaded is not pushed again
+    dev.tx([np.copy(chan) for chan in a])
+    assert len(packs) == 1
+    assert len(dev._txdac.buffers[-1].pushed) == 1
+
+    for waveform in [b, a, c, a]:
+        dev.tx_destroy_buffer()
+        dev.tx(waveform)
+    # a stays cached as the most recently used waveform, b is evicted by c
+    assert len(packs) == 3
+    dev.tx_destroy_buffer()
+    dev.tx(b)
+    assert len(packs) == 4
+    expected = pack(a).tobytes()
+    assert dev._txdac.buffers[-2].pushed == [expected]
+
+    # Other settings pack the same data again
+    dev.tx_destroy_buffer()
+    dev.tx_saturate = True
+    dev.tx(b)
+    assert len(packs) == 5
+    with pytest.raises(ValueError):
+        dev.tx_cyclic_cache_size = -1
+    dev.tx_cyclic_cache_size = 0
+    dev.tx_destroy_buffer()
+    dev.tx(b)
+    dev.tx_destroy_buffer()
+    dev.tx(b)
+    assert len(packs) == 7
+
+
+@pytest.mark.parametrize("underflow", [None, False, True])
+def test_tx_streamer_pushes_in_order(monkeypatch, underflow):
+    monkeypatch.setattr(adi.rx_tx.iio, "Buffer", fake_tx_buffer)
+    dev = fake_tx(underflow)
+    with tx_streamer(dev, blocks(6), n_prefetch=2, kernel_buffers=3) as streamer:
+        assert streamer.wait(timeout=5)
+    assert not streamer.running
+    (buf,) = dev._txdac.buffers
+    assert not buf.cyclic
+    assert dev._txdac.kernel_buffers == 3
+    assert streamer.pushed_blocks == 6
+    assert streamer.pushed_samples == 6 * 64
+    expected = [dev._tx_pack(b).tobytes() for b in blocks(6)]
+    assert buf.pushed == expected
+    assert streamer.underflows == (6 if underflow else 0)
+    assert streamer.rate > 0
+
+
+def test_tx_streamer_raw_and_errors(monkeypatch):
+    monkeypatch.setattr(adi.rx_tx.iio, "Buffer", fake_tx_buffer)
+    dev = fake_tx()
+    raw = [np.full((32, 4), i, dtype=np.int16) for i in range(3)]
+    streamer = tx_streamer(dev, raw, raw=True, kernel_buffers=None)
+    streamer.start()
+    assert streamer.wait(timeout=5)
+    assert dev._txdac.kernel_buffers is None
+    assert dev._txdac.buffers[0].pushed == [r.tobytes() for r in raw]
+
+    def failing():
+        yield raw[0]
+        raise ValueError("source failed")
+
+    dev = fake_tx()
+    streamer = tx_streamer(dev, failing(), raw=True)
+    streamer.start()
+    with pytest.raises(ValueError, match="source failed"):
+        streamer.wait(timeout=5)
+
+    dev = fake_tx()
+    dev.tx_cyclic_buffer = True
+    with pytest.raises(Exception, match="tx_cyclic_buffer"):
+        tx_streamer(dev, raw).start()
+    with pytest.raises(ValueError):
+        tx_streamer(dev, raw, n_prefetch=0)